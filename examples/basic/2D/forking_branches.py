@@ -0,0 +1,59 @@
+#
+# Use CardiacModel.fork() to branch a simulation, e.g. to test several S2 timings
+# from the same S1 state. A fork shares the tissue (mesh, fibers, weights) with the
+# parent model and copies only the state arrays and the stimulation, tracker and
+# command sequences. Continue a branch with run(initialize=False).
+#
+# run_forks() runs a branch for each setup function. With processes > 1 the branches
+# run in forked worker processes that share the parent memory copy-on-write. The 2D
+# kernels are serial, so the process can be forked here. After parallel (3D) kernels
+# forking requires the workqueue threading layer of numba, selected with
+# NUMBA_THREADING_LAYER=workqueue; with another layer the branches run sequentially.
+#
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import finitewave as fw
+
+# number of nodes on the side
+n = 200
+
+tissue = fw.CardiacTissue2D([n, n])
+# create a mesh of cardiomyocytes (elems = 1):
+tissue.mesh = np.ones([n, n], dtype="uint8")
+# add empty nodes on the sides (elems = 0):
+tissue.add_boundaries()
+
+# create model object:
+aliev_panfilov = fw.AlievPanfilov2D()
+# set up numerical parameters:
+aliev_panfilov.dt    = 0.01
+aliev_panfilov.dr    = 0.25
+aliev_panfilov.t_max = 30
+
+# S1 stimulation from the left side:
+stim_sequence = fw.StimSequence()
+stim_sequence.add_stim(fw.StimVoltageCoord2D(0, 1, 0, n, 0, 5))
+
+aliev_panfilov.cardiac_tissue = tissue
+aliev_panfilov.stim_sequence  = stim_sequence
+
+# run the common S1 part once:
+aliev_panfilov.run()
+
+# each setup function adds an S2 stimulus at a different time to its branch:
+def s2_setup(t):
+    def setup(branch):
+        branch.stim_sequence.add_stim(fw.StimVoltageCoord2D(t, 1, 0, n//2, 0, n//2))
+        branch.t_max = 60
+    return setup
+
+s2_times = [32, 36, 40]
+results = aliev_panfilov.run_forks([s2_setup(t) for t in s2_times], processes=3)
+
+fig, axs = plt.subplots(ncols=len(s2_times))
+for ax, t, result in zip(axs, s2_times, results):
+    ax.imshow(result["u"])
+    ax.set_title(f"S2 at t = {t}")
+plt.show()
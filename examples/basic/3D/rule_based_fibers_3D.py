@@ -0,0 +1,64 @@
+
+#
+# Rule-based fibers for a ventricle-like mesh.
+# The left ventricle is approximated by a closed ellipsoidal shell. The fibers
+# are generated by solving transmural and apico-basal Laplace problems on the
+# mesh; the helix angle rotates from +60 degrees at the endocardium to -60
+# degrees at the epicardium.
+# The ventricle is then stimulated from the apex with the Aliev-Panfilov model.
+#
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import finitewave as fw
+
+# number of nodes on the side
+n = 100
+
+x, y, z = np.meshgrid(*[np.linspace(-1, 1, n)] * 3, indexing="ij")
+r = np.sqrt((x**2 + y**2) / 0.7**2 + z**2)
+mesh = ((r > 0.6) & (r < 0.95)).astype(float)
+
+# the base and the apex are given as masks of tissue nodes
+base = (mesh > 0) & (z > 0.7)
+apex = (mesh > 0) & (z < z[mesh > 0].min() + 0.05)
+
+fibers_generator = fw.RuleBasedAnisotropy()
+fibers_generator.alpha_endo = 60
+fibers_generator.alpha_epi = -60
+fibers = fibers_generator.generate_fibers(mesh, base, apex)
+
+tissue = fw.CardiacTissue3D(mesh.shape)
+tissue.mesh = mesh
+tissue.add_boundaries()
+tissue.fibers = fibers
+tissue.stencil = fw.AsymmetricStencil3D()
+tissue.D_al = 1
+tissue.D_ac = tissue.D_al/9
+
+# show the transmural coordinate and the fibers in the sagittal plane:
+fig, axs = plt.subplots(1, 2)
+axs[0].imshow(fibers_generator.transmural[n//2].T, origin="lower")
+axs[0].set_title("Transmural coordinate")
+axs[1].imshow(mesh[n//2].T, origin="lower", cmap="Greys", alpha=0.3)
+step = 4
+axs[1].quiver(np.arange(n)[::step], np.arange(n)[::step],
+              fibers[n//2, ::step, ::step, 1].T, fibers[n//2, ::step, ::step, 2].T)
+axs[1].set_title("Fibers")
+plt.show()
+
+aliev_panfilov = fw.AlievPanfilov3D()
+aliev_panfilov.dt = 0.01
+aliev_panfilov.dr = 0.25
+aliev_panfilov.t_max = 30
+stim_sequence = fw.StimSequence()
+stim_sequence.add_stim(fw.StimVoltageMatrix3D(0, 1, apex))
+aliev_panfilov.cardiac_tissue = tissue
+aliev_panfilov.stim_sequence = stim_sequence
+aliev_panfilov.run()
+
+mesh_builder = fw.VisMeshBuilder3D()
+grid = mesh_builder.build_mesh(tissue.mesh)
+grid = mesh_builder.add_scalar(aliev_panfilov.u, 'u')
+grid.plot(clim=[0, 1], cmap='viridis')
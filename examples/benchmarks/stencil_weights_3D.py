@@ -0,0 +1,54 @@
+
+#
+# Benchmark of the anisotropic (asymmetric) stencil weights on a 3D
+# ventricle-like geometry.
+# The left ventricle is approximated by a truncated ellipsoidal shell and the
+# fibers are set with a rule-based helix angle that rotates from +60 degrees
+# at the endocardium to -60 degrees at the epicardium.
+# The first call includes the compilation of the weights kernel.
+#
+
+import time
+import numpy as np
+
+import finitewave as fw
+
+# number of nodes on the side
+n = 200
+# helix angle at the endocardium and the epicardium
+alpha_endo, alpha_epi = np.deg2rad(60), np.deg2rad(-60)
+
+# ellipsoidal shell: long axis along z, base cut at the middle of the height
+x, y, z = np.meshgrid(np.linspace(-1, 1, n), np.linspace(-1, 1, n),
+                      np.linspace(-1, 1, n), indexing="ij")
+r = np.sqrt((x**2 + y**2) / 0.9**2 + (z - 0.5)**2 / 1.4**2)
+mesh = ((r > 0.6) & (r < 1) & (z < 0.5)).astype(np.float64)
+
+# transmural depth (0 at the endocardium, 1 at the epicardium)
+depth = np.clip((r - 0.6) / 0.4, 0, 1)
+alpha = alpha_endo + (alpha_epi - alpha_endo) * depth
+
+# circumferential and longitudinal directions
+phi = np.arctan2(y, x)
+circ = np.stack([-np.sin(phi), np.cos(phi), np.zeros_like(phi)], axis=-1)
+long = np.zeros_like(circ)
+long[..., 2] = 1
+
+fibers = (np.cos(alpha)[..., None] * circ + np.sin(alpha)[..., None] * long)
+fibers[mesh == 0] = 0
+
+tissue = fw.CardiacTissue3D(mesh.shape)
+tissue.mesh = mesh
+tissue.add_boundaries()
+tissue.fibers = fibers
+tissue.stencil = fw.AsymmetricStencil3D()
+tissue.D_al = 1
+tissue.D_ac = tissue.D_al/9
+
+print(f"Mesh: {mesh.shape}, tissue nodes: {int(mesh.sum())}")
+for i in range(3):
+    start = time.perf_counter()
+    tissue.compute_weights(dr=0.25, dt=0.01)
+    print(f"Run {i}: {time.perf_counter() - start:.2f} s")
+
+print(f"Weights: {tissue.weights.nbytes / 2**20:.0f} MB")
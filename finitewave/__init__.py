@@ -4,6 +4,8 @@ from finitewave.core import (
     FibrosisPattern,
     CardiacModel,
     StateKeeper,
+    write_snapshot,
+    read_snapshot,
     Stencil,
     StimCurrent,
     StimSequence,
@@ -11,17 +13,21 @@ from finitewave.core import (
     Stim,
     CardiacTissue,
     Tracker,
-    TrackerSequence
+    TrackerSequence,
+    AsyncWriter
 )
 
 from finitewave.cpuwave2D import (
     IncorrectWeightsModeError2D,
+    Correlated2DPattern,
     Diffuse2DPattern,
     ScarGauss2DPattern,
     ScarRect2DPattern,
     Structural2DPattern,
     diffuse_kernel_2d_iso,
     diffuse_kernel_2d_aniso,
+    diffuse_kernel_2d_iso_ext,
+    diffuse_kernel_2d_aniso_ext,
     _parallel,
     AlievPanfilov2D,
     AlievPanfilovKernels2D,
@@ -41,6 +47,7 @@ from finitewave.cpuwave2D import (
     StimVoltageMatrix2D,
     CardiacTissue2D,
     ActionPotential2DTracker,
+    APD2DTracker,
     ActivationTime2DTracker,
     Animation2DTracker,
     ECG2DTracker,
@@ -48,15 +55,22 @@ from finitewave.cpuwave2D import (
     MultiVariable2DTracker,
     Period2DTracker,
     PeriodMap2DTracker,
+    PeriodStats2DTracker,
+    Preview2DTracker,
     Spiral2DTracker,
     Variable2DTracker,
     Velocity2DTracker
 )
 from finitewave.cpuwave3D import (
+    RotationalAnisotropy,
+    RuleBasedAnisotropy,
+    Correlated3DPattern,
     Diffuse3DPattern,
     Structural3DPattern,
     diffuse_kernel_3d_iso,
     diffuse_kernel_3d_aniso,
+    diffuse_kernel_3d_iso_ext,
+    diffuse_kernel_3d_aniso_ext,
     _parallel,
     AlievPanfilov3D,
     AlievPanfilovKernels3D,
@@ -78,9 +92,11 @@ from finitewave.cpuwave3D import (
     ActionPotential3DTracker,
     ActivationTime3DTracker,
     AnimationSlice3DTracker,
+    APD3DTracker,
     ECG3DTracker,
     Period3DTracker,
     PeriodMap3DTracker,
+    PeriodStats3DTracker,
     Spiral3DTracker,
     Variable3DTracker,
     Velocity3DTracker,
@@ -90,9 +106,20 @@ from finitewave.cpuwave3D import (
 
 from finitewave.tools import (
     AnimationBuilder,
+    conduction_velocity,
     DriftVelocityCalculation,
+    TipTrajectory,
+    TipTrajectories,
     PotentialPeriodAnimationBuilder,
     VTKMeshBuilder,
     VisMeshBuilder3D,
-    Animation3DBuilder
+    VTKHDFWriter,
+    Animation3DBuilder,
+    FrameStore,
+    NpyFrames,
+    open_frames,
+    FFMpegPipe,
+    ImageFrameRenderer,
+    MeshFrameRenderer,
+    render_frames
 )
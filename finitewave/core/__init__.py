@@ -1,8 +1,8 @@
 from finitewave.core.command import Command, CommandSequence
 from finitewave.core.fibrosis import FibrosisPattern 
 from finitewave.core.model import CardiacModel
-from finitewave.core.state import StateKeeper
+from finitewave.core.state import StateKeeper, write_snapshot, read_snapshot
 from finitewave.core.stencil import Stencil
 from finitewave.core.stimulation import StimCurrent, StimSequence, StimVoltage, Stim
 from finitewave.core.tissue import CardiacTissue
-from finitewave.core.tracker import Tracker, TrackerSequence
+from finitewave.core.tracker import Tracker, TrackerSequence, AsyncWriter
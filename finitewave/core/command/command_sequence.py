@@ -1,6 +1,12 @@
+import heapq
+
+
 class CommandSequence:
     """Manages a sequence of commands to be executed during a simulation.
 
+    Pending commands are kept in a priority queue keyed by the simulation step at which they are due,
+    so each step only examines the commands that are due.
+
     Attributes
     ----------
     sequence : list
@@ -22,6 +28,12 @@ class CommandSequence:
     
     execute_next()
         Executes commands whose time has arrived and which have not been executed yet.
+
+    get_state()
+        Returns the progress of the commands.
+
+    set_state(state)
+        Restores the progress of the commands.
     """
     
     def __init__(self):
@@ -30,6 +42,7 @@ class CommandSequence:
         """
         self.sequence = []
         self.model = None
+        self._queue = []
 
     def initialize(self, model):
         """
@@ -42,8 +55,10 @@ class CommandSequence:
             The cardiac model instance to be used for command execution.
         """
         self.model = model
-        for command in self.sequence:
+        self._queue = []
+        for i, command in enumerate(self.sequence):
             command.passed = False
+            heapq.heappush(self._queue, (model.time_to_step(command.t), i))
 
     def add_command(self, command):
         """
@@ -55,18 +70,55 @@ class CommandSequence:
             The command instance to be added to the sequence.
         """
         self.sequence.append(command)
+        # the sequence is already initialized (e.g. a command added by another command)
+        if self.model is not None:
+            heapq.heappush(self._queue, (self.model.time_to_step(command.t),
+                                         len(self.sequence) - 1))
 
     def remove_commands(self):
         """
         Clears the sequence of all commands.
         """
         self.sequence = []
+        self._queue = []
 
     def execute_next(self):
         """
         Executes commands whose time has arrived and which have not been executed yet.
+
+        Commands due at the same step are executed in the order they were added. The step is read
+        before executing the commands, so a command that changes `model.step` (e.g. to interrupt
+        the simulation) does not trigger the remaining commands.
         """
-        for command in self.sequence:
-            if self.model.t >= command.t and not command.passed:
+        step = self.model.step
+        while self._queue and self._queue[0][0] <= step:
+            command = self.sequence[heapq.heappop(self._queue)[1]]
+            if not command.passed:
                 command.execute(self.model)
                 command.passed = True
+
+    def get_state(self):
+        """
+        Returns the progress of the commands.
+
+        Returns
+        -------
+        list of bool
+            The `passed` flag of each command.
+        """
+        return [bool(command.passed) for command in self.sequence]
+
+    def set_state(self, state):
+        """
+        Restores the progress of the commands saved by `get_state`.
+
+        Parameters
+        ----------
+        state : list of bool
+            The `passed` flag of each command, in the order of the sequence.
+        """
+        if len(state) != len(self.sequence):
+            raise ValueError("Saved command state does not match the command sequence")
+
+        for command, passed in zip(self.sequence, state):
+            command.passed = passed
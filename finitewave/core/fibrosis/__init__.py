@@ -1 +1,2 @@
-from finitewave.core.fibrosis.fibrosis_pattern import FibrosisPattern
\ No newline at end of file
+from finitewave.core.fibrosis.fibrosis_pattern import FibrosisPattern
+from finitewave.core.fibrosis.correlated_field import correlated_field, field_threshold
\ No newline at end of file
@@ -0,0 +1,104 @@
+import numpy as np
+from scipy.ndimage import gaussian_filter1d
+
+
+def correlated_field(shape, corr_length, rng, dtype=np.float32, chunk=32):
+    """
+    Generates a spatially correlated Gaussian random field.
+
+    White Gaussian noise is smoothed with a separable Gaussian filter, one axis at a time and in
+    place. The noise is drawn and filtered in slabs of `chunk` layers, so apart from the field itself
+    only the slab buffers of the filter are allocated (no complex-valued FFT copies).
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of the field.
+    corr_length : float or sequence of float
+        Standard deviation (in nodes) of the Gaussian filter, for all axes or for each axis. Larger
+        values give larger patches; different values per axis give elongated (e.g. interstitial)
+        patches. Zero leaves the axis uncorrelated.
+    rng : numpy.random.Generator
+        Random generator used to draw the noise.
+    dtype : numpy.dtype, optional
+        Data type of the field (``np.float32`` or ``np.float64``). Default is ``np.float32``.
+    chunk : int, optional
+        Number of layers processed at once. Default is 32.
+
+    Returns
+    -------
+    numpy.ndarray
+        The correlated field.
+    """
+    shape = tuple(int(n) for n in shape)
+    corr_length = np.broadcast_to(np.asarray(corr_length, dtype=float), (len(shape),))
+
+    field = np.empty(shape, dtype=dtype)
+    for start in range(0, shape[0], chunk):
+        rng.standard_normal(out=field[start:start + chunk], dtype=dtype)
+
+    for axis, sigma in enumerate(corr_length):
+        if sigma <= 0:
+            continue
+        # slabs are taken along an axis other than the filtered one
+        slab_axis = 1 if axis == 0 and len(shape) > 1 else 0
+        if slab_axis == axis:
+            gaussian_filter1d(field, sigma, axis=axis, output=field)
+            continue
+        for start in range(0, shape[slab_axis], chunk):
+            index = [slice(None)] * len(shape)
+            index[slab_axis] = slice(start, start + chunk)
+            slab = field[tuple(index)]
+            gaussian_filter1d(slab, sigma, axis=axis, output=slab)
+
+    return field
+
+
+def field_threshold(field, dens, mask=None, bins=4096, chunk=32):
+    """
+    Finds the threshold above which the given fraction of the field values lie.
+
+    The threshold is found from a histogram accumulated over slabs of the field, so no sorted copy of
+    the field is made. The resulting fraction matches `dens` up to the histogram resolution. The
+    bounds are exact: for ``dens >= 1`` all values and for ``dens <= 0`` no value lie above the
+    threshold.
+
+    Parameters
+    ----------
+    field : numpy.ndarray
+        The field.
+    dens : float
+        Fraction of the values that must lie above the threshold.
+    mask : numpy.ndarray, optional
+        Boolean array selecting the values taken into account. Default is None (all values).
+    bins : int, optional
+        Number of histogram bins. Default is 4096.
+    chunk : int, optional
+        Number of layers processed at once. Default is 32.
+
+    Returns
+    -------
+    float
+        The threshold (``-inf`` for ``dens >= 1``, ``inf`` for ``dens <= 0``).
+    """
+    if dens >= 1:
+        return -np.inf
+    if dens <= 0:
+        return np.inf
+
+    low, high = float(field.min()), float(field.max())
+    if high <= low:
+        return high
+
+    counts = np.zeros(bins, dtype=np.int64)
+    for start in range(0, field.shape[0], chunk):
+        values = field[start:start + chunk]
+        if mask is not None:
+            values = values[mask[start:start + chunk]]
+        counts += np.histogram(values, bins=bins, range=(low, high))[0]
+
+    # number of values at or above each bin edge (non-increasing)
+    above = np.cumsum(counts[::-1])[::-1]
+    edges = np.linspace(low, high, bins + 1)
+    index = np.searchsorted(-above, -dens * counts.sum(), side="left")
+    return float(edges[min(index, bins)])
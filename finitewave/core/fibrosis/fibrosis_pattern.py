@@ -1,4 +1,5 @@
 from abc import ABCMeta, abstractmethod
+import numpy as np
 
 class FibrosisPattern:
     """Abstract base class for generating and applying fibrosis patterns to cardiac tissue.
@@ -7,17 +8,41 @@ class FibrosisPattern:
     Subclasses must implement the `generate` method to define specific patterns. The `apply` method uses
     the generated pattern to modify the mesh of the cardiac tissue.
 
+    Random patterns draw their numbers from the pattern's own random generator, so a pattern created with
+    a seed produces the same realizations regardless of the global random state or of other patterns (e.g.
+    in parallel workers).
+
+    Attributes
+    ----------
+    rng : numpy.random.Generator
+        The random generator used by the pattern.
+
     Methods
     -------
     generate(size, mesh=None)
         Abstract method to generate a fibrosis pattern based on the given size and optionally the mesh.
     
+    generate_batch(size, count, mesh=None)
+        Generates several realizations of the fibrosis pattern at once.
+
     apply(cardiac_tissue)
         Applies the generated fibrosis pattern to the provided cardiac tissue object.
     """
 
     __metaclass__ = ABCMeta
 
+    def __init__(self, seed=None):
+        """
+        Initializes the random generator of the pattern.
+
+        Parameters
+        ----------
+        seed : int, numpy.random.Generator or None, optional
+            Seed of the random generator or a generator to use. Default is None (a fresh, unpredictable
+            seed).
+        """
+        self.rng = np.random.default_rng(seed)
+
     @abstractmethod
     def generate(self, size, mesh=None):
         """
@@ -38,12 +63,36 @@ class FibrosisPattern:
         """
         pass
 
+    def generate_batch(self, size, count, mesh=None):
+        """
+        Generates several realizations of the fibrosis pattern at once.
+
+        Parameters
+        ----------
+        size : tuple
+            The shape of the mesh (e.g., (ni, nj) or (ni, nj, nk)).
+
+        count : int
+            The number of realizations.
+
+        mesh : numpy.ndarray, optional
+            The existing mesh to base the pattern on (it is not modified). Default is None.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape (count, *size) with the realizations.
+        """
+        return np.stack([self.generate(size, None if mesh is None else mesh.copy())
+                         for _ in range(count)])
+
     def apply(self, cardiac_tissue):
         """
         Applies the generated fibrosis pattern to the specified cardiac tissue object.
 
         This method calls the `generate` method to create the pattern and then updates the `mesh` attribute
-        of the `cardiac_tissue` object with the generated pattern.
+        of the `cardiac_tissue` object with the generated pattern. The nodes changed by the pattern are
+        marked as dirty (see `CardiacTissue.mark_dirty`).
 
         Parameters
         ----------
@@ -51,4 +100,6 @@ class FibrosisPattern:
             The cardiac tissue object to which the fibrosis pattern will be applied. The `mesh` attribute
             of this object will be updated with the generated pattern.
         """
+        mesh = cardiac_tissue.mesh.copy()
         cardiac_tissue.mesh = self.generate(cardiac_tissue.mesh.shape, cardiac_tissue.mesh)
+        cardiac_tissue.mark_dirty(cardiac_tissue.mesh != mesh)
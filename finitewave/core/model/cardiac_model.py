@@ -1,9 +1,18 @@
 from abc import ABCMeta, abstractmethod
 from tqdm import tqdm
+import multiprocessing
 import numpy as np
+import warnings
 import copy
 import os
 
+from finitewave.core.model.fork_safety import fork_safe
+
+
+# branches of the simulation run by `CardiacModel.run_forks` in worker processes
+# (inherited by the forked workers, so they do not need to be pickled)
+_fork_jobs = None
+
 
 class CardiacModel:
     """
@@ -56,6 +65,15 @@ class CardiacModel:
     prog_bar : bool
         Flag to enable or disable the progress bar during simulation.
 
+    fuse_stim : bool
+        If True, current stimuli are accumulated into the external current array `i_ext`, which the
+        diffusion kernel adds to the potential during its sweep, instead of modifying `u` in a separate
+        pass on every step of the stimulation. The stimulated nodes then reach their neighbours one step
+        later than with the separate pass (a first-order splitting difference). Default is False.
+
+    i_ext : ndarray or None
+        External (stimulation) current at each node. Allocated by `initialize` if `fuse_stim` is True.
+
     state_vars : list
         List of state variables to be saved and restored.
 
@@ -81,9 +99,18 @@ class CardiacModel:
     
     run_diffuse_kernel()
         Runs the diffusion kernel computation.
+
+    time_to_step(t)
+        Converts a model time to the number of the simulation step.
     
     clone()
         Creates a deep copy of the current model instance.
+
+    fork()
+        Creates a branch of the model that shares the tissue with this model.
+
+    run_forks(setups, result=None, processes=1)
+        Runs a branch of the simulation for each setup function.
     """
 
     __metaclass__ = ABCMeta
@@ -108,6 +135,8 @@ class CardiacModel:
         self.step = 0
 
         self.prog_bar = True
+        self.fuse_stim = False
+        self.i_ext = None
         self.state_vars = []
 
     @abstractmethod
@@ -171,6 +200,7 @@ class CardiacModel:
         shape = self.cardiac_tissue.mesh.shape
         self.u = np.zeros(shape, dtype=self.npfloat)
         self.u_new = self.u.copy()
+        self.i_ext = np.zeros(shape, dtype=self.npfloat) if self.fuse_stim else None
         self.cardiac_tissue.compute_weights(self.dr, self.dt)
         self.cardiac_tissue.set_dtype(self.npfloat)
 
@@ -184,23 +214,27 @@ class CardiacModel:
         if self.command_sequence:
             self.command_sequence.initialize(self)
 
-        if self.state_keeper and self.state_keeper.record_load:
-            self.state_keeper.load(self)
-
     def run(self, initialize=True):
         """
         Runs the simulation loop. Handles stimuli, diffusion, ionic kernel updates, and tracking.
 
+        If a command changes the tissue and marks the change (see `CardiacTissue.mark_dirty`), the weights
+        of the changed region are recomputed before the next step.
+
         Parameters
         ----------
         initialize : bool, optional
             Whether to (re)initialize the model before running the simulation. Default is True.
+            The state is loaded from the state keeper (if set) after the initialization.
         """
         if initialize:
             self.initialize()
+            if self.state_keeper and self.state_keeper.record_load:
+                self.state_keeper.load(self)
 
+        pbar = None
         if self.prog_bar:
-            pbar = tqdm(total=int(np.ceil(self.t_max / self.dt)))
+            pbar = tqdm(total=int(np.ceil(self.t_max / self.dt)), initial=self.step)
 
         while self.step < np.ceil(self.t_max / self.dt):
             if self.stim_sequence:
@@ -219,22 +253,57 @@ class CardiacModel:
 
             if self.command_sequence:
                 self.command_sequence.execute_next()
+                # commands may change the tissue (e.g. ablation)
+                self.cardiac_tissue.update_weights(self.dr, self.dt)
+
+            if self.state_keeper:
+                self.state_keeper.checkpoint(self)
 
             if pbar:
                 pbar.update()
         if pbar:
             pbar.close()
 
-        if self.state_keeper and self.state_keeper.record_save:
-            self.state_keeper.save(self)
+        if self.tracker_sequence:
+            self.tracker_sequence.finalize()
+
+        if self.state_keeper:
+            self.state_keeper.finalize()
+            if self.state_keeper.record_save:
+                self.state_keeper.save(self)
 
     def run_diffuse_kernel(self):
         """
         Executes the diffusion kernel computation using the current parameters and tissue weights.
+
+        If `fuse_stim` is True, the kernel also adds the external current `i_ext`.
         """
+        if self.i_ext is not None:
+            self.diffuse_kernel(self.u_new, self.u, self.cardiac_tissue.weights,
+                                self.cardiac_tissue.mesh, self.i_ext, self.dt)
+            return
+
         self.diffuse_kernel(self.u_new, self.u, self.cardiac_tissue.weights,
                             self.cardiac_tissue.mesh)
 
+    def time_to_step(self, t):
+        """
+        Converts a model time to the number of the simulation step.
+
+        Parameters
+        ----------
+        t : float
+            Model time.
+
+        Returns
+        -------
+        int
+            The first step at which the model time is reached, so that events scheduled with it never occur
+            before their time.
+        """
+        # the tolerance absorbs the rounding error of the division (e.g. 0.7 / 0.01 = 70.00000000000001)
+        return int(np.ceil(t / self.dt - 1e-6))
+
     def clone(self):
         """
         Creates a deep copy of the current model instance.
@@ -245,3 +314,115 @@ class CardiacModel:
             A deep copy of the current CardiacModel instance.
         """
         return copy.deepcopy(self)
+
+    def fork(self):
+        """
+        Creates a branch of the model that shares the tissue with this model.
+
+        Unlike `clone`, the cardiac tissue (mesh, fibers, weights) and the stencil are not copied: they are
+        shared between the model and its forks and must not be modified by the branches. The arrays of the
+        model (state variables) and the stimulation, tracker, command sequences and state keeper are
+        copied, so each branch continues the simulation independently with ``run(initialize=False)``.
+
+        Returns
+        -------
+        CardiacModel
+            The forked model.
+        """
+        forked = copy.copy(self)
+        memo = {id(self): forked}
+        for shared in (self.cardiac_tissue, self.stencil):
+            if shared is not None:
+                memo[id(shared)] = shared
+
+        for name, value in self.__dict__.items():
+            if isinstance(value, np.ndarray):
+                memo[id(value)] = value.copy()
+                setattr(forked, name, memo[id(value)])
+
+        for name in ("stim_sequence", "tracker_sequence", "command_sequence", "state_keeper",
+                     "state_vars"):
+            setattr(forked, name, copy.deepcopy(getattr(self, name), memo))
+
+        # current stimuli injected into the external current array keep a view of it
+        if forked.stim_sequence and forked.i_ext is not None:
+            for stim in forked.stim_sequence.sequence:
+                if getattr(stim, "_i_ext", None) is not None:
+                    stim._i_ext = forked.i_ext.reshape(-1)
+
+        return forked
+
+    def run_forks(self, setups, result=None, processes=1):
+        """
+        Runs a branch of the simulation for each setup function.
+
+        Each branch is a `fork` of the model. The setup function modifies the branch (e.g. adds an S2
+        stimulus or changes `t_max`), then the branch continues with ``run(initialize=False)`` and
+        ``result(branch)`` is returned.
+
+        With ``processes > 1`` the branches run in a pool of worker processes created with the ``fork``
+        start method, so the workers inherit the memory of the model copy-on-write and only the results
+        are sent back (they must be picklable). If the process cannot be forked safely (the ``fork``
+        start method is not available on the platform, or a parallel kernel has started a numba threading
+        layer other than workqueue, see `fork_safe`), the branches run sequentially with a warning. Set
+        ``NUMBA_THREADING_LAYER=workqueue`` to fork after parallel (3D) kernels.
+
+        Parameters
+        ----------
+        setups : list of callable
+            Functions ``setup(branch)`` that prepare each branch.
+        result : callable, optional
+            Function ``result(branch)`` that returns the result of a branch. Default returns a dictionary
+            with the state variables of the branch.
+        processes : int, optional
+            Number of worker processes. Default is 1 (the branches run in this process).
+
+        Returns
+        -------
+        list
+            The results of the branches, in the order of `setups`.
+        """
+        global _fork_jobs
+
+        if result is None:
+            result = _state_variables
+
+        if processes > 1 and not fork_safe():
+            warnings.warn("The process cannot be forked safely, the branches run sequentially",
+                          RuntimeWarning)
+            processes = 1
+
+        if processes <= 1:
+            return [self._run_branch(setup, result) for setup in setups]
+
+        _fork_jobs = (self, setups, result)
+        try:
+            with multiprocessing.get_context("fork").Pool(processes) as pool:
+                results = pool.map(_run_fork_index, range(len(setups)))
+        finally:
+            _fork_jobs = None
+        return results
+
+    def _run_branch(self, setup, result):
+        """
+        Forks the model, prepares the branch with `setup` and runs it.
+        """
+        branch = self.fork()
+        setup(branch)
+        branch.run(initialize=False)
+        return result(branch)
+
+
+def _state_variables(model):
+    """
+    Returns the state variables of a model.
+    """
+    return {var: model.__dict__[var] for var in model.state_vars}
+
+
+def _run_fork_index(index):
+    """
+    Runs the branch with the given index in a worker process.
+    """
+    model, setups, result = _fork_jobs
+    return model._run_branch(setups[index], result)
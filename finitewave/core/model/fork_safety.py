@@ -0,0 +1,30 @@
+import multiprocessing
+
+import numba
+
+
+def fork_safe():
+    """
+    Checks whether worker processes can be created with the ``fork`` start method.
+
+    The TBB and OpenMP threading layers of numba cannot be used in a process forked after they have
+    started (TBB makes the parent hang at exit, GNU OpenMP aborts the child), while the workqueue
+    layer is fork-safe. Forking is therefore safe if the platform supports it and no parallel kernel
+    has started a threading layer other than workqueue in this process. To use worker processes after
+    parallel (3D) kernels have run, select the workqueue layer before the first parallel kernel, e.g.
+    with the environment variable ``NUMBA_THREADING_LAYER=workqueue``.
+
+    Returns
+    -------
+    bool
+        True if the process can be forked.
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return False
+
+    try:
+        layer = numba.threading_layer()
+    except ValueError:
+        # no parallel kernel has run yet
+        return True
+    return layer == "workqueue"
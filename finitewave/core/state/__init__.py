@@ -1 +1,2 @@
-from finitewave.core.state.state_keeper import StateKeeper
\ No newline at end of file
+from finitewave.core.state.state_keeper import StateKeeper
+from finitewave.core.state.snapshot import write_snapshot, read_snapshot
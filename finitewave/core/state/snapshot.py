@@ -0,0 +1,106 @@
+import json
+import os
+import numpy as np
+
+_MAGIC = b"FWSNAP01"
+_ALIGN = 64
+
+
+def _aligned(offset):
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def write_snapshot(path, arrays, info=None):
+    """
+    Writes arrays and metadata into a single snapshot file.
+
+    The file starts with a magic string and the length of a JSON header that
+    describes the arrays (dtype, shape and byte offset) and holds the
+    metadata. The raw array data follows the header, each array aligned to
+    64 bytes, so that the arrays can be memory-mapped when the snapshot is
+    read. Contiguous arrays are written without intermediate copies.
+
+    The snapshot is written to a temporary file first and renamed, so an
+    existing snapshot at `path` is replaced atomically.
+
+    Parameters
+    ----------
+    path : str
+        Path to the snapshot file.
+    arrays : dict
+        Dictionary of named NumPy arrays.
+    info : dict, optional
+        JSON-serializable metadata stored in the header.
+    """
+    arrays = {name: np.asarray(arr) for name, arr in arrays.items()}
+    entries = {name: {"dtype": arr.dtype.str, "shape": list(arr.shape)}
+               for name, arr in arrays.items()}
+    header = {"info": info or {}, "arrays": entries}
+
+    # offsets depend on the header size, so the header is sized with
+    # placeholder offsets first and padded to a fixed length
+    for entry in entries.values():
+        entry["offset"] = 0
+    header_size = _aligned(len(json.dumps(header)) + 32 * (len(arrays) + 1))
+
+    offset = _aligned(len(_MAGIC) + 8 + header_size)
+    for name, arr in arrays.items():
+        entries[name]["offset"] = offset
+        offset = _aligned(offset + arr.nbytes)
+
+    header_bytes = json.dumps(header).encode()
+    header_bytes += b" " * (header_size - len(header_bytes))
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(_MAGIC)
+        file.write(np.uint64(header_size).tobytes())
+        file.write(header_bytes)
+        for name, arr in arrays.items():
+            file.seek(entries[name]["offset"])
+            file.write(memoryview(np.ascontiguousarray(arr)).cast("B"))
+        file.truncate(offset)
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path, mode="r"):
+    """
+    Opens a snapshot file written by `write_snapshot`.
+
+    The arrays are returned as memory maps of the file, so no data is read
+    until the arrays are accessed.
+
+    Parameters
+    ----------
+    path : str
+        Path to the snapshot file.
+    mode : str, optional
+        Memory map mode (``"r"`` read-only, ``"c"`` copy-on-write).
+        Default is ``"r"``.
+
+    Returns
+    -------
+    info : dict
+        Metadata stored in the header.
+    arrays : dict
+        Dictionary of named memory-mapped arrays.
+    """
+    with open(path, "rb") as file:
+        if file.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f"{path} is not a finitewave snapshot")
+        header_size = int(np.frombuffer(file.read(8), dtype=np.uint64)[0])
+        header = json.loads(file.read(header_size).decode())
+
+    file_size = os.path.getsize(path)
+    arrays = {}
+    for name, entry in header["arrays"].items():
+        shape = tuple(entry["shape"])
+        dtype = np.dtype(entry["dtype"])
+        if entry["offset"] + int(np.prod(shape)) * dtype.itemsize > file_size:
+            raise ValueError(f"{path} is truncated")
+        if int(np.prod(shape)) == 0:
+            arrays[name] = np.empty(shape, dtype=dtype)
+            continue
+        arrays[name] = np.memmap(path, dtype=dtype, mode=mode,
+                                 offset=entry["offset"], shape=shape)
+    return header["info"], arrays
@@ -1,12 +1,32 @@
+from concurrent.futures import ThreadPoolExecutor
+import glob
 import os
+import time
 import numpy as np
 
+from finitewave.core.state.snapshot import write_snapshot, read_snapshot
+
+
 class StateKeeper:
     """Handles saving and loading the state of a simulation model.
 
     This class provides functionality to save and load the state of a simulation model, including
-    all relevant variables specified in the model's `state_vars` attribute. It handles file operations
-    for saving to and loading from numpy `.npy` files.
+    all relevant variables specified in the model's `state_vars` attribute.
+
+    By default the state is written as a single snapshot file (see `write_snapshot`) that holds all state
+    variables together with the model time, step and the progress of the stimulation and command sequences.
+    The snapshot is memory-mapped when it is loaded and copied into the arrays the model has already
+    allocated, so restarting a large model costs little more than reading the file. The legacy format with
+    one numpy `.npy` file per variable is still supported.
+
+    During long simulations the keeper can also write periodic checkpoints (every `checkpoint_interval` steps
+    and/or every `checkpoint_wall_time` seconds) to `record_checkpoint`. A checkpoint is a snapshot that also
+    holds the tracker buffers. The state is copied at the end of a step and written by a background thread,
+    so the simulation continues while the file is written; only the newest `max_checkpoints` files are kept.
+    The tracker buffers are stored as named arrays (``trackers/<index>/<name>``) described in the snapshot
+    header, so loading a checkpoint does not unpickle any data.
+    Setting `record_load` to the checkpoint directory with `resume` enabled continues the simulation from
+    the newest valid checkpoint.
 
     Attributes
     ----------
@@ -16,17 +36,60 @@ class StateKeeper:
     record_load : str
         Directory path from where the simulation state will be loaded.
 
+    file_format : str
+        Format used to save the state: ``"snapshot"`` (default) for a single snapshot file or ``"npy"`` for
+        one `.npy` file per variable. Loading detects the format automatically.
+
+    file_name : str
+        Name of the snapshot file in the state directory. Default is ``"state.fws"``.
+
+    resume : bool
+        If True, loading also restores the model time, step and the progress of the stimulation and command
+        sequences (and the tracker buffers stored in checkpoints), so that the simulation continues where the
+        saved one stopped (requires a snapshot). Otherwise only the state variables are loaded and the
+        simulation starts at t = 0. Default is False.
+
+    record_checkpoint : str
+        Directory path where the checkpoints are written. Default is "" (no checkpoints).
+
+    checkpoint_interval : int
+        Number of simulation steps between checkpoints. Default is 0 (not used).
+
+    checkpoint_wall_time : float
+        Wall-clock time (s) between checkpoints. Default is 0 (not used).
+
+    max_checkpoints : int
+        Number of most recent checkpoints kept in `record_checkpoint`. Default is 3.
+
     Methods
     -------
     save(model)
         Saves the state of the provided model to the specified directory.
-    
+
     load(model)
         Loads the state from the specified directory and sets the state variables in the provided model.
-    
+
+    snapshot_info(model)
+        Returns the model time and the sequences progress stored in a snapshot.
+
+    checkpoint(model)
+        Writes a checkpoint if one is due. Called by the model at the end of every step.
+
+    save_checkpoint(model)
+        Writes a checkpoint of the model in the background.
+
+    finalize()
+        Waits for the pending checkpoint to be written and stops the checkpoint writer.
+
+    list_checkpoints(path)
+        Lists the checkpoints in a directory, oldest first.
+
+    find_checkpoint(path)
+        Returns the newest checkpoint in a directory that can be read.
+
     _save_variable(var_path, var)
         Helper method to save a variable to a numpy `.npy` file.
-    
+
     _load_variable(var_path)
         Helper method to load a variable from a numpy `.npy` file.
     """
@@ -37,13 +100,25 @@ class StateKeeper:
         """
         self.record_save = ""
         self.record_load = ""
+        self.file_format = "snapshot"
+        self.file_name = "state.fws"
+        self.resume = False
+
+        self.record_checkpoint = ""
+        self.checkpoint_interval = 0
+        self.checkpoint_wall_time = 0.
+        self.max_checkpoints = 3
+
+        self._executor = None
+        self._pending = None
+        self._last_time = None
 
     def save(self, model):
         """
         Saves the state of the given model to the specified `record_save` directory.
 
-        This method creates the necessary directories if they do not exist and saves each variable
-        listed in the model's `state_vars` attribute as a numpy `.npy` file.
+        This method creates the necessary directories if they do not exist and saves the variables
+        listed in the model's `state_vars` attribute.
 
         Parameters
         ----------
@@ -53,16 +128,23 @@ class StateKeeper:
         """
         if not os.path.exists(self.record_save):
             os.makedirs(self.record_save)
-        for var in model.state_vars:
-            self._save_variable(os.path.join(self.record_save, var + ".npy"),
-                                model.__dict__[var])
+
+        if self.file_format == "npy":
+            for var in model.state_vars:
+                self._save_variable(os.path.join(self.record_save, var + ".npy"),
+                                    model.__dict__[var])
+            return
+
+        write_snapshot(os.path.join(self.record_save, self.file_name),
+                       {var: model.__dict__[var] for var in model.state_vars},
+                       self.snapshot_info(model))
 
     def load(self, model):
         """
         Loads the state from the specified `record_load` directory and sets it in the given model.
 
-        This method loads each variable listed in the model's `state_vars` attribute from numpy `.npy`
-        files and sets these variables in the model.
+        State variables that the model has already allocated with the same shape and dtype are filled in
+        place; other variables are set as new arrays.
 
         Parameters
         ----------
@@ -70,9 +152,208 @@ class StateKeeper:
             The model object to which the state is to be loaded. The model must have a `state_vars` attribute
             which will be updated with the loaded variables.
         """
+        path = self.record_load
+        if os.path.isdir(path):
+            state_path = os.path.join(path, self.file_name)
+            if os.path.isfile(state_path):
+                path = state_path
+            else:
+                path = self.find_checkpoint(path) or state_path
+
+        if not os.path.isfile(path):
+            if self.resume:
+                raise FileNotFoundError(f"No snapshot found in {self.record_load} to resume from")
+            for var in model.state_vars:
+                self._set_variable(model, var, self._load_variable(os.path.join(
+                    self.record_load, var + ".npy")))
+            return
+
+        info, arrays = read_snapshot(path)
         for var in model.state_vars:
-            setattr(model, var, self._load_variable(os.path.join(
-                        self.record_load, var + ".npy")))
+            self._set_variable(model, var, arrays[var])
+
+        if self.resume:
+            self._restore_info(model, info)
+            if model.tracker_sequence and "trackers" in info:
+                model.tracker_sequence.set_state([_unpack_state(tracker_state, arrays)
+                                                  for tracker_state in info["trackers"]])
+
+    def snapshot_info(self, model):
+        """
+        Returns the model time and the sequences progress stored in a snapshot.
+
+        Parameters
+        ----------
+        model : CardiacModel
+            The simulation model.
+
+        Returns
+        -------
+        dict
+            JSON-serializable dictionary with the model time, step, time step and the state of the
+            stimulation and command sequences.
+        """
+        info = {"t": float(model.t), "step": int(model.step), "dt": float(model.dt)}
+        if model.stim_sequence:
+            info["stim_sequence"] = model.stim_sequence.get_state()
+        if model.command_sequence:
+            info["command_sequence"] = model.command_sequence.get_state()
+        return info
+
+    def checkpoint(self, model):
+        """
+        Writes a checkpoint if one is due.
+
+        Called by the model at the end of every step (after the step counter has been advanced). Step based
+        checkpoints are written at the multiples of `checkpoint_interval`; the wall time is measured from the
+        first call or the last checkpoint.
+
+        Parameters
+        ----------
+        model : CardiacModel
+            The simulation model.
+        """
+        if not self.record_checkpoint or not (self.checkpoint_interval or self.checkpoint_wall_time):
+            return
+
+        if self._last_time is None:
+            self._last_time = time.monotonic()
+
+        due = self.checkpoint_interval and model.step % self.checkpoint_interval == 0
+        due = due or (self.checkpoint_wall_time
+                      and time.monotonic() - self._last_time >= self.checkpoint_wall_time)
+        if due:
+            self.save_checkpoint(model)
+
+    def save_checkpoint(self, model):
+        """
+        Writes a checkpoint of the model in the background.
+
+        The state variables and the tracker buffers are copied before the method returns; the copy is
+        written to ``checkpoint_<step>.fws`` by a background thread, after which the oldest checkpoints
+        beyond `max_checkpoints` are removed. If the previous checkpoint is still being written, the method
+        waits for it first.
+
+        Parameters
+        ----------
+        model : CardiacModel
+            The simulation model.
+        """
+        self._wait()
+
+        arrays = {var: np.array(model.__dict__[var]) for var in model.state_vars}
+        info = self.snapshot_info(model)
+        if model.tracker_sequence:
+            info["trackers"] = [_pack_state(tracker_state, f"trackers/{i}", arrays)
+                                for i, tracker_state in enumerate(model.tracker_sequence.get_state())]
+
+        path = os.path.join(self.record_checkpoint, f"checkpoint_{model.step:012d}.fws")
+        os.makedirs(self.record_checkpoint, exist_ok=True)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = self._executor.submit(self._write_checkpoint, path, arrays, info)
+        self._last_time = time.monotonic()
+
+    def _write_checkpoint(self, path, arrays, info):
+        """
+        Writes the checkpoint and removes the oldest ones.
+        """
+        write_snapshot(path, arrays, info)
+        checkpoints = self.list_checkpoints(self.record_checkpoint)
+        for old in checkpoints[:max(len(checkpoints) - self.max_checkpoints, 0)]:
+            os.remove(old)
+
+    def _wait(self):
+        """
+        Waits for the pending checkpoint and raises the error of the background writer, if it failed.
+        """
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            pending.result()
+
+    def finalize(self):
+        """
+        Waits for the pending checkpoint to be written and stops the checkpoint writer.
+
+        Called by the model at the end of the simulation.
+        """
+        try:
+            self._wait()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+            self._last_time = None
+
+    @staticmethod
+    def list_checkpoints(path):
+        """
+        Lists the checkpoints in a directory, oldest first.
+
+        Parameters
+        ----------
+        path : str
+            Directory with the checkpoints.
+
+        Returns
+        -------
+        list of str
+            Paths to the checkpoint files sorted by step.
+        """
+        return sorted(glob.glob(os.path.join(path, "checkpoint_*.fws")))
+
+    @classmethod
+    def find_checkpoint(cls, path):
+        """
+        Returns the newest checkpoint in a directory that can be read.
+
+        Parameters
+        ----------
+        path : str
+            Directory with the checkpoints.
+
+        Returns
+        -------
+        str or None
+            Path to the newest valid checkpoint or None if there is none.
+        """
+        for checkpoint in reversed(cls.list_checkpoints(path)):
+            try:
+                read_snapshot(checkpoint)
+            except (OSError, ValueError):
+                continue
+            return checkpoint
+        return None
+
+    def _restore_info(self, model, info):
+        """
+        Restores the model time and the sequences progress saved by `snapshot_info`.
+        """
+        if not np.isclose(info["dt"], model.dt):
+            raise ValueError(f"Snapshot time step {info['dt']} does not match the model time step {model.dt}")
+
+        model.t = info["t"]
+        model.step = info["step"]
+        if model.stim_sequence and "stim_sequence" in info:
+            model.stim_sequence.set_state(info["stim_sequence"])
+        if model.command_sequence and "command_sequence" in info:
+            model.command_sequence.set_state(info["command_sequence"])
+        if model.tracker_sequence:
+            model.tracker_sequence.schedule()
+
+    @staticmethod
+    def _set_variable(model, var, value):
+        """
+        Copies the value into the model variable if it is allocated with the same shape and dtype,
+        otherwise sets a new array.
+        """
+        current = model.__dict__.get(var)
+        if (isinstance(current, np.ndarray) and current.shape == value.shape
+                and current.dtype == value.dtype):
+            np.copyto(current, value)
+        else:
+            setattr(model, var, np.array(value))
 
     def _save_variable(self, var_path, var):
         """
@@ -103,3 +384,46 @@ class StateKeeper:
             The variable loaded from the file.
         """
         return np.load(var_path)
+
+
+def _pack_state(value, name, arrays):
+    """
+    Stores the arrays of a tracker state in `arrays` under names starting with `name` and returns a
+    JSON-serializable description of the state, which refers to the arrays by name.
+
+    Arrays are stored as they are, scalars and strings are kept in the description, and lists, tuples and
+    dictionaries (with string keys) are described item by item.
+    """
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            raise TypeError(f"Tracker state {name} is an array of objects")
+        arrays[name] = value
+        return {"array": name}
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return {"value": value}
+    if isinstance(value, (list, tuple)):
+        kind = "list" if isinstance(value, list) else "tuple"
+        return {kind: [_pack_state(item, f"{name}/{i}", arrays) for i, item in enumerate(value)]}
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise TypeError(f"Tracker state {name} has keys that are not strings")
+        return {"dict": {key: _pack_state(item, f"{name}/{key}", arrays) for key, item in value.items()}}
+    raise TypeError(f"Tracker state {name} of type {type(value).__name__} can not be stored in a checkpoint")
+
+
+def _unpack_state(description, arrays):
+    """
+    Rebuilds a tracker state from its description returned by `_pack_state` and the arrays of the snapshot.
+    The arrays are copied from the snapshot.
+    """
+    if "array" in description:
+        return np.array(arrays[description["array"]])
+    if "value" in description:
+        return description["value"]
+    if "list" in description:
+        return [_unpack_state(item, arrays) for item in description["list"]]
+    if "tuple" in description:
+        return tuple(_unpack_state(item, arrays) for item in description["tuple"])
+    return {key: _unpack_state(item, arrays) for key, item in description["dict"].items()}
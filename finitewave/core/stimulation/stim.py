@@ -12,6 +12,9 @@ class Stim:
     passed : bool
         A flag indicating whether the stimulation has been applied.
 
+    _index : ndarray or None
+        Flat indices of the stimulated nodes, computed by `node_index` (used internally).
+
     Methods
     -------
     stimulate(model)
@@ -22,6 +25,15 @@ class Stim:
 
     done()
         Marks the stimulation as completed. This method should be implemented by subclasses.
+
+    release(model)
+        Releases what the stimulation holds in the model after it has passed.
+
+    compute_index(mesh)
+        Computes the flat indices of the stimulated nodes of a mesh.
+
+    node_index(model)
+        Returns the flat indices of the stimulated nodes, recomputed after a change of the tissue.
     """
 
     def __init__(self, time):
@@ -35,6 +47,8 @@ class Stim:
         """
         self.t = time
         self.passed = False
+        self._index = None
+        self._index_version = None
 
     def stimulate(self, model):
         """
@@ -73,3 +87,61 @@ class Stim:
         the stimulation state is updated after application.
         """
         pass
+
+    def release(self, model):
+        """
+        Releases what the stimulation holds in the model after it has passed.
+
+        Called by the `StimSequence` on the step after the stimulation has passed.
+
+        Parameters
+        ----------
+        model : CardiacModel
+            The simulation model to which the stimulation was applied.
+        """
+        pass
+
+    def compute_index(self, mesh):
+        """
+        Computes the flat indices of the stimulated nodes of a mesh.
+
+        Parameters
+        ----------
+        mesh : numpy.ndarray
+            The tissue mesh.
+
+        Returns
+        -------
+        numpy.ndarray or None
+            Flat (C-order) indices of the stimulated nodes.
+
+        Notes
+        -----
+        This is an abstract method that should be implemented by subclasses that stimulate
+        a set of nodes.
+        """
+        return None
+
+    def node_index(self, model):
+        """
+        Returns the flat indices of the stimulated nodes.
+
+        The indices are computed with `compute_index` on the first call and recomputed whenever the
+        tissue has been changed since (see `CardiacTissue.mark_dirty`), e.g. by an ablation command,
+        so that the stimulation never reaches nodes removed from the tissue.
+
+        Parameters
+        ----------
+        model : CardiacModel
+            The simulation model to which the stimulation is applied.
+
+        Returns
+        -------
+        numpy.ndarray
+            Flat (C-order) indices of the stimulated nodes.
+        """
+        tissue = model.cardiac_tissue
+        if self._index is None or self._index_version != tissue.version:
+            self._index = self.compute_index(tissue.mesh)
+            self._index_version = tissue.version
+        return self._index
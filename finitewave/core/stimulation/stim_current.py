@@ -1,4 +1,5 @@
 from finitewave.core.stimulation.stim import Stim
+from finitewave.core.stimulation.stim_kernels import add_current, flat_view
 
 class StimCurrent(Stim):
     """A stimulation class that applies a current value to the cardiac model.
@@ -21,6 +22,13 @@ class StimCurrent(Stim):
     _dt : float
         Time step of the simulation (used internally).
 
+    _i_ext : ndarray or None
+        Flat view of the model external current array while the stimulation is injected into it
+        (used internally, see `CardiacModel.fuse_stim`).
+
+    _i_ext_index : ndarray or None
+        Flat indices of the nodes at which the current is injected into `_i_ext` (used internally).
+
     Methods
     -------
     ready(model)
@@ -29,6 +37,12 @@ class StimCurrent(Stim):
     done()
         Updates the stimulation status based on the elapsed time and marks the stimulation as completed
         if the current time has elapsed.
+
+    apply_current(model)
+        Applies the current to the stimulated nodes.
+
+    release(model)
+        Removes the current from the model external current array.
     """
 
     def __init__(self, time, curr_value, curr_time):
@@ -52,6 +66,8 @@ class StimCurrent(Stim):
 
         self._acc_time = curr_time
         self._dt = 0
+        self._i_ext = None
+        self._i_ext_index = None
 
     def ready(self, model):
         """
@@ -59,7 +75,7 @@ class StimCurrent(Stim):
 
         This method initializes the accumulated time with the current duration and sets the time step
         of the simulation. The `passed` flag is set to `False` indicating that the stimulation has not
-        yet been applied.
+        yet been applied, and the stimulated nodes computed for a previous run are discarded.
 
         Parameters
         ----------
@@ -69,6 +85,32 @@ class StimCurrent(Stim):
         self._acc_time = self.curr_time
         self._dt = model.dt
         self.passed = False
+        self._index = None
+        self._i_ext = None
+        self._i_ext_index = None
+
+    def apply_current(self, model):
+        """
+        Applies the current to the stimulated nodes (see `node_index`).
+
+        By default the potential is increased by ``dt * curr_value``. If the model fuses the stimulation
+        into the diffusion kernel (`model.i_ext` is allocated), the current is added once to the external
+        current array and stays there until the stimulation is released (it is moved if the stimulated
+        nodes change in the meantime).
+
+        Parameters
+        ----------
+        model : CardiacModel
+            The simulation model to which the current stimulation is applied.
+        """
+        index = self.node_index(model)
+        if model.i_ext is None:
+            add_current(flat_view(model.u), index, self._dt * self.curr_value)
+        elif self._i_ext is None or self._i_ext_index is not index:
+            self.release(model)
+            self._i_ext = flat_view(model.i_ext)
+            self._i_ext_index = index
+            add_current(self._i_ext, index, self.curr_value)
 
     def done(self):
         """
@@ -82,3 +124,17 @@ class StimCurrent(Stim):
             self._acc_time -= self._dt
         else:
             self.passed = True
+
+    def release(self, model):
+        """
+        Removes the current from the model external current array, if it was injected.
+
+        Parameters
+        ----------
+        model : CardiacModel
+            The simulation model to which the current stimulation was applied.
+        """
+        if self._i_ext is not None:
+            add_current(self._i_ext, self._i_ext_index, -self.curr_value)
+            self._i_ext = None
+            self._i_ext_index = None
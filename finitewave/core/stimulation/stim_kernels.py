@@ -0,0 +1,104 @@
+import numpy as np
+from numba import njit
+
+
+def roi_index(mesh, roi):
+    """
+    Returns the flat indices of the tissue nodes inside a rectangular region.
+
+    Parameters
+    ----------
+    mesh : numpy.ndarray
+        The tissue mesh. Only nodes with a value of 1 are selected.
+    roi : tuple of slice
+        The region of interest (one slice per mesh axis).
+
+    Returns
+    -------
+    numpy.ndarray
+        Flat (C-order) indices of the selected nodes.
+    """
+    mask = np.zeros(mesh.shape, dtype=bool)
+    mask[roi] = mesh[roi] == 1
+    return np.flatnonzero(mask)
+
+
+def matrix_index(mesh, matrix):
+    """
+    Returns the flat indices of the tissue nodes selected by a matrix.
+
+    Parameters
+    ----------
+    mesh : numpy.ndarray
+        The tissue mesh. Only nodes with a value of 1 are selected.
+    matrix : numpy.ndarray
+        Array with the mesh shape. Nodes with values greater than 0 are selected.
+
+    Returns
+    -------
+    numpy.ndarray
+        Flat (C-order) indices of the selected nodes.
+    """
+    return np.flatnonzero((np.asarray(matrix) > 0) & (mesh == 1))
+
+
+def flat_view(a):
+    """
+    Returns a flat view of an array, so that the stimulation kernels modify the array itself.
+
+    Parameters
+    ----------
+    a : numpy.ndarray
+        The array (e.g. the potential of the model).
+
+    Returns
+    -------
+    numpy.ndarray
+        Flat (C-order) view of the array.
+
+    Raises
+    ------
+    ValueError
+        If the array is not C-contiguous, so that flattening it would return a copy.
+    """
+    flat = a.ravel()
+    # a copy is a new buffer, so checking the memory bounds is enough
+    if not np.may_share_memory(flat, a):
+        raise ValueError("The stimulated array must be C-contiguous")
+    return flat
+
+
+@njit(nogil=True)
+def add_current(u, index, value):
+    """
+    Adds a value to the nodes of a flattened potential array.
+
+    Parameters
+    ----------
+    u : numpy.ndarray
+        Flat view of the potential array.
+    index : numpy.ndarray
+        Flat indices of the stimulated nodes.
+    value : float
+        Value added to each node (current times the time step).
+    """
+    for n in range(index.shape[0]):
+        u[index[n]] += value
+
+
+@njit(nogil=True)
+def set_voltage(u, index, value):
+    """
+    Sets the nodes of a flattened potential array to a value.
+
+    Parameters
+    ----------
+    u : numpy.ndarray
+        Flat view of the potential array.
+    index : numpy.ndarray
+        Flat indices of the stimulated nodes.
+    value : float
+        Voltage assigned to each node.
+    """
+    for n in range(index.shape[0]):
+        u[index[n]] = value
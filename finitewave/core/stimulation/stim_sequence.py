@@ -1,3 +1,6 @@
+import heapq
+
+
 class StimSequence:
     """A sequence of stimuli to be applied to the cardiac model.
 
@@ -5,6 +8,11 @@ class StimSequence:
     simulation time. It handles the initialization of stimuli, adding and removing stimuli,
     and applying the next set of stimuli in the sequence.
 
+    Pending stimuli are kept in a priority queue keyed by the simulation step at which they start,
+    so each step only examines the stimuli that are due. Stimuli that last several steps (current
+    stimuli) stay in an active set until they are done. Stimuli due at the same step are applied in
+    the order they were added.
+
     Attributes
     ----------
     sequence : list
@@ -26,6 +34,12 @@ class StimSequence:
 
     stimulate_next()
         Applies the next set of stimuli based on the current time in the model.
+
+    get_state()
+        Returns the progress of the stimuli.
+
+    set_state(state)
+        Restores the progress of the stimuli.
     """
 
     def __init__(self):
@@ -34,6 +48,8 @@ class StimSequence:
         """
         self.sequence = []
         self.model = None
+        self._queue = []
+        self._active = []
 
     def initialize(self, model):
         """
@@ -48,8 +64,18 @@ class StimSequence:
             The simulation model that will be used to prepare the stimuli.
         """
         self.model = model
-        for stim in self.sequence:
-            stim.ready(model)
+        self._queue = []
+        self._active = []
+        for i, stim in enumerate(self.sequence):
+            self._schedule(i)
+
+    def _schedule(self, i):
+        """
+        Prepares the i-th stimulus and queues it at its starting step.
+        """
+        stim = self.sequence[i]
+        stim.ready(self.model)
+        heapq.heappush(self._queue, (self.model.time_to_step(stim.t), i))
 
     def add_stim(self, stim):
         """
@@ -61,6 +87,9 @@ class StimSequence:
             The `Stim` object to be added to the sequence.
         """
         self.sequence.append(stim)
+        # the sequence is already initialized (e.g. a stimulus added by a command during the run)
+        if self.model is not None:
+            self._schedule(len(self.sequence) - 1)
 
     def remove_stim(self):
         """
@@ -68,17 +97,70 @@ class StimSequence:
 
         This method clears the sequence, effectively removing all stimuli that were previously added.
         """
+        if self.model is not None:
+            for i in self._active:
+                self.sequence[i].release(self.model)
+
         self.sequence = []
+        self._queue = []
+        self._active = []
 
     def stimulate_next(self):
         """
         Applies the next set of stimuli based on the current time in the model.
 
-        This method checks each stimulus in the sequence to determine if it should be applied based
-        on the current simulation time. If a stimulus is due to be applied and has not yet been
-        marked as passed, it is stimulated and then marked as done.
+        This method releases the stimuli that passed at the previous step and moves the stimuli that
+        are due at the current step from the queue to the active set. Each active stimulus that has not
+        yet been marked as passed is stimulated and then marked as done.
         """
-        for stim in self.sequence:
-            if self.model.t >= stim.t and not stim.passed:
+        step = self.model.step
+        if self._active:
+            for i in self._active:
+                if self.sequence[i].passed:
+                    self.sequence[i].release(self.model)
+            self._active = [i for i in self._active if not self.sequence[i].passed]
+
+        if self._queue and self._queue[0][0] <= step:
+            while self._queue and self._queue[0][0] <= step:
+                self._active.append(heapq.heappop(self._queue)[1])
+            self._active.sort()
+
+        for i in self._active:
+            stim = self.sequence[i]
+            if not stim.passed:
                 stim.stimulate(self.model)
                 stim.done()
+
+    def get_state(self):
+        """
+        Returns the progress of the stimuli.
+
+        Returns
+        -------
+        list of dict
+            For each stimulus, the `passed` flag and the remaining duration of current stimuli.
+        """
+        state = []
+        for stim in self.sequence:
+            stim_state = {"passed": bool(stim.passed)}
+            if hasattr(stim, "_acc_time"):
+                stim_state["acc_time"] = float(stim._acc_time)
+            state.append(stim_state)
+        return state
+
+    def set_state(self, state):
+        """
+        Restores the progress of the stimuli saved by `get_state`.
+
+        Parameters
+        ----------
+        state : list of dict
+            Progress of the stimuli, in the order of the sequence.
+        """
+        if len(state) != len(self.sequence):
+            raise ValueError("Saved stimulation state does not match the stimulation sequence")
+
+        for stim, stim_state in zip(self.sequence, state):
+            stim.passed = stim_state["passed"]
+            if "acc_time" in stim_state:
+                stim._acc_time = stim_state["acc_time"]
@@ -40,7 +40,8 @@ class StimVoltage(Stim):
         """
         Prepares the stimulation for application.
 
-        This method sets the `passed` flag to `False`, indicating that the stimulation has not yet been applied.
+        This method sets the `passed` flag to `False`, indicating that the stimulation has not yet been applied,
+        and discards the stimulated nodes computed for a previous run.
 
         Parameters
         ----------
@@ -48,6 +49,7 @@ class StimVoltage(Stim):
             The simulation model to which the voltage stimulation will be applied.
         """
         self.passed = False
+        self._index = None
 
     def done(self):
         """
@@ -39,6 +39,17 @@ class CardiacTissue:
     meta : dict
         A dictionary to store additional metadata about the tissue.
 
+    version : int
+        Number of changes marked with `mark_dirty`.
+
+    The tissue keeps the bounding box of the nodes changed since the weights were computed (see
+    `mark_dirty`). Applying a fibrosis pattern and `clean` mark the changed nodes automatically; changes made
+    directly to `mesh`, `conductivity` or `fibers` (e.g. an ablation command) must be marked by the caller.
+    `update_weights` then recomputes the weights only in the changed region, which is much cheaper than
+    `compute_weights` for a small region of a large tissue. The model updates the weights after the commands
+    of each step. Every marked change also increments `version`, so objects that keep data derived from the
+    mesh (e.g. the stimulated nodes of a stimulus) can detect that it has to be recomputed.
+
     Methods
     -------
     add_boundaries()
@@ -50,6 +61,12 @@ class CardiacTissue:
     add_pattern(fibro_pattern)
         Applies a fibrosis pattern to the tissue mesh.
 
+    mark_dirty(region=None)
+        Marks a region of the tissue as changed.
+
+    update_weights(dr, dt)
+        Recomputes the weights in the changed region of the tissue.
+
     clean()
         Removes all fibrosis points from the mesh, setting them to `1` (healthy tissue).
 
@@ -75,6 +92,8 @@ class CardiacTissue:
         self.boundary = np.array([], dtype="int16")
         self.shape = []
         self.meta = dict()
+        self._dirty = None
+        self.version = 0
 
     @abstractmethod
     def add_boundaries(self):
@@ -105,7 +124,94 @@ class CardiacTissue:
         """
         Removes all fibrosis points from the mesh, setting them to `1` (healthy tissue).
         """
-        self.mesh[self.mesh == 2] = 1
+        fibrosis = self.mesh == 2
+        self.mesh[fibrosis] = 1
+        self.mark_dirty(fibrosis)
+
+    def mark_dirty(self, region=None):
+        """
+        Marks a region of the tissue as changed, so that `update_weights` recomputes the weights there.
+
+        The changed regions are accumulated into a single bounding box until the weights are updated.
+
+        Parameters
+        ----------
+        region : tuple of slice or numpy.ndarray, optional
+            The changed region: a tuple of slices (one per axis, as used to index the mesh) or a boolean
+            array with the shape of the mesh. Default is None (the whole tissue).
+        """
+        shape = self.mesh.shape
+        if region is None:
+            box = [(0, n) for n in shape]
+        elif isinstance(region, np.ndarray) and region.dtype == bool:
+            if not region.any():
+                return
+            box = []
+            for axis in range(region.ndim):
+                other = tuple(i for i in range(region.ndim) if i != axis)
+                nodes = np.flatnonzero(region.any(axis=other))
+                box.append((nodes[0], nodes[-1] + 1))
+        else:
+            if not isinstance(region, tuple):
+                region = (region,)
+            region = region + (slice(None),) * (len(shape) - len(region))
+            box = []
+            for s, n in zip(region, shape):
+                if not isinstance(s, slice):
+                    s = slice(s, s + 1 if s != -1 else None)
+                start, stop, _ = s.indices(n)
+                if stop <= start:
+                    return
+                box.append((start, stop))
+
+        if self._dirty is not None:
+            box = [(min(a[0], b[0]), max(a[1], b[1])) for a, b in zip(self._dirty, box)]
+        self._dirty = box
+        self.version += 1
+
+    def update_weights(self, dr, dt):
+        """
+        Recomputes the weights in the region marked by `mark_dirty`.
+
+        The weights of a node depend on the mesh, conductivity and fibers of its neighbours, so the weights
+        are recomputed in the bounding box of the changed nodes extended by one node. The stencil is applied
+        to a block of the tissue with one more node on each side, and only the inner part of the result is
+        written to `weights`. If the weights have not been computed yet, they are computed for the whole
+        tissue.
+
+        Parameters
+        ----------
+        dr : float
+            Spatial resolution.
+        dt : float
+            Temporal resolution.
+        """
+        if self._dirty is None:
+            return
+
+        shape = self.mesh.shape
+        if self.weights.shape[:len(shape)] != shape:
+            self.compute_weights(dr, dt)
+            return
+
+        update = tuple(slice(max(start - 1, 0), min(stop + 1, n))
+                       for (start, stop), n in zip(self._dirty, shape))
+        block = tuple(slice(max(s.start - 1, 0), min(s.stop + 1, n))
+                      for s, n in zip(update, shape))
+        inner = tuple(slice(u.start - b.start, u.stop - b.start)
+                      for u, b in zip(update, block))
+
+        conductivity = self.conductivity
+        if np.ndim(conductivity) >= len(shape):
+            conductivity = conductivity[block]
+        fibers = self.fibers
+        if fibers is not None and np.ndim(fibers) >= len(shape):
+            fibers = fibers[block]
+
+        weights = self.stencil.get_weights(self.mesh[block], conductivity, fibers,
+                                           self.D_al, self.D_ac, dt, dr)
+        self.weights[update] = weights[inner]
+        self._dirty = None
 
     def clone(self):
         """
@@ -1,2 +1,3 @@
 from finitewave.core.tracker.tracker import Tracker
-from finitewave.core.tracker.tracker_sequence import TrackerSequence
\ No newline at end of file
+from finitewave.core.tracker.tracker_sequence import TrackerSequence
+from finitewave.core.tracker.async_writer import AsyncWriter
@@ -0,0 +1,180 @@
+import queue
+import threading
+import time
+import numpy as np
+
+
+class AsyncWriter:
+    """Background writer thread for tracker output.
+
+    Trackers hand frames to the writer instead of writing them to disk inside the simulation loop. Each frame
+    is copied into one of a ring of preallocated buffers and a write task is queued for the background thread,
+    so the simulation continues while the previous frames are being written. When all buffers are in flight the
+    tracker blocks until the writer releases one (backpressure), which bounds the memory used by pending frames.
+
+    The model kernels release the GIL, so disk I/O in the writer thread overlaps with computation.
+
+    Attributes
+    ----------
+    queue_size : int
+        Number of frames that may be pending (size of the buffer ring).
+    name : str
+        Name used in the statistics report.
+    n_frames : int
+        Number of submitted frames.
+    blocked_time : float
+        Total time (s) the simulation was blocked waiting for a free buffer.
+    write_time : float
+        Total time (s) the writer thread spent writing frames.
+    max_depth : int
+        Maximum number of pending frames observed.
+
+    Methods
+    -------
+    submit(write_func, frame, *args)
+        Copies the frame into a free buffer and queues `write_func(buffer, *args)`.
+    close()
+        Waits for the pending frames to be written and stops the writer thread.
+    stats()
+        Returns the queue statistics.
+    report()
+        Returns the queue statistics as a formatted string.
+    """
+
+    def __init__(self, queue_size=4, name=""):
+        """
+        Initializes the AsyncWriter and starts the writer thread.
+
+        Parameters
+        ----------
+        queue_size : int, optional
+            Number of frames that may be pending. Default is 4.
+        name : str, optional
+            Name used in the statistics report.
+        """
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+
+        self.queue_size = queue_size
+        self.name = name
+
+        self.n_frames = 0
+        self.blocked_time = 0.
+        self.write_time = 0.
+        self.max_depth = 0
+
+        self._buffers = []
+        self._free = queue.Queue()
+        self._tasks = queue.Queue()
+        self._error = None
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _allocate(self, frame):
+        """
+        Preallocates the ring of buffers matching the first submitted frame.
+        """
+        self._buffers = [np.empty_like(frame) for _ in range(self.queue_size)]
+        for i in range(self.queue_size):
+            self._free.put(i)
+
+    def submit(self, write_func, frame, *args):
+        """
+        Copies the frame into a free buffer and queues the write task.
+
+        Blocks while all buffers are pending.
+
+        Parameters
+        ----------
+        write_func : callable
+            Function called in the writer thread as ``write_func(frame, *args)``.
+        frame : np.ndarray
+            Frame to write. The frame is copied, so the caller may modify it after the call.
+        *args
+            Additional arguments passed to `write_func`.
+        """
+        self._raise_error()
+
+        frame = np.asarray(frame)
+        if not self._buffers:
+            self._allocate(frame)
+
+        start = time.perf_counter()
+        i = self._free.get()
+        self.blocked_time += time.perf_counter() - start
+
+        buffer = self._buffers[i]
+        if buffer.shape == frame.shape and buffer.dtype == frame.dtype:
+            np.copyto(buffer, frame)
+        else:
+            buffer = frame.copy()
+
+        self._tasks.put((i, write_func, buffer, args))
+        self.n_frames += 1
+        self.max_depth = max(self.max_depth, self.queue_size - self._free.qsize())
+
+    def _run(self):
+        """
+        Writes the queued frames until the stop signal is received.
+        """
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                break
+
+            i, write_func, buffer, args = task
+            start = time.perf_counter()
+            try:
+                if self._error is None:
+                    write_func(buffer, *args)
+            except Exception as error:
+                self._error = error
+            self.write_time += time.perf_counter() - start
+            self._free.put(i)
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(f"Writer {self.name} failed") from error
+
+    def close(self):
+        """
+        Waits for the pending frames to be written and stops the writer thread.
+        """
+        if self._thread.is_alive():
+            self._tasks.put(None)
+            self._thread.join()
+        self._raise_error()
+
+    def stats(self):
+        """
+        Returns the queue statistics.
+
+        Returns
+        -------
+        dict
+            Dictionary with the number of frames, the time the simulation was blocked, the time spent writing
+            and the maximum queue depth.
+        """
+        return {
+            "n_frames": self.n_frames,
+            "blocked_time": self.blocked_time,
+            "write_time": self.write_time,
+            "max_depth": self.max_depth,
+            "queue_size": self.queue_size,
+        }
+
+    def report(self):
+        """
+        Returns the queue statistics as a formatted string.
+
+        Returns
+        -------
+        str
+            Statistics report.
+        """
+        return (f"{self.name}: {self.n_frames} frames, "
+                f"write {self.write_time:.2f} s, "
+                f"blocked {self.blocked_time:.2f} s, "
+                f"max queue depth {self.max_depth}/{self.queue_size}")
@@ -1,6 +1,8 @@
 from abc import ABCMeta, abstractmethod
 import copy
 
+from finitewave.core.tracker.async_writer import AsyncWriter
+
 
 class Tracker:
     """Base class for trackers used in simulations.
@@ -20,6 +22,33 @@ class Tracker:
     path : str
         The directory path where the tracked data will be saved. Default is the current directory.
 
+    async_write : bool
+        If True, trackers that write frames during the simulation hand them to a background writer thread
+        (see AsyncWriter) instead of writing them synchronously. Default is False.
+
+    queue_size : int
+        Number of frames that may be pending in the background writer. Default is 4.
+
+    writer_stats : dict or None
+        Queue statistics of the last background writer (see `AsyncWriter.stats`), set when the writer is
+        closed. Default is None.
+
+    start_step : int
+        The first simulation step at which the tracker is invoked. Default is 0.
+
+    stop_step : int or None
+        The step from which the tracker is no longer invoked (exclusive). Default is None (never stops).
+
+    interval : int
+        Number of simulation steps between invocations. Default is 1 (every step). Trackers configured in
+        model time units convert their settings to `start_step` and `interval` in `initialize`.
+
+    state_vars : list
+        Names of the attributes that hold the tracked data and progress of the tracker (e.g. buffers and
+        frame counters), saved in checkpoints by `get_state` and restored by `set_state`. The attributes hold
+        arrays, scalars, strings or lists, tuples and dictionaries (with string keys) of them, which the
+        checkpoints store as named arrays without pickling. Default is empty.
+
     Methods
     -------
     initialize(model)
@@ -28,11 +57,23 @@ class Tracker:
     track()
         Abstract method to be implemented by subclasses for tracking and recording data during the simulation.
 
+    next_step(step)
+        Returns the first step after `step` at which the tracker is due.
+
     clone()
         Creates a deep copy of the current tracker instance.
 
     write()
         Abstract method to be implemented by subclasses for writing the tracked data to a file.
+
+    finalize()
+        Called once at the end of the simulation to release resources (e.g. close open files).
+
+    get_state()
+        Returns the tracker buffers to be stored in a checkpoint.
+
+    set_state(state)
+        Restores the tracker buffers from a checkpoint.
     """
 
     __metaclass__ = ABCMeta
@@ -44,6 +85,16 @@ class Tracker:
         self.model = None
         self.file_name = ""
         self.path = "."
+        self.async_write = False
+        self.queue_size = 4
+        self.writer_stats = None
+        self._writer = None
+
+        self.start_step = 0
+        self.stop_step = None
+        self.interval = 1
+
+        self.state_vars = []
 
     @abstractmethod
     def initialize(self, model):
@@ -64,6 +115,30 @@ class Tracker:
         """
         pass
 
+    def next_step(self, step=-1):
+        """
+        Returns the first step after `step` at which the tracker is due.
+
+        Parameters
+        ----------
+        step : int, optional
+            The current step. Default is -1, which gives the first due step.
+
+        Returns
+        -------
+        int or None
+            The next due step, or None if the tracker is not invoked anymore.
+        """
+        interval = max(1, int(self.interval))
+        if step < self.start_step:
+            due = self.start_step
+        else:
+            due = self.start_step + ((step - self.start_step) // interval + 1) * interval
+
+        if self.stop_step is not None and due >= self.stop_step:
+            return None
+        return due
+
     def clone(self):
         """
         Creates a deep copy of the current tracker instance.
@@ -81,3 +156,70 @@ class Tracker:
         Abstract method to be implemented by subclasses for writing the tracked data to a file.
         """
         pass
+
+    def finalize(self):
+        """
+        Called once at the end of the simulation. Trackers that keep files or other resources open during
+        the run release them here. Does nothing by default.
+        """
+        pass
+
+    def get_state(self):
+        """
+        Returns the tracker buffers to be stored in a checkpoint.
+
+        The state holds a copy of each attribute listed in `state_vars`, so it is not changed by the rest
+        of the run.
+
+        Returns
+        -------
+        dict
+            Dictionary with the copied attributes.
+        """
+        return {name: copy.deepcopy(getattr(self, name)) for name in self.state_vars}
+
+    def set_state(self, state):
+        """
+        Restores the tracker buffers saved by `get_state`.
+
+        Only the attributes listed in `state_vars` are restored; the configuration of the tracker is kept.
+        Trackers that write frames restore their frame counter, so the following frames are appended to the
+        files of the saved run.
+
+        Parameters
+        ----------
+        state : dict
+            Dictionary with the copied attributes.
+        """
+        missing = set(self.state_vars) - set(state)
+        if missing:
+            raise ValueError(f"Saved tracker state misses {sorted(missing)}")
+
+        for name in self.state_vars:
+            setattr(self, name, copy.deepcopy(state[name]))
+
+    def _start_writer(self):
+        """
+        Starts the background writer if `async_write` is enabled.
+        """
+        self._close_writer()
+        if self.async_write:
+            self._writer = AsyncWriter(self.queue_size, name=type(self).__name__)
+
+    def _submit(self, write_func, frame, *args):
+        """
+        Writes the frame with `write_func(frame, *args)`, in the background writer if it is running.
+        """
+        if self._writer is None:
+            write_func(frame, *args)
+        else:
+            self._writer.submit(write_func, frame, *args)
+
+    def _close_writer(self):
+        """
+        Waits for the background writer to finish and stores its queue statistics in `writer_stats`.
+        """
+        if self._writer is not None:
+            writer, self._writer = self._writer, None
+            writer.close()
+            self.writer_stats = writer.stats()
@@ -1,3 +1,6 @@
+import heapq
+
+
 class TrackerSequence:
     """Manages a sequence of trackers for a simulation.
 
@@ -5,11 +8,15 @@ class TrackerSequence:
     to initialize trackers, add or remove trackers from the sequence, and iterate over the trackers to perform
     their tracking functions.
 
+    The sequence keeps an integer-step schedule of the trackers (a heap of the next due step of each tracker,
+    see `Tracker.start_step`, `Tracker.stop_step` and `Tracker.interval`). At each step only the trackers that
+    are due are invoked, in the order they were added.
+
     Attributes
     ----------
     sequence : list of Tracker
         List containing the trackers in the sequence. The trackers are executed in the order they are added.
-    
+
     model : CardiacModel or None
         The simulation model to which the trackers are attached. It is set during initialization.
 
@@ -18,6 +25,9 @@ class TrackerSequence:
     initialize(model)
         Initializes all trackers in the sequence with the provided simulation model.
 
+    schedule()
+        Builds the schedule of the trackers from the current model step.
+
     add_tracker(tracker)
         Adds a new tracker to the end of the sequence.
 
@@ -25,7 +35,16 @@ class TrackerSequence:
         Removes all trackers from the sequence.
 
     tracker_next()
-        Executes the `track` method of each tracker in the sequence.
+        Executes the `track` method of each tracker that is due at the current step.
+
+    finalize()
+        Executes the `finalize` method of each tracker in the sequence.
+
+    get_state()
+        Returns the state of each tracker in the sequence.
+
+    set_state(state)
+        Restores the state of each tracker in the sequence.
     """
 
     def __init__(self):
@@ -34,10 +53,11 @@ class TrackerSequence:
         """
         self.sequence = []
         self.model = None
+        self._schedule = []
 
     def initialize(self, model):
         """
-        Initializes all trackers in the sequence with the provided simulation model.
+        Initializes all trackers in the sequence with the provided simulation model and builds the schedule.
 
         Parameters
         ----------
@@ -48,6 +68,26 @@ class TrackerSequence:
         for tracker in self.sequence:
             tracker.initialize(model)
 
+        self.schedule()
+
+    def schedule(self):
+        """
+        Builds the schedule of the trackers from the current model step.
+
+        Called by `initialize` and when the model step changes outside the simulation loop (e.g. when
+        a saved state is resumed).
+        """
+        self._schedule = []
+        for i, tracker in enumerate(self.sequence):
+            self._push(i, tracker.next_step(self.model.step - 1))
+
+    def _push(self, i, step):
+        """
+        Schedules the i-th tracker at the given step (None means never).
+        """
+        if step is not None:
+            heapq.heappush(self._schedule, (step, i))
+
     def add_tracker(self, tracker):
         """
         Adds a new tracker to the end of the sequence.
@@ -64,10 +104,48 @@ class TrackerSequence:
         Removes all trackers from the sequence.
         """
         self.sequence = []
+        self._schedule = []
 
     def tracker_next(self):
         """
-        Executes the `track` method of each tracker in the sequence.
+        Executes the `track` method of each tracker that is due at the current step.
         """
-        for tracker in self.sequence:
+        step = self.model.step
+        while self._schedule and self._schedule[0][0] <= step:
+            _, i = heapq.heappop(self._schedule)
+            tracker = self.sequence[i]
             tracker.track()
+            self._push(i, tracker.next_step(step))
+
+    def finalize(self):
+        """
+        Executes the `finalize` method of each tracker in the sequence.
+        """
+        for tracker in self.sequence:
+            tracker.finalize()
+
+    def get_state(self):
+        """
+        Returns the state of each tracker in the sequence (see `Tracker.get_state`).
+
+        Returns
+        -------
+        list of dict
+            The tracker states, in the order of the sequence.
+        """
+        return [tracker.get_state() for tracker in self.sequence]
+
+    def set_state(self, state):
+        """
+        Restores the state of each tracker saved by `get_state`.
+
+        Parameters
+        ----------
+        state : list of dict
+            The tracker states, in the order of the sequence.
+        """
+        if len(state) != len(self.sequence):
+            raise ValueError("Saved tracker state does not match the tracker sequence")
+
+        for tracker, tracker_state in zip(self.sequence, state):
+            tracker.set_state(tracker_state)
@@ -1,7 +1,7 @@
 from finitewave.cpuwave2D.exception import IncorrectWeightsModeError2D
-from finitewave.cpuwave2D.fibrosis import Diffuse2DPattern, ScarGauss2DPattern, ScarRect2DPattern, Structural2DPattern
-from finitewave.cpuwave2D.model import diffuse_kernel_2d_iso, diffuse_kernel_2d_aniso, _parallel, AlievPanfilov2D, AlievPanfilovKernels2D, LuoRudy912D, LuoRudy91Kernels2D, TP062D, TP06Kernels2D, LuoRudy912D, LuoRudy91Kernels2D, TP062D, TP06Kernels2D
+from finitewave.cpuwave2D.fibrosis import Correlated2DPattern, Diffuse2DPattern, ScarGauss2DPattern, ScarRect2DPattern, Structural2DPattern
+from finitewave.cpuwave2D.model import diffuse_kernel_2d_iso, diffuse_kernel_2d_aniso, diffuse_kernel_2d_iso_ext, diffuse_kernel_2d_aniso_ext, _parallel, AlievPanfilov2D, AlievPanfilovKernels2D, LuoRudy912D, LuoRudy91Kernels2D, TP062D, TP06Kernels2D, LuoRudy912D, LuoRudy91Kernels2D, TP062D, TP06Kernels2D
 from finitewave.cpuwave2D.stencil import AsymmetricStencil2D, IsotropicStencil2D
 from finitewave.cpuwave2D.stimulation import StimCurrentCoord2D, StimVoltageCoord2D, StimCurrentMatrix2D, StimVoltageMatrix2D
 from finitewave.cpuwave2D.tissue import CardiacTissue2D
-from finitewave.cpuwave2D.tracker import ActionPotential2DTracker, ActivationTime2DTracker, Animation2DTracker, ECG2DTracker, MultiActivationTime2DTracker, MultiVariable2DTracker, Period2DTracker, PeriodMap2DTracker, Spiral2DTracker, Variable2DTracker, Velocity2DTracker
+from finitewave.cpuwave2D.tracker import ActionPotential2DTracker, APD2DTracker, ActivationTime2DTracker, Animation2DTracker, ECG2DTracker, MultiActivationTime2DTracker, MultiVariable2DTracker, Period2DTracker, PeriodMap2DTracker, PeriodStats2DTracker, Preview2DTracker, Spiral2DTracker, Variable2DTracker, Velocity2DTracker
@@ -1,3 +1,4 @@
+from finitewave.cpuwave2D.fibrosis.correlated_2d_pattern import Correlated2DPattern
 from finitewave.cpuwave2D.fibrosis.diffuse_2d_pattern import Diffuse2DPattern
 from finitewave.cpuwave2D.fibrosis.scar_gauss_2d_pattern import ScarGauss2DPattern
 from finitewave.cpuwave2D.fibrosis.scar_rect_2d_pattern import ScarRect2DPattern
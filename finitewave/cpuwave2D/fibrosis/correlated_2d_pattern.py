@@ -0,0 +1,128 @@
+import numpy as np
+
+from finitewave.core.fibrosis.fibrosis_pattern import FibrosisPattern
+from finitewave.core.fibrosis.correlated_field import correlated_field, field_threshold
+
+
+class Correlated2DPattern(FibrosisPattern):
+    """
+    Class for generating a spatially correlated 2D fibrosis pattern in a given mesh area.
+
+    A Gaussian random field with the correlation length `corr_length` is generated over the area and
+    the healthy nodes where the field exceeds a threshold become fibrosis. The threshold is chosen so
+    that the fraction `dens` of the healthy nodes of the area becomes fibrosis. Different correlation
+    lengths along the axes give elongated (interstitial) patches.
+
+    Attributes
+    ----------
+    x1 : int
+        The starting x-coordinate of the fibrosis area.
+    x2 : int
+        The ending x-coordinate of the fibrosis area.
+    y1 : int
+        The starting y-coordinate of the fibrosis area.
+    y2 : int
+        The ending y-coordinate of the fibrosis area.
+    dens : float
+        The fraction of the healthy nodes of the area that becomes fibrosis (0 to 1).
+    corr_length : float or tuple of float
+        The correlation length (standard deviation of the Gaussian filter, in nodes) for both axes
+        or for each axis.
+
+    Methods
+    -------
+    generate(size, mesh=None):
+        Generates the fibrosis pattern and updates the provided mesh. If no mesh is provided,
+        a new mesh is created with the given size.
+    generate_batch(size, count, mesh=None):
+        Generates several realizations of the fibrosis pattern at once.
+    """
+
+    def __init__(self, x1, x2, y1, y2, dens, corr_length, seed=None):
+        """
+        Initializes the Correlated2DPattern with the specified parameters.
+
+        Parameters
+        ----------
+        x1 : int
+            The starting x-coordinate of the fibrosis area.
+        x2 : int
+            The ending x-coordinate of the fibrosis area.
+        y1 : int
+            The starting y-coordinate of the fibrosis area.
+        y2 : int
+            The ending y-coordinate of the fibrosis area.
+        dens : float
+            The fraction of the healthy nodes of the area that becomes fibrosis (0 to 1).
+        corr_length : float or tuple of float
+            The correlation length (in nodes) for both axes or for each axis.
+        seed : int, numpy.random.Generator or None, optional
+            Seed of the random generator of the pattern or a generator to use.
+        """
+        FibrosisPattern.__init__(self, seed)
+        self.x1 = x1
+        self.x2 = x2
+        self.y1 = y1
+        self.y2 = y2
+        self.dens = dens
+        self.corr_length = corr_length
+
+    def generate(self, size, mesh=None):
+        """
+        Generates and applies the correlated fibrosis pattern to the mesh.
+
+        Parameters
+        ----------
+        size : tuple of int
+            The size of the mesh to create if no mesh is provided.
+        mesh : numpy.ndarray, optional
+            The existing mesh to apply the fibrosis pattern to. If None, a new mesh of healthy
+            tissue (ones) is created.
+
+        Returns
+        -------
+        numpy.ndarray
+            The mesh with the correlated fibrosis pattern applied.
+        """
+        if mesh is None:
+            mesh = np.ones(size)
+
+        self._apply(mesh[np.newaxis])
+        return mesh
+
+    def generate_batch(self, size, count, mesh=None):
+        """
+        Generates several realizations of the correlated fibrosis pattern at once.
+
+        Parameters
+        ----------
+        size : tuple of int
+            The size of the mesh to create if no mesh is provided.
+        count : int
+            The number of realizations.
+        mesh : numpy.ndarray, optional
+            The mesh to which the fibrosis pattern is applied (it is not modified). If None, a mesh of
+            healthy tissue with the given size is used.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape (count, *size) with the realizations.
+        """
+        if mesh is None:
+            mesh = np.ones(size)
+
+        meshes = np.repeat(mesh[np.newaxis], count, axis=0)
+        self._apply(meshes)
+        return meshes
+
+    def _apply(self, meshes):
+        """
+        Applies independent realizations of the pattern to a stack of meshes in place.
+        """
+        for mesh in meshes:
+            area = mesh[self.x1:self.x2, self.y1:self.y2]
+            field = correlated_field(area.shape, self.corr_length, self.rng)
+            healthy = area == 1
+            threshold = field_threshold(field, self.dens, healthy)
+            area[healthy & (field > threshold)] = 2
@@ -26,9 +26,11 @@ class Diffuse2DPattern(FibrosisPattern):
     generate(size, mesh=None):
         Generates the fibrosis pattern and updates the provided mesh. If no mesh is provided, 
         a new mesh is created with the given size.
+    generate_batch(size, count, mesh=None):
+        Generates several realizations of the fibrosis pattern at once.
     """
 
-    def __init__(self, x1, x2, y1, y2, dens):
+    def __init__(self, x1, x2, y1, y2, dens, seed=None):
         """
         Initializes the Diffuse2DPattern with the specified parameters.
 
@@ -45,7 +47,10 @@ class Diffuse2DPattern(FibrosisPattern):
         dens : float
             The density of the fibrosis, where a value between 0 and 1 represents the probability 
             of fibrosis in each cell of the specified area.
+        seed : int, numpy.random.Generator or None, optional
+            Seed of the random generator of the pattern or a generator to use.
         """
+        FibrosisPattern.__init__(self, seed)
         self.x1 = x1
         self.x2 = x2
         self.y1 = y1
@@ -56,8 +61,8 @@ class Diffuse2DPattern(FibrosisPattern):
         """
         Generates and applies the diffuse fibrosis pattern to the mesh.
 
-        If no mesh is provided, a new mesh of zeros with the given size is created. The method 
-        fills the specified area of the mesh with fibrosis based on the defined density.
+        If no mesh is provided, a new mesh of healthy tissue (ones) with the given size is created.
+        The method fills the specified area of the mesh with fibrosis based on the defined density.
 
         Parameters
         ----------
@@ -73,12 +78,41 @@ class Diffuse2DPattern(FibrosisPattern):
             The mesh with the applied diffuse fibrosis pattern.
         """
         if mesh is None:
-            mesh = np.zeros(size)
-
-        # Apply the fibrosis pattern to the specified area of the mesh
-        msh_area = mesh[self.x1:self.x2, self.y1:self.y2]
-        fib_area = np.random.uniform(size=[self.x2-self.x1, self.y2-self.y1])
-        fib_area = np.where(np.logical_and(fib_area < self.dens, msh_area == 1), 2, msh_area)
-        mesh[self.x1:self.x2, self.y1:self.y2] = fib_area
+            mesh = np.ones(size)
 
+        self._apply(mesh[np.newaxis])
         return mesh
+
+    def generate_batch(self, size, count, mesh=None):
+        """
+        Generates several realizations of the diffuse fibrosis pattern at once.
+
+        Parameters
+        ----------
+        size : tuple of int
+            The size of the mesh to create if no mesh is provided.
+        count : int
+            The number of realizations.
+        mesh : np.ndarray, optional
+            The mesh to which the fibrosis pattern is applied (it is not modified). If None,
+            a mesh of healthy tissue with the given size is used.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (count, *size) with the realizations.
+        """
+        if mesh is None:
+            mesh = np.ones(size)
+
+        meshes = np.repeat(mesh[np.newaxis], count, axis=0)
+        self._apply(meshes)
+        return meshes
+
+    def _apply(self, meshes):
+        """
+        Applies independent realizations of the pattern to a stack of meshes in place.
+        """
+        area = meshes[:, self.x1:self.x2, self.y1:self.y2]
+        fibrosis = self.rng.random(area.shape) < self.dens
+        area[fibrosis & (area == 1)] = 2
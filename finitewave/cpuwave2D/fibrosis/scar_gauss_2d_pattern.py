@@ -25,7 +25,7 @@ class ScarGauss2DPattern(FibrosisPattern):
         a new mesh is created with the given size.
     """
 
-    def __init__(self, mean, std, corr, size):
+    def __init__(self, mean, std, corr, size, seed=None):
         """
         Initializes the ScarGauss2DPattern with the specified parameters.
 
@@ -39,7 +39,10 @@ class ScarGauss2DPattern(FibrosisPattern):
             The correlation coefficient between the x and y dimensions of the Gaussian distribution.
         size : tuple of int
             The size of the Gaussian distribution sample.
+        seed : int, numpy.random.Generator or None, optional
+            Seed of the random generator of the pattern or a generator to use.
         """
+        FibrosisPattern.__init__(self, seed)
         self.mean = mean
         self.std = std
         self.corr = corr
@@ -73,7 +76,7 @@ class ScarGauss2DPattern(FibrosisPattern):
                 [self.std[0]*self.std[1]*self.corr, self.std[1]**2]]
         
         # Sample from the multivariate normal distribution
-        nrm = np.random.multivariate_normal(self.mean, covs, self.size).T
+        nrm = self.rng.multivariate_normal(self.mean, covs, self.size).T
         
         # Apply the Gaussian fibrosis pattern to the mesh
         mesh[nrm[0].astype(int), nrm[1].astype(int)] = 2
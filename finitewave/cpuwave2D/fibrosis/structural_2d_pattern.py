@@ -1,5 +1,4 @@
 import numpy as np
-import random
 
 from finitewave.core.fibrosis.fibrosis_pattern import FibrosisPattern
 
@@ -33,9 +32,11 @@ class Structural2DPattern(FibrosisPattern):
     generate(size, mesh=None):
         Generates and applies a structural fibrosis pattern to the mesh. If no mesh is provided, 
         a new mesh is created with the given size.
+    generate_batch(size, count, mesh=None):
+        Generates several realizations of the fibrosis pattern at once.
     """
 
-    def __init__(self, x1, x2, y1, y2, dens, length_i, length_j):
+    def __init__(self, x1, x2, y1, y2, dens, length_i, length_j, seed=None):
         """
         Initializes the Structural2DPattern with the specified parameters.
 
@@ -55,7 +56,10 @@ class Structural2DPattern(FibrosisPattern):
             The width of each block.
         length_j : int
             The height of each block.
+        seed : int, numpy.random.Generator or None, optional
+            Seed of the random generator of the pattern or a generator to use.
         """
+        FibrosisPattern.__init__(self, seed)
         self.x1 = x1
         self.x2 = x2
         self.y1 = y1
@@ -88,21 +92,48 @@ class Structural2DPattern(FibrosisPattern):
         if mesh is None:
             mesh = np.zeros(size)
 
-        for i in range(self.x1, self.x2, self.length_i):
-            for j in range(self.y1, self.y2, self.length_j):
-                if random.random() <= self.dens:
-                    i_s = 0
-                    j_s = 0
-                    if i + self.length_i <= self.x2:
-                        i_s = self.length_i
-                    else:
-                        i_s = self.length_i - (i + self.length_i - self.x2)
+        self._apply(mesh[np.newaxis])
+        return mesh
 
-                    if j + self.length_j <= self.y2:
-                        j_s = self.length_j
-                    else:
-                        j_s = self.length_j - (j + self.length_j - self.y2)
+    def generate_batch(self, size, count, mesh=None):
+        """
+        Generates several realizations of the structural fibrosis pattern at once.
 
-                    mesh[i:i + i_s, j:j + j_s] = 2
+        Parameters
+        ----------
+        size : tuple of int
+            The size of the mesh to create if no mesh is provided.
+        count : int
+            The number of realizations.
+        mesh : np.ndarray, optional
+            The mesh to which the fibrosis pattern is applied (it is not modified). If None,
+            a new mesh is created with the given size.
 
-        return mesh
+        Returns
+        -------
+        np.ndarray
+            Array of shape (count, *size) with the realizations.
+        """
+        if mesh is None:
+            mesh = np.zeros(size)
+
+        meshes = np.repeat(mesh[np.newaxis], count, axis=0)
+        self._apply(meshes)
+        return meshes
+
+    def _apply(self, meshes):
+        """
+        Applies independent realizations of the pattern to a stack of meshes in place.
+
+        Each block is drawn once and expanded to its nodes; the blocks at the far edges
+        of the region are cropped.
+        """
+        area = meshes[:, self.x1:self.x2, self.y1:self.y2]
+        lengths = (self.length_i, self.length_j)
+        n_blocks = [-(-n // length) for n, length in zip(area.shape[1:], lengths)]
+        blocks = self.rng.random((len(meshes), *n_blocks)) <= self.dens
+        for axis, length in enumerate(lengths, start=1):
+            blocks = np.repeat(blocks, length, axis=axis)
+
+        crop = tuple(slice(0, n) for n in area.shape)
+        area[blocks[crop]] = 2
@@ -1,4 +1,4 @@
-from finitewave.cpuwave2D.model.diffuse_kernels_2d import diffuse_kernel_2d_iso, diffuse_kernel_2d_aniso, _parallel
+from finitewave.cpuwave2D.model.diffuse_kernels_2d import diffuse_kernel_2d_iso, diffuse_kernel_2d_aniso, diffuse_kernel_2d_iso_ext, diffuse_kernel_2d_aniso_ext, _parallel
 
 from finitewave.cpuwave2D.model.aliev_panfilov_2d.aliev_panfilov_2d import AlievPanfilov2D
 from finitewave.cpuwave2D.model.aliev_panfilov_2d.aliev_panfilov_kernels_2d import AlievPanfilovKernels2D
@@ -1,10 +1,11 @@
 from numba import njit, prange
 
 from finitewave.core.exception.exceptions import IncorrectWeightsShapeError
-from finitewave.cpuwave2D.model.diffuse_kernels_2d import diffuse_kernel_2d_iso, diffuse_kernel_2d_aniso, _parallel
+from finitewave.cpuwave2D.model.diffuse_kernels_2d import (diffuse_kernel_2d_iso, diffuse_kernel_2d_aniso,
+    diffuse_kernel_2d_iso_ext, diffuse_kernel_2d_aniso_ext, _parallel)
 
 
-@njit(parallel=_parallel)
+@njit(parallel=_parallel, nogil=True)
 def ionic_kernel_2d(u_new, u, v, mesh, dt):
     """
     Computes the ionic kernel for the Aliev-Panfilov 2D model.
@@ -56,7 +57,7 @@ class AlievPanfilovKernels2D:
 
     Methods
     -------
-    get_diffuse_kernel(shape)
+    get_diffuse_kernel(shape, external_current=False)
         Returns the appropriate diffusion kernel function based on the shape of weights.
     
     get_ionic_kernel()
@@ -67,7 +68,7 @@ class AlievPanfilovKernels2D:
         pass
 
     @staticmethod
-    def get_diffuse_kernel(shape):
+    def get_diffuse_kernel(shape, external_current=False):
         """
         Retrieves the diffusion kernel function based on the shape of weights.
 
@@ -75,6 +76,9 @@ class AlievPanfilovKernels2D:
         ----------
         shape : tuple
             The shape of the weights array used for determining the diffusion kernel.
+        external_current : bool, optional
+            Whether to return the kernel that adds an external current to the
+            updated potential (see `CardiacModel.fuse_stim`). Default is False.
 
         Returns
         -------
@@ -87,8 +91,12 @@ class AlievPanfilovKernels2D:
             If the shape of the weights array is not recognized.
         """
         if shape[-1] == 5:
+            if external_current:
+                return diffuse_kernel_2d_iso_ext
             return diffuse_kernel_2d_iso
         if shape[-1] == 9:
+            if external_current:
+                return diffuse_kernel_2d_aniso_ext
             return diffuse_kernel_2d_aniso
         else:
             raise IncorrectWeightsShapeError(shape, 5, 9)
@@ -2,7 +2,7 @@ from numba import njit, prange
 
 _parallel = False
 
-@njit(parallel=_parallel)
+@njit(parallel=_parallel, nogil=True)
 def diffuse_kernel_2d_iso(u_new, u, w, mesh):
     """
     Performs isotropic diffusion on a 2D grid.
@@ -45,7 +45,7 @@ def diffuse_kernel_2d_iso(u_new, u, w, mesh):
                        u[i+1, j] * w[i, j, 4])
 
 
-@njit(parallel=_parallel)
+@njit(parallel=_parallel, nogil=True)
 def diffuse_kernel_2d_aniso(u_new, u, w, mesh):
     """
     Performs anisotropic diffusion on a 2D grid.
@@ -88,3 +88,87 @@ def diffuse_kernel_2d_aniso(u_new, u, w, mesh):
                        u[i, j] * w[i, j, 4] + u[i, j+1] * w[i, j, 5] +
                        u[i+1, j-1] * w[i, j, 6] + u[i+1, j] * w[i, j, 7] +
                        u[i+1, j+1] * w[i, j, 8])
+
+
+@njit(parallel=_parallel, nogil=True)
+def diffuse_kernel_2d_iso_ext(u_new, u, w, mesh, i_ext, dt):
+    """
+    Performs isotropic diffusion on a 2D grid and adds an external current.
+
+    Same as `diffuse_kernel_2d_iso`, with the external (stimulation) current added to
+    the updated potential during the same sweep: ``u_new += dt * i_ext``.
+
+    Parameters
+    ----------
+    u_new : numpy.ndarray
+        A 2D array to store the updated potential values after diffusion.
+    
+    u : numpy.ndarray
+        A 2D array representing the current potential values before diffusion.
+    
+    w : numpy.ndarray
+        The diffusion weights (see `diffuse_kernel_2d_iso`).
+    
+    mesh : numpy.ndarray
+        A 2D array representing the mesh of the tissue.
+
+    i_ext : numpy.ndarray
+        A 2D array with the external current at each node.
+
+    dt : float
+        Time step.
+    """
+    n_i = u.shape[0]
+    n_j = u.shape[1]
+    for ii in prange(n_i * n_j):
+        i = int(ii / n_j)
+        j = ii % n_j
+        if mesh[i, j] != 1:
+            continue
+
+        u_new[i, j] = (u[i-1, j] * w[i, j, 0] + u[i, j-1] * w[i, j, 1] +
+                       u[i, j] * w[i, j, 2] + u[i, j+1] * w[i, j, 3] +
+                       u[i+1, j] * w[i, j, 4]) + dt * i_ext[i, j]
+
+
+@njit(parallel=_parallel, nogil=True)
+def diffuse_kernel_2d_aniso_ext(u_new, u, w, mesh, i_ext, dt):
+    """
+    Performs anisotropic diffusion on a 2D grid and adds an external current.
+
+    Same as `diffuse_kernel_2d_aniso`, with the external (stimulation) current added to
+    the updated potential during the same sweep: ``u_new += dt * i_ext``.
+
+    Parameters
+    ----------
+    u_new : numpy.ndarray
+        A 2D array to store the updated potential values after diffusion.
+    
+    u : numpy.ndarray
+        A 2D array representing the current potential values before diffusion.
+    
+    w : numpy.ndarray
+        The diffusion weights (see `diffuse_kernel_2d_aniso`).
+    
+    mesh : numpy.ndarray
+        A 2D array representing the mesh of the tissue.
+
+    i_ext : numpy.ndarray
+        A 2D array with the external current at each node.
+
+    dt : float
+        Time step.
+    """
+    n_i = u.shape[0]
+    n_j = u.shape[1]
+    for ii in prange(n_i * n_j):
+        i = int(ii / n_j)
+        j = ii % n_j
+        if mesh[i, j] != 1:
+            continue
+
+        u_new[i, j] = (u[i-1, j-1] * w[i, j, 0] + u[i-1, j] * w[i, j, 1] +
+                       u[i-1, j+1] * w[i, j, 2] + u[i, j-1] * w[i, j, 3] +
+                       u[i, j] * w[i, j, 4] + u[i, j+1] * w[i, j, 5] +
+                       u[i+1, j-1] * w[i, j, 6] + u[i+1, j] * w[i, j, 7] +
+                       u[i+1, j+1] * w[i, j, 8]) + dt * i_ext[i, j]
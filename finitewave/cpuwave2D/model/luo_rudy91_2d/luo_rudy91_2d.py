@@ -69,7 +69,8 @@ class LuoRudy912D(CardiacModel):
         weights_shape = self.cardiac_tissue.weights.shape
         shape = self.cardiac_tissue.mesh.shape
 
-        self.diffuse_kernel = LuoRudy91Kernels2D().get_diffuse_kernel(weights_shape)
+        self.diffuse_kernel = LuoRudy91Kernels2D().get_diffuse_kernel(weights_shape,
+                                                                      self.fuse_stim)
         self.ionic_kernel = LuoRudy91Kernels2D().get_ionic_kernel()
 
         self.u = -84.5 * np.ones(shape, dtype=_npfloat)
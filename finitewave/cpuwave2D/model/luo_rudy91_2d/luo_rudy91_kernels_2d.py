@@ -3,10 +3,11 @@ from math import log, sqrt, exp
 from numba import njit, prange
 
 from finitewave.core.exception.exceptions import IncorrectWeightsShapeError
-from finitewave.cpuwave2D.model.diffuse_kernels_2d import diffuse_kernel_2d_iso, diffuse_kernel_2d_aniso, _parallel
+from finitewave.cpuwave2D.model.diffuse_kernels_2d import (diffuse_kernel_2d_iso, diffuse_kernel_2d_aniso,
+    diffuse_kernel_2d_iso_ext, diffuse_kernel_2d_aniso_ext, _parallel)
 
 
-@njit(parallel=_parallel)
+@njit(parallel=_parallel, nogil=True)
 def ionic_kernel_2d(u_new, u, m, h, j_, d, f, x, Cai_c, mesh, dt):
     """
     Computes the ionic currents and updates the state variables in the 2D Luo-Rudy 1991 cardiac model.
@@ -166,7 +167,7 @@ class LuoRudy91Kernels2D:
 
     Methods
     -------
-    get_diffuse_kernel(shape):
+    get_diffuse_kernel(shape, external_current=False):
         Returns the diffusion kernel function based on the weight array shape.
     get_ionic_kernel():
         Returns the ionic kernel function used for updating membrane potentials and gating variables.
@@ -179,7 +180,7 @@ class LuoRudy91Kernels2D:
         pass
 
     @staticmethod
-    def get_diffuse_kernel(shape):
+    def get_diffuse_kernel(shape, external_current=False):
         """
         Retrieves the diffusion kernel function based on the weight shape.
 
@@ -187,6 +188,9 @@ class LuoRudy91Kernels2D:
         ----------
         shape : tuple
             The shape of the weight array used in the diffusion process.
+        external_current : bool, optional
+            Whether to return the kernel that adds an external current to the
+            updated potential (see `CardiacModel.fuse_stim`). Default is False.
 
         Returns
         -------
@@ -199,8 +203,12 @@ class LuoRudy91Kernels2D:
             If the shape of the weights array does not match expected values (5 or 9).
         """
         if shape[-1] == 5:
+            if external_current:
+                return diffuse_kernel_2d_iso_ext
             return diffuse_kernel_2d_iso
         if shape[-1] == 9:
+            if external_current:
+                return diffuse_kernel_2d_aniso_ext
             return diffuse_kernel_2d_aniso
         else:
             raise IncorrectWeightsShapeError(shape, 5, 9)
@@ -122,7 +122,8 @@ class TP062D(CardiacModel):
         super().initialize()
         weights_shape = self.cardiac_tissue.weights.shape
         shape = self.cardiac_tissue.mesh.shape
-        self.diffuse_kernel = TP06Kernels2D().get_diffuse_kernel(weights_shape)
+        self.diffuse_kernel = TP06Kernels2D().get_diffuse_kernel(weights_shape,
+                                                                 self.fuse_stim)
         self.ionic_kernel = TP06Kernels2D().get_ionic_kernel()
 
         self.u = -84.5*np.ones(shape, dtype=_npfloat)
@@ -3,11 +3,12 @@ from numba import njit, prange
 
 from finitewave.core.exception.exceptions import IncorrectWeightsShapeError
 from finitewave.cpuwave2D.model.diffuse_kernels_2d \
-    import diffuse_kernel_2d_iso, diffuse_kernel_2d_aniso, _parallel
+    import (diffuse_kernel_2d_iso, diffuse_kernel_2d_aniso,
+            diffuse_kernel_2d_iso_ext, diffuse_kernel_2d_aniso_ext, _parallel)
 
 
 # tp06 epi kernel
-@njit(parallel=_parallel)
+@njit(parallel=_parallel, nogil=True)
 def ionic_kernel_2d(u_new, u, Cai, CaSR, CaSS, Nai, Ki, M_, H_, J_, Xr1, Xr2, Xs,
                     R_, S_, D_, F_, F2_, FCass, RR, OO, mesh, dt):
     """
@@ -331,7 +332,7 @@ class TP06Kernels2D:
 
     Methods
     -------
-    get_diffuse_kernel(shape):
+    get_diffuse_kernel(shape, external_current=False):
         Returns the appropriate diffusion kernel function based on the shape of the weights.
     get_ionic_kernel():
         Returns the ionic kernel function for the TP06 model.
@@ -344,7 +345,7 @@ class TP06Kernels2D:
         pass
 
     @staticmethod
-    def get_diffuse_kernel(shape):
+    def get_diffuse_kernel(shape, external_current=False):
         """
         Returns the diffusion kernel function based on the shape of the weights.
 
@@ -352,6 +353,9 @@ class TP06Kernels2D:
         ----------
         shape : tuple
             The shape of the weights array.
+        external_current : bool, optional
+            Whether to return the kernel that adds an external current to the
+            updated potential (see `CardiacModel.fuse_stim`). Default is False.
 
         Returns
         -------
@@ -364,8 +368,12 @@ class TP06Kernels2D:
             If the shape of the weights does not match expected values (5 or 9).
         """
         if shape[-1] == 5:
+            if external_current:
+                return diffuse_kernel_2d_iso_ext
             return diffuse_kernel_2d_iso
         if shape[-1] == 9:
+            if external_current:
+                return diffuse_kernel_2d_aniso_ext
             return diffuse_kernel_2d_aniso
         else:
             raise IncorrectWeightsShapeError(shape, 5, 9)
@@ -3,6 +3,10 @@ from numba import njit, prange
 
 from finitewave.core.stencil.stencil import Stencil
 
+# serial, like the 2D model kernels: a 2D simulation then starts no numba threading layer and can
+# be forked (see `CardiacModel.run_forks`); the assembly is a small part of a 2D run
+_parallel = False
+
 
 @njit
 def minor_component(d, m0, m1, m2, m3, m4, m5):
@@ -92,7 +96,47 @@ def major_component(d, m0):
 
 
 @njit
-def compute_weights(w, m, d_xx, d_xy, d_yx, d_yy):
+def half_step_diffusion(c, f, D_al, D_ac, i, j, axis, comp):
+    """
+    Computes a component of the diffusion tensor at the half-step between
+    the node (i, j) and the next node along the axis.
+
+    Parameters
+    ----------
+    c : np.ndarray
+        2D array of conductivity.
+    f : np.ndarray
+        Array of fiber orientations with shape ``(*mesh.shape, 2)``.
+    D_al : float
+        Longitudinal diffusion coefficient.
+    D_ac : float
+        Cross-sectional diffusion coefficient.
+    i, j : int
+        Node indices.
+    axis : int
+        Axis of the half-step (0 for x, 1 for y).
+    comp : int
+        Component of the diffusion tensor (0 for x, 1 for y).
+
+    Returns
+    -------
+    float
+        Diffusion component at the half-step.
+    """
+    i1 = i + (axis == 0)
+    j1 = j + (axis == 1)
+    if i1 == c.shape[0]:
+        i1 = 0
+    if j1 == c.shape[1]:
+        j1 = 0
+
+    d0 = (D_ac * (axis == comp) + (D_al - D_ac) * f[i, j, axis] * f[i, j, comp]) * c[i, j]
+    d1 = (D_ac * (axis == comp) + (D_al - D_ac) * f[i1, j1, axis] * f[i1, j1, comp]) * c[i1, j1]
+    return 0.5 * (d0 + d1)
+
+
+@njit(parallel=_parallel)
+def compute_weights(w, m, c, f, D_al, D_ac):
     """
     Computes the weights for diffusion on a 2D mesh based on the asymmetric
     stencil.
@@ -119,14 +163,14 @@ def compute_weights(w, m, d_xx, d_xy, d_yx, d_yy):
     m : np.ndarray
         2D array representing the mesh grid of the tissue. Non-tissue areas
         are set to 0.
-    d_xx : np.ndarray
-        Diffusion x component for x direction.
-    d_xy : np.ndarray
-        Diffusion y component for x direction.
-    d_yx : np.ndarray
-        Diffusion x component for y direction.
-    d_yy : np.ndarray
-        Diffusion y component for y direction.
+    c : np.ndarray
+        2D array of conductivity.
+    f : np.ndarray
+        Array of fiber orientations with shape ``(*mesh.shape, 2)``.
+    D_al : float
+        Longitudinal diffusion coefficient.
+    D_ac : float
+        Cross-sectional diffusion coefficient.
 
     Returns
     -------
@@ -135,6 +179,11 @@ def compute_weights(w, m, d_xx, d_xy, d_yx, d_yy):
 
     Notes
     -----
+    The half-step diffusion components (``d_xx`` for the x component in the
+    x direction, etc.) are computed for each node from the fibers and the
+    conductivity (see `half_step_diffusion`), so no full-size arrays are
+    allocated.
+
     The method assumes weights being used in the following order:
         ``w[0] : i-1, j-1``,
         ``w[1] : i-1, j``,
@@ -154,14 +203,23 @@ def compute_weights(w, m, d_xx, d_xy, d_yx, d_yy):
         if m[i, j] != 1:
             continue
 
+        d_xx_0 = half_step_diffusion(c, f, D_al, D_ac, i-1, j, 0, 0)
+        d_xy_0 = half_step_diffusion(c, f, D_al, D_ac, i-1, j, 0, 1)
+        d_yx_0 = half_step_diffusion(c, f, D_al, D_ac, i, j-1, 1, 0)
+        d_yy_0 = half_step_diffusion(c, f, D_al, D_ac, i, j-1, 1, 1)
+        d_xx_1 = half_step_diffusion(c, f, D_al, D_ac, i, j, 0, 0)
+        d_xy_1 = half_step_diffusion(c, f, D_al, D_ac, i, j, 0, 1)
+        d_yx_1 = half_step_diffusion(c, f, D_al, D_ac, i, j, 1, 0)
+        d_yy_1 = half_step_diffusion(c, f, D_al, D_ac, i, j, 1, 1)
+
         # q (i-1/2, j)
-        qx0_major = major_component(d_xx[i-1, j], m[i-1, j])
+        qx0_major = major_component(d_xx_0, m[i-1, j])
         # (i-1, j)
         w[i, j, 1] += qx0_major
         # (i, j)
         w[i, j, 4] -= qx0_major
 
-        qx0_minor = minor_component(d_xy[i-1, j],
+        qx0_minor = minor_component(d_xy_0,
                                     m[i-1, j-1], m[i, j-1],
                                     m[i-1, j], m[i, j],
                                     m[i-1, j+1], m[i, j+1])
@@ -179,13 +237,13 @@ def compute_weights(w, m, d_xx, d_xy, d_yx, d_yy):
         w[i, j, 5] -= qx0_minor[5]
 
         # q (i, j-1/2)
-        qy0_major = major_component(d_yy[i, j-1], m[i, j-1])
+        qy0_major = major_component(d_yy_0, m[i, j-1])
         # (i, j-1)
         w[i, j, 3] += qy0_major
         # (i, j)
         w[i, j, 4] -= qy0_major
 
-        qy0_minor = minor_component(d_yx[i, j-1], m[i-1, j-1], m[i-1, j],
+        qy0_minor = minor_component(d_yx_0, m[i-1, j-1], m[i-1, j],
                                     m[i, j-1], m[i, j], m[i+1, j-1], m[i+1, j])
 
         # (i-1, j-1)
@@ -202,13 +260,13 @@ def compute_weights(w, m, d_xx, d_xy, d_yx, d_yy):
         w[i, j, 7] -= qy0_minor[5]
 
         # q (i, j+1/2)
-        qy1_major = major_component(d_yy[i, j], m[i, j+1])
+        qy1_major = major_component(d_yy_1, m[i, j+1])
         # (i, j+1)
         w[i, j, 5] += qy1_major
         # (i, j)
         w[i, j, 4] -= qy1_major
 
-        qy1_minor = minor_component(d_yx[i, j], m[i-1, j+1], m[i-1, j],
+        qy1_minor = minor_component(d_yx_1, m[i-1, j+1], m[i-1, j],
                                     m[i, j+1], m[i, j], m[i+1, j+1], m[i+1, j])
 
         # (i-1, j+1)
@@ -225,13 +283,13 @@ def compute_weights(w, m, d_xx, d_xy, d_yx, d_yy):
         w[i, j, 7] += qy1_minor[5]
 
         # q (i+1/2, j)
-        qx1_major = major_component(d_xx[i, j], m[i+1, j])
+        qx1_major = major_component(d_xx_1, m[i+1, j])
         # (i+1, j)
         w[i, j, 7] += qx1_major
         # (i, j)
         w[i, j, 4] -= qx1_major
 
-        qx1_minor = minor_component(d_xy[i, j], m[i+1, j-1], m[i, j-1],
+        qx1_minor = minor_component(d_xy_1, m[i+1, j-1], m[i, j-1],
                                     m[i+1, j], m[i, j], m[i+1, j+1], m[i, j+1])
         # (i+1, j-1)
         w[i, j, 6] += qx1_minor[0]
@@ -292,17 +350,17 @@ class AsymmetricStencil2D(Stencil):
         The method assumes asymmetric diffusion where different coefficients are used for different directions.
         The weights are computed for eight surrounding directions and the central weight, based on the asymmetric stencil.
         Heterogeneity in the diffusion coefficients is handled by adjusting the weights based on fiber orientations.
+        The half-step diffusion tensors are computed per node by a compiled kernel, so apart from
+        the weights only a one-byte copy of the mesh is allocated.
         """
-        mesh = mesh.copy()
-        mesh[mesh != 1] = 0
-        # fibers[np.where(mesh != 1)] = 0
+        mesh = (mesh == 1).astype(np.int8)
         weights = np.zeros((*mesh.shape, 9))
+        if conductivity is None:
+            conductivity = 1
+        conductivity = np.broadcast_to(np.asarray(conductivity, dtype=np.float64),
+                                       mesh.shape)
 
-        d_xx, d_xy = self.compute_half_step_diffusion(mesh, conductivity,
-                                                      fibers, D_al, D_ac, 0)
-        d_yx, d_yy = self.compute_half_step_diffusion(mesh, conductivity,
-                                                      fibers, D_al, D_ac, 1)
-        compute_weights(weights, mesh, d_xx, d_xy, d_yx, d_yy)
+        compute_weights(weights, mesh, conductivity, fibers, D_al, D_ac)
         weights *= dt/dr**2
         weights[:, :, 4] += 1
 
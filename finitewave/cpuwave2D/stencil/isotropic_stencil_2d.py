@@ -1,8 +1,70 @@
 import numbers
 import numpy as np
+from numba import njit, prange
 
 from finitewave.core.stencil.stencil import Stencil
 
+# serial, like the 2D model kernels
+_parallel = False
+
+
+@njit(parallel=_parallel)
+def compute_weights(w, m, d, dt, dr):
+    """
+    Computes the weights for diffusion on a 2D mesh using the isotropic
+    stencil in a single pass over the nodes.
+
+    Parameters
+    ----------
+    w : np.ndarray
+        3D array to store the weights for diffusion. Shape is (*mesh.shape, 5).
+        Must be filled with zeros.
+    m : np.ndarray
+        2D array representing the mesh grid of the tissue. Only nodes equal
+        to 1 are treated as tissue.
+    d : np.ndarray
+        2D array of diffusion coefficients.
+    dt : float
+        Temporal resolution.
+    dr : float
+        Spatial resolution.
+
+    Returns
+    -------
+    np.ndarray
+        3D array of weights for diffusion, with the shape of (*mesh.shape, 5).
+
+    Notes
+    -----
+    The mesh is treated as periodic (the neighbours of the edge nodes are
+    taken from the opposite edge), as the tissue edges are normally empty.
+    """
+    n_i = m.shape[0]
+    n_j = m.shape[1]
+    for i in prange(n_i):
+        i0 = i - 1 if i > 0 else n_i - 1
+        i1 = i + 1 if i < n_i - 1 else 0
+        for j in range(n_j):
+            if m[i, j] != 1:
+                continue
+            j0 = j - 1 if j > 0 else n_j - 1
+            j1 = j + 1 if j < n_j - 1 else 0
+
+            a = d[i, j] * dt / (dr**2)
+            b = dt / (2*dr)
+            w0 = a * (m[i0, j] == 1) - b * (d[i0, j] - d[i1, j])
+            w1 = a * (m[i, j0] == 1) - b * (d[i, j0] - d[i, j1])
+            w3 = a * (m[i, j1] == 1) + b * (d[i, j0] - d[i, j1])
+            w4 = a * (m[i1, j] == 1) + b * (d[i0, j] - d[i1, j])
+
+            w[i, j, 0] = w0
+            w[i, j, 1] = w1
+            w[i, j, 3] = w3
+            w[i, j, 4] = w4
+            w[i, j, 2] = 1 - w0 - w1 - w3 - w4
+
+    return w
+
 
 class IsotropicStencil2D(Stencil):
     """
@@ -54,37 +116,12 @@ class IsotropicStencil2D(Stencil):
         Notes
         -----
         The method assumes isotropic diffusion where `D_al` is used as the diffusion coefficient.
-        The weights are computed for four directions (up, right, down, left) and the central weight.
+        The weights are computed for four directions (up, right, down, left) and the central weight
+        by a compiled kernel in a single pass, without full-size temporary arrays.
         Heterogeneity in the diffusion coefficients is handled by adjusting the weights based on
         differences in the diffusion coefficients along the rows and columns.
         """
-        mesh = mesh.copy()
-        mesh[mesh != 1] = 0
         weights = np.zeros((*mesh.shape, 5))
-
-        # Compute the diffusion term
-        diffuse = D_al * conductivity * np.ones(mesh.shape)
-
-        # Assign weights based on diffusion
-        weights[:, :, 0] = diffuse * dt / (dr**2) * np.roll(mesh, 1, axis=0)
-        weights[:, :, 1] = diffuse * dt / (dr**2) * np.roll(mesh, 1, axis=1)
-        weights[:, :, 3] = diffuse * dt / (dr**2) * np.roll(mesh, -1, axis=1)
-        weights[:, :, 4] = diffuse * dt / (dr**2) * np.roll(mesh, -1, axis=0)
-
-        # Adjust weights for heterogeneity
-        diff_i = np.roll(diffuse, 1, axis=0) - np.roll(diffuse, -1, axis=0)
-        diff_j = np.roll(diffuse, 1, axis=1) - np.roll(diffuse, -1, axis=1)
-
-        weights[:, :, 0] -= dt / (2*dr) * diff_i
-        weights[:, :, 1] -= dt / (2*dr) * diff_j
-        weights[:, :, 3] += dt / (2*dr) * diff_j
-        weights[:, :, 4] += dt / (2*dr) * diff_i
-
-        # Finalize the weights
-        for i in [0, 1, 3, 4]:
-            weights[:, :, i] *= mesh
-            weights[:, :, 2] -= weights[:, :, i]
-        weights[:, :, 2] += 1
-        weights[:, :, 2] *= mesh
-
-        return weights
+        diffuse = np.broadcast_to(np.asarray(D_al * conductivity, dtype=np.float64),
+                                  mesh.shape)
+        return compute_weights(weights, mesh, diffuse, dt, dr)
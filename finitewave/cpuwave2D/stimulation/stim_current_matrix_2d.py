@@ -1,4 +1,5 @@
 from finitewave.core.stimulation.stim_current import StimCurrent
+from finitewave.core.stimulation.stim_kernels import matrix_index
 
 
 class StimCurrentMatrix2D(StimCurrent):
@@ -37,6 +38,22 @@ class StimCurrentMatrix2D(StimCurrent):
         StimCurrent.__init__(self, time, curr_value, curr_time)
         self.matrix = matrix
 
+    def compute_index(self, mesh):
+        """
+        Computes the flat indices of the stimulated tissue nodes.
+
+        Parameters
+        ----------
+        mesh : numpy.ndarray
+            The tissue mesh.
+
+        Returns
+        -------
+        numpy.ndarray
+            Flat (C-order) indices of the stimulated nodes.
+        """
+        return matrix_index(mesh, self.matrix)
+
     def stimulate(self, model):
         """
         Applies the stimulation current to the cardiac tissue model based on the specified binary matrix.
@@ -58,5 +75,4 @@ class StimCurrentMatrix2D(StimCurrent):
         in the `model.cardiac_tissue.mesh` is 1, the current value is added to `model.u`.
         """
         if not self.passed:
-            mask = (self.matrix > 0) & (model.cardiac_tissue.mesh == 1)
-            model.u[mask] += self._dt * self.curr_value
+            self.apply_current(model)
@@ -1,4 +1,7 @@
+import numpy as np
+
 from finitewave.core.stimulation.stim_voltage import StimVoltage
+from finitewave.core.stimulation.stim_kernels import roi_index, set_voltage, flat_view
 
 
 class StimVoltageCoord2D(StimVoltage):
@@ -47,6 +50,22 @@ class StimVoltageCoord2D(StimVoltage):
         self.y1 = y1
         self.y2 = y2
 
+    def compute_index(self, mesh):
+        """
+        Computes the flat indices of the stimulated tissue nodes.
+
+        Parameters
+        ----------
+        mesh : numpy.ndarray
+            The tissue mesh.
+
+        Returns
+        -------
+        numpy.ndarray
+            Flat (C-order) indices of the stimulated nodes.
+        """
+        return roi_index(mesh, np.s_[self.x1:self.x2, self.y1:self.y2])
+
     def stimulate(self, model):
         """
         Applies the voltage stimulus to the cardiac tissue model within the specified region of interest.
@@ -68,12 +87,4 @@ class StimVoltageCoord2D(StimVoltage):
         voltage should be applied. Only positions where the mesh value is 1 will be updated.
         """
         if not self.passed:
-            # Region of Interest (ROI) coordinates
-            roi_x1, roi_x2 = self.x1, self.x2
-            roi_y1, roi_y2 = self.y1, self.y2
-
-            roi_mesh = model.cardiac_tissue.mesh[roi_x1:roi_x2, roi_y1:roi_y2]
-
-            mask = (roi_mesh == 1)
-
-            model.u[roi_x1:roi_x2, roi_y1:roi_y2][mask] = self.volt_value
+            set_voltage(flat_view(model.u), self.node_index(model), self.volt_value)
@@ -1,4 +1,5 @@
 from finitewave.core.stimulation.stim_voltage import StimVoltage
+from finitewave.core.stimulation.stim_kernels import matrix_index, set_voltage, flat_view
 
 
 class StimVoltageMatrix2D(StimVoltage):
@@ -32,6 +33,22 @@ class StimVoltageMatrix2D(StimVoltage):
         StimVoltage.__init__(self, time, volt_value)
         self.matrix = matrix
 
+    def compute_index(self, mesh):
+        """
+        Computes the flat indices of the stimulated tissue nodes.
+
+        Parameters
+        ----------
+        mesh : numpy.ndarray
+            The tissue mesh.
+
+        Returns
+        -------
+        numpy.ndarray
+            Flat (C-order) indices of the stimulated nodes.
+        """
+        return matrix_index(mesh, self.matrix)
+
     def stimulate(self, model):
         """
         Applies the voltage stimulus to the cardiac tissue model based on the specified matrix.
@@ -52,5 +69,4 @@ class StimVoltageMatrix2D(StimVoltage):
         value in `matrix` is greater than 0, and the `model.cardiac_tissue.mesh` value is 1.
         """
         if not self.passed:
-            mask = (self.matrix > 0) & (model.cardiac_tissue.mesh == 1)
-            model.u[mask] = self.volt_value
+            set_voltage(flat_view(model.u), self.node_index(model), self.volt_value)
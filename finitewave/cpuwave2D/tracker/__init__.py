@@ -1,11 +1,14 @@
 from finitewave.cpuwave2D.tracker.action_potential_2d_tracker import ActionPotential2DTracker
 from finitewave.cpuwave2D.tracker.activation_time_2d_tracker import ActivationTime2DTracker
 from finitewave.cpuwave2D.tracker.animation_2d_tracker import Animation2DTracker
+from finitewave.cpuwave2D.tracker.apd_2d_tracker import APD2DTracker
 from finitewave.cpuwave2D.tracker.ecg_2d_tracker import ECG2DTracker
 from finitewave.cpuwave2D.tracker.multi_activation_time_2d_tracker import MultiActivationTime2DTracker
 from finitewave.cpuwave2D.tracker.multivariable_2d_tracker import MultiVariable2DTracker
 from finitewave.cpuwave2D.tracker.period_2d_tracker import Period2DTracker
 from finitewave.cpuwave2D.tracker.period_map_2d_tracker import PeriodMap2DTracker
+from finitewave.cpuwave2D.tracker.period_stats_2d_tracker import PeriodStats2DTracker
+from finitewave.cpuwave2D.tracker.preview_2d_tracker import Preview2DTracker
 from finitewave.cpuwave2D.tracker.spiral_2d_tracker import Spiral2DTracker
 from finitewave.cpuwave2D.tracker.variable_2d_tracker import Variable2DTracker
 from finitewave.cpuwave2D.tracker.velocity_2d_tracker import Velocity2DTracker
\ No newline at end of file
@@ -40,6 +40,7 @@ class ActionPotential2DTracker(Tracker):
         self.act_pot = np.array([])  # Initialize the array to store action potential
         self.cell_ind = [1, 1]       # Default cell indices to track
         self.file_name = "act_pot"   # Default file name for saving data
+        self.state_vars = ["act_pot"]  # Attributes saved in checkpoints
 
     def initialize(self, model):
         """
@@ -40,6 +40,7 @@ class ActivationTime2DTracker(Tracker):
         self.act_t = np.array([])       # Initialize the array to store activation times
         self.threshold = -40            # Default threshold for activation (in mV)
         self.file_name = "act_time_2d"  # Default file name for saving data
+        self.state_vars = ["act_t"]  # Attributes saved in checkpoints
 
     def initialize(self, model):
         """
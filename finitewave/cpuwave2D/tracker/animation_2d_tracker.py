@@ -2,23 +2,23 @@ import os
 import numpy as np
 
 from finitewave.core.tracker.tracker import Tracker
+from finitewave.tools.frame_store import FrameStore
 
 
 class Animation2DTracker(Tracker):
     """
     A class to track and save frames of a 2D cardiac tissue model simulation for animation purposes.
 
-    This tracker periodically saves the state of a specified target array from the model to disk as NumPy files,
-    which can later be used to create animations.
+    This tracker periodically saves the state of a specified target array from the model to disk, either as one
+    NumPy file per frame or appended to a single chunked HDF5 frame store, which can later be used to create
+    animations.
 
     Attributes
     ----------
-    step : int
-        Interval in time steps at which frames are saved.
+    step : float
+        Interval in model time units at which frames are saved.
     start : float
         The time at which to start recording frames.
-    _t : float
-        Internal counter for keeping track of the elapsed time since the last frame was saved.
     dir_name : str
         Directory name where animation frames are stored.
     _frame_n : int
@@ -31,6 +31,15 @@ class Animation2DTracker(Tracker):
         Internal storage for the data type of the saved frames.
     _frame_format_mult : float
         Internal storage for the multiplier for scaling the saved frames.
+    storage : str
+        Frame storage backend: "npy" (one file per frame in `dir_name`) or "h5" (single chunked
+        file `dir_name`.h5, see FrameStore).
+    complevel : int
+        Compression level of the "h5" storage (0 disables compression).
+    complib : str
+        Compression library of the "h5" storage.
+    async_write : bool
+        If True, frames are written by a background thread (see Tracker).
 
     Methods
     -------
@@ -40,6 +49,8 @@ class Animation2DTracker(Tracker):
         Saves frames based on the specified step interval and target array.
     write():
         No operation. Exists to fulfill the interface requirements.
+    finalize():
+        Closes the frame store.
     """
 
     def __init__(self):
@@ -49,7 +60,6 @@ class Animation2DTracker(Tracker):
         Tracker.__init__(self)
         self.step = 1  # Interval for frame capture
         self.start = 0  # Start time for capturing frames
-        self._t = 0  # Internal time counter
 
         self.dir_name = "animation"  # Directory for saving frames
 
@@ -66,6 +76,12 @@ class Animation2DTracker(Tracker):
         self._frame_format_type = ""  # Internal storage for frame format type
         self._frame_format_mult = 1  # Internal storage for frame format multiplier
 
+        self.storage = "npy"  # Frame storage backend: "npy" or "h5"
+        self.complevel = 0  # Compression level of the "h5" storage
+        self.complib = "blosc"  # Compression library of the "h5" storage
+        self._frame_store = None
+        self.state_vars = ["_frame_n"]  # Attributes saved in checkpoints
+
     def initialize(self, model):
         """
         Initializes the tracker with the simulation model and sets up directories for saving frames.
@@ -77,15 +93,21 @@ class Animation2DTracker(Tracker):
         """
         self.model = model
 
-        self._t = 0  # Reset internal time counter
         self._frame_n = 0  # Reset frame counter
         self._dt = self.model.dt  # Time step size from the model
-        self._step = self.step - self._dt  # Adjusted step for saving frames
+
+        # Schedule the tracker every `step` time units starting from `start`
+        self.start_step = self.model.time_to_step(self.start)
+        self.interval = max(1, self.model.time_to_step(self.step))
+
+        self.finalize()  # Close the frame store of a previous run
 
         # Create the directory for saving frames if it doesn't exist
-        if not os.path.exists(os.path.join(self.path, self.dir_name)):
+        if self.storage == "npy" and not os.path.exists(os.path.join(self.path, self.dir_name)):
             os.makedirs(os.path.join(self.path, self.dir_name))
 
+        self._start_writer()  # Start the background writer if async_write is set
+
         # Store frame format settings
         self._frame_format_type = self.frame_format["type"]
         self._frame_format_mult = self.frame_format["mult"]
@@ -96,23 +118,62 @@ class Animation2DTracker(Tracker):
 
         The frames are saved in the specified directory as NumPy files.
         """
-        # Only start tracking if the current model time is beyond the start time
-        if not self.model.t >= self.start:
-            return
-
-        # Save a frame if enough time has elapsed since the last frame
-        if self._t > self._step:
-            # Retrieve the target array from the model and scale it
-            frame = (self.model.__dict__[self.target_array] * self._frame_format_mult).astype(self._frame_format_type)
-            # Save the frame as a NumPy file
-            np.save(os.path.join(self.path, self.dir_name, str(self._frame_n)), frame)
-            self._frame_n += 1  # Increment frame counter
-            self._t = 0  # Reset internal time counter
+        # Retrieve the target array from the model and scale it
+        frame = (self.model.__dict__[self.target_array] * self._frame_format_mult).astype(self._frame_format_type)
+        self._save_frame(frame)
+
+    def _save_frame(self, frame):
+        """
+        Saves a frame with the selected storage backend, in the background writer if `async_write` is set.
+
+        Parameters
+        ----------
+        frame : np.ndarray
+            Frame to save. The frame is copied when it is written asynchronously.
+        """
+        self._submit(self._write_frame, frame, self._frame_n, self.model.t)
+        self._frame_n += 1  # Increment frame counter
+
+    def _write_frame(self, frame, frame_n, t):
+        """
+        Writes a frame with the selected storage backend.
+
+        Parameters
+        ----------
+        frame : np.ndarray
+            Frame to write.
+        frame_n : int
+            Frame number.
+        t : float
+            Model time of the frame.
+        """
+        if self.storage == "h5":
+            # The store is created on the first frame, when the shape and type of the frame are known. Later
+            # frames (a continued or resumed run) are appended to the store, which is cut to the frames
+            # recorded before them.
+            if self._frame_store is None:
+                self._frame_store = FrameStore(os.path.join(self.path, self.dir_name + ".h5"),
+                                               mode="w" if frame_n == 0 else "a",
+                                               shape=frame.shape, dtype=frame.dtype,
+                                               complevel=self.complevel, complib=self.complib,
+                                               dt=self.model.dt,
+                                               attrs={"step": self.step, "mult": self._frame_format_mult})
+                self._frame_store.truncate(frame_n)
+            self._frame_store.append(frame, t)
         else:
-            self._t += self._dt  # Increment internal time counter by the time step
+            np.save(os.path.join(self.path, self.dir_name, str(frame_n)), frame)
 
     def write(self):
         """
         No operation for this tracker. Exists to fulfill the interface requirements.
         """
         pass
+
+    def finalize(self):
+        """
+        Waits for the background writer and closes the frame store of the "h5" storage.
+        """
+        self._close_writer()
+        if self._frame_store is not None:
+            self._frame_store.close()
+            self._frame_store = None
@@ -0,0 +1,270 @@
+import os
+import numpy as np
+from numba import njit
+
+from finitewave.core.tracker.tracker import Tracker
+
+
+@njit
+def _track_apd(u, mesh, t, dt, threshold, fraction, state, u_prev, t_up, peak, rest, t_repol,
+               apd, count, events, n_events):
+    """
+    Numba-optimized function to advance the APD state machine of every node of a 2D mesh.
+
+    A node at rest (state 0) that crosses `threshold` upwards starts a beat (state 1). During the
+    beat the peak potential is followed; the beat ends when the potential falls below
+    ``peak - fraction * (peak - rest)``, where ``rest`` is the minimum potential of the preceding
+    rest period. The crossing times are interpolated linearly within the time step. Every completed
+    beat is written to the event buffer as (node, upstroke time, APD, diastolic interval).
+
+    Parameters
+    ----------
+    u : np.ndarray
+        The current potential values of the cardiac tissue.
+    mesh : np.ndarray
+        The tissue mesh. Only the nodes with ``mesh == 1`` are tracked.
+    t : float
+        The current simulation time.
+    dt : float
+        The time step.
+    threshold : float
+        The upstroke detection threshold.
+    fraction : float
+        The repolarization fraction (0.9 for APD90).
+    state, u_prev, t_up, peak, rest, t_repol : np.ndarray
+        State of the nodes (0 at rest, 1 during a beat), potential at the previous step, time of
+        the last upstroke, peak potential of the beat, minimum potential of the rest period and
+        time of the last repolarization (-1 if there is none yet).
+    apd : np.ndarray
+        APD of the last beat of the nodes.
+    count : np.ndarray
+        Number of completed beats of the nodes.
+    events : np.ndarray
+        Event buffer of shape (capacity, 4) with rows (node, upstroke time, APD, DI).
+    n_events : int
+        Number of events in the buffer.
+
+    Returns
+    -------
+    int
+        Updated number of events.
+    """
+    n_i, n_j = u.shape
+    for i in range(n_i):
+        for j in range(n_j):
+            if mesh[i, j] != 1:
+                continue
+            v = u[i, j]
+            v_prev = u_prev[i, j]
+            u_prev[i, j] = v
+            if np.isnan(v_prev):
+                rest[i, j] = v
+                continue
+
+            if state[i, j] == 0:
+                if v > threshold and v_prev <= threshold:
+                    state[i, j] = 1
+                    t_up[i, j] = t - dt + dt * (threshold - v_prev) / (v - v_prev)
+                    peak[i, j] = v
+                else:
+                    rest[i, j] = min(rest[i, j], v)
+                continue
+
+            peak[i, j] = max(peak[i, j], v)
+            level = peak[i, j] - fraction * (peak[i, j] - rest[i, j])
+            if v < level:
+                t_down = t - dt + dt * (level - v_prev) / (v - v_prev)
+                di = np.nan
+                if t_repol[i, j] >= 0:
+                    di = t_up[i, j] - t_repol[i, j]
+                apd[i, j] = t_down - t_up[i, j]
+                count[i, j] += 1
+                events[n_events, 0] = i * n_j + j
+                events[n_events, 1] = t_up[i, j]
+                events[n_events, 2] = apd[i, j]
+                events[n_events, 3] = di
+                n_events += 1
+
+                state[i, j] = 0
+                t_repol[i, j] = t_down
+                rest[i, j] = v
+
+    return n_events
+
+
+class APD2DTracker(Tracker):
+    """
+    A class to compute the action potential duration (APD) of every node of a 2D cardiac tissue
+    model online.
+
+    At every step from `start` a compiled per-node state machine detects the upstrokes (upward
+    crossings of `threshold`) and the repolarizations to `percent` % of the action potential
+    amplitude. Each completed beat is stored as an event (node, upstroke time, APD, diastolic
+    interval) in a compact buffer that grows as needed, so the memory is proportional to the number
+    of nodes and beats rather than to the number of steps. The events give tissue-wide APD
+    dispersion and restitution (APD against the preceding diastolic interval) without recording the
+    potential traces. A node whose potential is already above `threshold` when the tracking starts
+    (e.g. set by a voltage stimulus at the first step) begins its first beat at its next upstroke.
+
+    Attributes
+    ----------
+    threshold : float
+        The upstroke detection threshold.
+    percent : float
+        The repolarization level in percent of the action potential amplitude (90 for APD90).
+    start : float
+        The time from which the beats are tracked.
+    file_name : str
+        Name of the file where the events and maps are saved (without the ``.npz`` extension).
+    apd : np.ndarray
+        APD of the last completed beat of each node (NaN without beats).
+    count : np.ndarray
+        Number of completed beats of each node.
+
+    Methods
+    -------
+    initialize(model):
+        Initializes the tracker with the simulation model and preallocates the node states.
+    track():
+        Advances the state machine of every node.
+    events:
+        Property that returns the recorded beats.
+    beat_map(beat):
+        Returns the APD or DI map of a given beat of every node.
+    output:
+        Property that returns the recorded beats.
+    write():
+        Saves the events and the maps to a ``.npz`` file.
+    """
+
+    def __init__(self):
+        """
+        Initializes the APD2DTracker with default parameters.
+        """
+        Tracker.__init__(self)
+        self.threshold = -40.
+        self.percent = 90.
+        self.start = 0
+        self.file_name = "apd"
+
+        self.apd = np.array([])
+        self.count = np.array([])
+        self._state = np.array([])
+        self._u_prev = np.array([])
+        self._t_up = np.array([])
+        self._peak = np.array([])
+        self._rest = np.array([])
+        self._t_repol = np.array([])
+        self._events = np.zeros((0, 4))
+        self._n_events = 0
+        self._n_nodes = 0
+        self.state_vars = ["apd", "count", "_state", "_u_prev", "_t_up", "_peak", "_rest",
+                           "_t_repol", "_events", "_n_events"]
+
+    def initialize(self, model):
+        """
+        Initializes the tracker with the simulation model and preallocates the node states.
+
+        Parameters
+        ----------
+        model : object
+            The cardiac tissue model object containing the data to be tracked.
+        """
+        self.model = model
+        shape = self.model.u.shape
+
+        self.start_step = self.model.time_to_step(self.start)
+        self.interval = 1
+
+        self.apd = np.full(shape, np.nan)
+        self.count = np.zeros(shape, dtype=np.int32)
+        self._state = np.zeros(shape, dtype=np.uint8)
+        self._u_prev = np.full(shape, np.nan)
+        self._t_up = np.zeros(shape)
+        self._peak = np.zeros(shape)
+        self._rest = np.zeros(shape)
+        self._t_repol = -np.ones(shape)
+
+        # a step completes at most one beat per node
+        self._n_nodes = int(np.count_nonzero(self.model.cardiac_tissue.mesh == 1))
+        self._events = np.zeros((2 * self._n_nodes, 4))
+        self._n_events = 0
+
+    def track(self):
+        """
+        Advances the state machine of every node, growing the event buffer if it could overflow.
+        """
+        if len(self._events) - self._n_events < self._n_nodes:
+            self._events = np.concatenate([self._events, np.zeros_like(self._events)])
+
+        self._n_events = _track_apd(self.model.u, self.model.cardiac_tissue.mesh, self.model.t,
+                                    self.model.dt, self.threshold, self.percent / 100,
+                                    self._state, self._u_prev, self._t_up, self._peak,
+                                    self._rest, self._t_repol, self.apd, self.count,
+                                    self._events, self._n_events)
+
+    @property
+    def events(self):
+        """
+        Returns the recorded beats in the order of their repolarization.
+
+        Returns
+        -------
+        dict
+            Dictionary with the arrays ``node`` (indices of the nodes, shape (n_events, 2)),
+            ``start`` (upstroke times), ``apd`` and ``di`` (diastolic intervals, NaN for the first
+            beat of a node).
+        """
+        events = self._events[:self._n_events]
+        node = np.stack(np.unravel_index(events[:, 0].astype(np.int64), self.apd.shape), axis=-1)
+        return {"node": node, "start": events[:, 1], "apd": events[:, 2], "di": events[:, 3]}
+
+    def beat_map(self, beat, value="apd"):
+        """
+        Returns the APD or the diastolic interval of a given beat of every node.
+
+        Parameters
+        ----------
+        beat : int
+            Index of the beat of each node (0 for the first beat, -1 for the last one).
+        value : str, optional
+            ``"apd"`` (default) or ``"di"``.
+
+        Returns
+        -------
+        np.ndarray
+            Map of the values (NaN for nodes without the beat).
+        """
+        events = self._events[:self._n_events]
+        flat_node = events[:, 0].astype(np.int64)
+        count = self.count.reshape(-1)
+        # events are in time order per node, so the beat index is the running count per node
+        order = np.argsort(flat_node, kind="stable")
+        first = np.searchsorted(flat_node[order], flat_node[order])
+        index = np.empty(len(order), dtype=np.int64)
+        index[order] = np.arange(len(order)) - first
+
+        if beat < 0:
+            selected = index == count[flat_node] + beat
+        else:
+            selected = index == beat
+
+        beat_map = np.full(self.apd.size, np.nan)
+        column = 2 if value == "apd" else 3
+        beat_map[flat_node[selected]] = events[selected, column]
+        return beat_map.reshape(self.apd.shape)
+
+    @property
+    def output(self):
+        """
+        Returns the recorded beats (see `events`).
+        """
+        return self.events
+
+    def write(self):
+        """
+        Saves the events, the last APD map and the beat counts to the ``.npz`` file `file_name`
+        in `path`.
+        """
+        np.savez(os.path.join(self.path, self.file_name), apd_map=self.apd, count=self.count,
+                 **self.events)
@@ -49,6 +49,7 @@ class ECG2DTracker(Tracker):
         self.ecg = np.ndarray  # Placeholder for ECG data array
         self.step = 1  # Interval for ECG calculation
         self._index = 0  # Internal step counter
+        self.state_vars = ["ecg", "_index"]  # Attributes saved in checkpoints
 
     def initialize(self, model):
         """
@@ -60,6 +61,8 @@ class ECG2DTracker(Tracker):
             The cardiac tissue model object containing the data to be tracked.
         """
         self.model = model
+        self.interval = self.step  # Schedule the tracker every `step` steps
+        self._index = 0
         n = int(np.ceil(model.t_max / (self.step * model.dt)))  # Number of steps to save ECG data
         self.ecg = np.zeros((self.measure_points.shape[0], n))  # Initialize ECG array
 
@@ -91,12 +94,10 @@ class ECG2DTracker(Tracker):
         """
         Tracks and stores ECG signals at the specified intervals.
 
-        This method should be called at each time step of the simulation.
+        The tracker sequence calls this method every `step` simulation steps.
         """
-        # Only compute ECG if the current step is a multiple of the step interval
-        if self.model.step % self.step == 0:
-            self.ecg[:, self._index] = self.calc_ecg()  # Calculate and store ECG
-            self._index += 1  # Increment the step index
+        self.ecg[:, self._index] = self.calc_ecg()  # Calculate and store ECG
+        self._index += 1  # Increment the step index
 
     def write(self):
         """
@@ -44,6 +44,7 @@ class MultiActivationTime2DTracker(Tracker):
         self.act_t = np.array([])  # Initialize activation times as an empty array
         self.threshold = -40  # Activation threshold
         self.file_name = "multi_act_time_2d"  # Output file name
+        self.state_vars = ["act_t", "activated", "amount"]  # Attributes saved in checkpoints
 
     def initialize(self, model):
         """
@@ -40,6 +40,7 @@ class MultiVariable2DTracker(Tracker):
         self.cell_ind = [1, 1]  # Cell index to track variables
         self.dir_name = "multi_vars"  # Directory to save tracked variables
         self.vars = {}  # Dictionary to store tracked variables
+        self.state_vars = ["vars"]  # Attributes saved in checkpoints
 
     def initialize(self, model):
         """
@@ -96,6 +96,7 @@ class Period2DTracker(Tracker):
         self._step = 0  # Current index in the periods array
 
         self.file_name = "period"  # File name for saving tracked data
+        self.state_vars = ["_periods", "_detectors_state", "_step"]  # Attributes saved in checkpoints
 
     def initialize(self, model):
         """
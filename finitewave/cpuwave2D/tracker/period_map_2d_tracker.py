@@ -1,4 +1,3 @@
-import os
 import numpy as np
 
 from finitewave.cpuwave2D.tracker.animation_2d_tracker import Animation2DTracker
@@ -43,6 +42,7 @@ class PeriodMap2DTracker(Animation2DTracker):
         self.threshold = -40.  # Threshold potential value for activation detection
         self.period_map = np.array([])  # Array to store activation periods
         self._period_map_state = np.array([])  # Array to store state of each cell for activation tracking
+        self.state_vars += ["period_map", "_last_time_map", "_period_map_state"]  # Attributes saved in checkpoints
 
     def initialize(self, model):
         """
@@ -68,28 +68,21 @@ class PeriodMap2DTracker(Animation2DTracker):
         This method calculates the time interval between successive activations for each cell,
         updates the period map, and saves it to a file.
         """
-        # Check if the time to save a frame has been reached
-        if self._t > self.step:
-            # Identify active nodes where the state is 1 and the potential exceeds the threshold
-            active_nodes = np.logical_and(self._period_map_state == 1, self.model.u > self.threshold)
-            
-            # Update the period map with the time interval between successive activations
-            self.period_map[active_nodes] = self.model.t - self._last_time_map[active_nodes]
-            
-            # Update the last activation time for active nodes
-            self._last_time_map[active_nodes] = self.model.t
-            
-            # Update the state of the nodes based on their potential values
-            self._period_map_state[active_nodes] = 0
-            self._period_map_state[np.logical_and(self._period_map_state == 0, self.model.u < self.threshold)] = 1
-
-            # Save the current period map to a file
-            np.save(os.path.join(self.path, self.dir_name, str(self._frame_n)), self.period_map)
-            self._frame_n += 1  # Increment the frame counter
-            self._t = 0  # Reset the time counter
-        else:
-            # Increment the time counter if the frame interval has not been reached
-            self._t += self._dt
+        # Identify active nodes where the state is 1 and the potential exceeds the threshold
+        active_nodes = np.logical_and(self._period_map_state == 1, self.model.u > self.threshold)
+        
+        # Update the period map with the time interval between successive activations
+        self.period_map[active_nodes] = self.model.t - self._last_time_map[active_nodes]
+        
+        # Update the last activation time for active nodes
+        self._last_time_map[active_nodes] = self.model.t
+        
+        # Update the state of the nodes based on their potential values
+        self._period_map_state[active_nodes] = 0
+        self._period_map_state[np.logical_and(self._period_map_state == 0, self.model.u < self.threshold)] = 1
+
+        # Save the current period map
+        self._save_frame(self.period_map)
 
     def write(self):
         """
@@ -0,0 +1,240 @@
+import os
+import numpy as np
+from numba import njit
+
+from finitewave.core.tracker.tracker import Tracker
+from finitewave.tools.frame_store import FrameStore
+
+
+@njit
+def _track_period_stats(u, mesh, t, threshold, state, last_time, count, mean, m2, last_period):
+    """
+    Numba-optimized function to update the running cycle length statistics of a 2D mesh.
+
+    An activation is an upward crossing of the threshold. The cycle length between successive
+    activations of a node updates its mean and sum of squared deviations (Welford's algorithm).
+
+    Parameters
+    ----------
+    u : np.ndarray
+        The current potential values of the cardiac tissue.
+    mesh : np.ndarray
+        The tissue mesh. Only the nodes with ``mesh == 1`` are tracked.
+    t : float
+        The current simulation time.
+    threshold : float
+        The threshold value above which an activation is detected.
+    state : np.ndarray
+        State of the nodes (1 if below threshold, 0 if above).
+    last_time : np.ndarray
+        Time of the last activation of the nodes (-1 if not activated yet).
+    count : np.ndarray
+        Number of cycles of the nodes.
+    mean : np.ndarray
+        Mean cycle length of the nodes.
+    m2 : np.ndarray
+        Sum of squared deviations from the mean cycle length of the nodes.
+    last_period : np.ndarray
+        Last cycle length of the nodes (-1 if there is none yet).
+    """
+    n_i, n_j = u.shape
+    for i in range(n_i):
+        for j in range(n_j):
+            if mesh[i, j] != 1:
+                continue
+            if state[i, j] == 1 and u[i, j] > threshold:
+                state[i, j] = 0
+                if last_time[i, j] >= 0:
+                    period = t - last_time[i, j]
+                    count[i, j] += 1
+                    delta = period - mean[i, j]
+                    mean[i, j] += delta / count[i, j]
+                    m2[i, j] += delta * (period - mean[i, j])
+                    last_period[i, j] = period
+                last_time[i, j] = t
+            elif state[i, j] == 0 and u[i, j] < threshold:
+                state[i, j] = 1
+
+
+class PeriodStats2DTracker(Tracker):
+    """
+    A class to compute the period and dominant frequency maps of a 2D cardiac tissue model online.
+
+    At every step from `start` the tracker detects the activations of each node (upward crossings of
+    `threshold`) and keeps running statistics of the cycle lengths in a compiled kernel: the time of
+    the last activation, the number of cycles and the mean and variance of the cycle length. Only the
+    final maps are written (one ``.npz`` file); optionally the map of the last cycle lengths is also
+    stored every `frame_step` time units as frames of a FrameStore.
+
+    Attributes
+    ----------
+    threshold : float
+        The threshold potential value for detecting activations.
+    start : float
+        The time from which the activations are tracked (to skip the initial transient).
+    frame_step : float
+        Interval in model time units between frames of the last cycle lengths. Default is 0 (no frames).
+    dir_name : str
+        Name of the frame store (without the ``.h5`` extension).
+    file_name : str
+        Name of the file with the final maps (without the ``.npz`` extension).
+    count : np.ndarray
+        Number of cycles of each node.
+    last_period : np.ndarray
+        Last cycle length of each node (-1 if there is none yet).
+    _frame_n : int
+        Number of frames stored so far. A continued or resumed run appends its frames to the store.
+
+    Methods
+    -------
+    initialize(model):
+        Initializes the tracker with the simulation model and preallocates the statistics.
+    track():
+        Updates the statistics with the current step.
+    mean_period:
+        Property that returns the mean cycle length of each node (NaN without cycles).
+    std_period:
+        Property that returns the standard deviation of the cycle length (NaN with less than two cycles).
+    dominant_frequency:
+        Property that returns the inverse of the mean cycle length (NaN without cycles).
+    output:
+        Property that returns a dictionary with the maps.
+    write():
+        Saves the maps to a ``.npz`` file.
+    finalize():
+        Closes the frame store.
+    """
+
+    def __init__(self):
+        """
+        Initializes the PeriodStats2DTracker with default parameters.
+        """
+        Tracker.__init__(self)
+        self.threshold = -40.
+        self.start = 0
+        self.frame_step = 0
+        self.dir_name = "period"
+        self.file_name = "period_stats"
+
+        self.count = np.array([])
+        self.last_period = np.array([])
+        self._state = np.array([])
+        self._last_time = np.array([])
+        self._mean = np.array([])
+        self._m2 = np.array([])
+        self._frame_interval = 0
+        self._frame_n = 0
+        self._frame_store = None
+        self.state_vars = ["count", "last_period", "_state", "_last_time", "_mean", "_m2", "_frame_n"]
+
+    def initialize(self, model):
+        """
+        Initializes the tracker with the simulation model and preallocates the statistics.
+
+        Parameters
+        ----------
+        model : object
+            The cardiac tissue model object containing the data to be tracked.
+        """
+        self.model = model
+        shape = self.model.u.shape
+
+        self.start_step = self.model.time_to_step(self.start)
+        self.interval = 1
+        self._frame_interval = max(1, self.model.time_to_step(self.frame_step)) if self.frame_step else 0
+
+        self.count = np.zeros(shape, dtype=np.int32)
+        self.last_period = -np.ones(shape)
+        self._state = np.ones(shape, dtype=np.uint8)
+        self._last_time = -np.ones(shape)
+        self._mean = np.zeros(shape)
+        self._m2 = np.zeros(shape)
+        self._frame_n = 0
+
+        self.finalize()  # Close the frame store of a previous run
+        self._start_writer()  # Start the background writer if async_write is set
+
+    def track(self):
+        """
+        Updates the statistics with the current step and stores a frame if one is due.
+        """
+        _track_period_stats(self.model.u, self.model.cardiac_tissue.mesh, self.model.t,
+                            self.threshold, self._state, self._last_time, self.count,
+                            self._mean, self._m2, self.last_period)
+
+        if self._frame_interval and (self.model.step - self.start_step) % self._frame_interval == 0:
+            self._submit(self._write_frame, self.last_period.astype(np.float32), self._frame_n,
+                         self.model.t)
+            self._frame_n += 1
+
+    def _write_frame(self, frame, frame_n, t):
+        """
+        Appends a frame to the frame store, which is opened with the first frame of a run.
+
+        The store is created anew by the first frame of the simulation; the frames of a continued or
+        resumed run are appended to it after the `frame_n` frames recorded before them.
+        """
+        if self._frame_store is None:
+            self._frame_store = FrameStore(os.path.join(self.path, self.dir_name + ".h5"),
+                                           mode="w" if frame_n == 0 else "a",
+                                           shape=frame.shape, dtype=frame.dtype, dt=self.model.dt,
+                                           attrs={"step": self.frame_step})
+            self._frame_store.truncate(frame_n)
+        self._frame_store.append(frame, t)
+
+    @property
+    def mean_period(self):
+        """
+        Returns the mean cycle length of each node (NaN for nodes without cycles).
+        """
+        return np.where(self.count > 0, self._mean, np.nan)
+
+    @property
+    def std_period(self):
+        """
+        Returns the standard deviation of the cycle length of each node (NaN for nodes with less than
+        two cycles).
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > 1, np.sqrt(self._m2 / (self.count - 1)), np.nan)
+
+    @property
+    def dominant_frequency(self):
+        """
+        Returns the dominant frequency of each node, the inverse of its mean cycle length, in inverse
+        model time units (NaN for nodes without cycles).
+        """
+        with np.errstate(divide="ignore"):
+            return 1. / self.mean_period
+
+    @property
+    def output(self):
+        """
+        Returns the maps of the tracker.
+
+        Returns
+        -------
+        dict
+            Dictionary with the ``mean_period``, ``std_period``, ``dominant_frequency``,
+            ``last_period`` and ``count`` maps.
+        """
+        return {"mean_period": self.mean_period,
+                "std_period": self.std_period,
+                "dominant_frequency": self.dominant_frequency,
+                "last_period": self.last_period,
+                "count": self.count}
+
+    def write(self):
+        """
+        Saves the maps to the ``.npz`` file `file_name` in `path`.
+        """
+        np.savez(os.path.join(self.path, self.file_name), **self.output)
+
+    def finalize(self):
+        """
+        Waits for the background writer and closes the frame store.
+        """
+        self._close_writer()
+        if self._frame_store is not None:
+            self._frame_store.close()
+            self._frame_store = None
@@ -0,0 +1,221 @@
+import os
+import numpy as np
+from numba import njit
+import matplotlib
+
+from finitewave.core.tracker.tracker import Tracker
+from finitewave.tools.frame_store import FrameStore
+from finitewave.tools.frame_renderer import FFMpegPipe
+
+
+@njit
+def _render_preview(out, u, mesh, factor, block_mean, vmin, vmax, lut):
+    """
+    Numba-optimized function to downsample a 2D array and map it to RGB colours.
+
+    Parameters
+    ----------
+    out : np.ndarray
+        Output RGB array of shape (ceil(n_i / factor), ceil(n_j / factor), 3).
+    u : np.ndarray
+        The 2D array to render.
+    mesh : np.ndarray
+        The tissue mesh. Only the nodes with ``mesh == 1`` are rendered; pixels without tissue
+        nodes keep the background colour.
+    factor : int
+        The downsampling factor.
+    block_mean : bool
+        If True, each pixel is the mean of the tissue nodes of its block; otherwise it is the
+        first node of the block (strided downsampling).
+    vmin, vmax : float
+        The value range mapped to the colour table.
+    lut : np.ndarray
+        Colour table of shape (256, 3) (uint8).
+    """
+    n_i, n_j = u.shape
+    scale = 255. / (vmax - vmin)
+    for pi in range(out.shape[0]):
+        for pj in range(out.shape[1]):
+            i0 = pi * factor
+            j0 = pj * factor
+            if block_mean:
+                total = 0.
+                count = 0
+                for i in range(i0, min(i0 + factor, n_i)):
+                    for j in range(j0, min(j0 + factor, n_j)):
+                        if mesh[i, j] == 1:
+                            total += u[i, j]
+                            count += 1
+                if count == 0:
+                    out[pi, pj, :] = 0
+                    continue
+                value = total / count
+            else:
+                if mesh[i0, j0] != 1:
+                    out[pi, pj, :] = 0
+                    continue
+                value = u[i0, j0]
+
+            index = int((value - vmin) * scale + 0.5)
+            index = min(max(index, 0), 255)
+            out[pi, pj, :] = lut[index]
+
+
+class Preview2DTracker(Tracker):
+    """
+    A class to record a low-resolution colour preview of a 2D simulation during the run.
+
+    At every recorded step the target array is downsampled (strided or by block means) and mapped
+    to RGB colours in a compiled kernel. The uint8 frames are either streamed to an ffmpeg process
+    that encodes a movie (``storage="ffmpeg"``) or appended to a compact uint8 frame store
+    (``storage="h5"``, see FrameStore), so no full-resolution frames are written and no rendering
+    is needed after the run. The frames of a continued run (``run(initialize=False)``) are appended
+    to the frame store, while the movie is written anew by each run.
+
+    Attributes
+    ----------
+    step : float
+        Interval in model time units at which frames are recorded.
+    start : float
+        The time at which to start recording frames.
+    target_array : str
+        The name of the model attribute to render.
+    factor : int
+        The downsampling factor.
+    mode : str
+        Downsampling mode: "stride" (every `factor`-th node) or "mean" (mean of `factor` x `factor`
+        blocks).
+    vmin : float
+        The value mapped to the first colour of the colormap.
+    vmax : float
+        The value mapped to the last colour of the colormap.
+    cmap : str
+        Name of the matplotlib colormap.
+    storage : str
+        "ffmpeg" to encode a movie `file_name`.mp4 or "h5" to store the frames in `file_name`.h5.
+    fps : float
+        Frame rate of the movie.
+    complevel : int
+        Compression level of the "h5" storage (0 disables compression).
+    complib : str
+        Compression library of the "h5" storage.
+    file_name : str
+        Name of the output file (without extension).
+    _frame_n : int
+        Number of frames recorded since the tracker was initialized.
+
+    Methods
+    -------
+    initialize(model):
+        Initializes the tracker with the simulation model and prepares the colour table.
+    track():
+        Renders the preview frame and hands it to the encoder or the frame store.
+    write():
+        No operation. Exists to fulfill the interface requirements.
+    finalize():
+        Finishes the movie or closes the frame store.
+    """
+
+    def __init__(self):
+        """
+        Initializes the Preview2DTracker with default parameters.
+        """
+        Tracker.__init__(self)
+        self.step = 1
+        self.start = 0
+        self.target_array = "u"
+        self.factor = 4
+        self.mode = "mean"
+        self.vmin = 0
+        self.vmax = 1
+        self.cmap = "viridis"
+        self.storage = "ffmpeg"
+        self.fps = 25
+        self.complevel = 0
+        self.complib = "blosc"
+        self.file_name = "preview"
+
+        self._frame_n = 0
+        self._lut = np.array([])
+        self._output = None
+        self.state_vars = ["_frame_n"]
+
+    def initialize(self, model):
+        """
+        Initializes the tracker with the simulation model and prepares the colour table.
+
+        Parameters
+        ----------
+        model : object
+            The cardiac tissue model object containing the data to be tracked.
+        """
+        self.model = model
+
+        if self.mode not in ("stride", "mean"):
+            raise ValueError("Preview mode must be 'stride' or 'mean'")
+        if self.storage not in ("ffmpeg", "h5"):
+            raise ValueError("Preview storage must be 'ffmpeg' or 'h5'")
+        if self.vmax == self.vmin:
+            raise ValueError("Preview vmax must differ from vmin")
+
+        # Schedule the tracker every `step` time units starting from `start`
+        self.start_step = self.model.time_to_step(self.start)
+        self.interval = max(1, self.model.time_to_step(self.step))
+        self._frame_n = 0
+
+        self.finalize()  # Close the output of a previous run
+
+        colors = matplotlib.colormaps[self.cmap](np.linspace(0, 1, 256))[:, :3]
+        self._lut = np.round(colors * 255).astype(np.uint8)
+
+        self._start_writer()  # Start the background writer if async_write is set
+
+    def track(self):
+        """
+        Renders the preview frame and hands it to the encoder or the frame store.
+        """
+        u = self.model.__dict__[self.target_array]
+        shape = (-(-u.shape[0] // self.factor), -(-u.shape[1] // self.factor), 3)
+        frame = np.empty(shape, dtype=np.uint8)
+        _render_preview(frame, u, self.model.cardiac_tissue.mesh, self.factor,
+                        self.mode == "mean", self.vmin, self.vmax, self._lut)
+        self._submit(self._write_frame, frame, self._frame_n, self.model.t)
+        self._frame_n += 1
+
+    def _write_frame(self, frame, frame_n, t):
+        """
+        Writes a frame to the encoder or the frame store, which is opened with the first frame.
+        """
+        if self._output is None:
+            path = os.path.join(self.path, self.file_name)
+            if self.storage == "ffmpeg":
+                self._output = FFMpegPipe(path + ".mp4", self.fps)
+            else:
+                # a new store for the first frame; later frames (a continued or resumed run) are
+                # appended to the frames recorded before them
+                self._output = FrameStore(path + ".h5", mode="w" if frame_n == 0 else "a",
+                                          shape=frame.shape, dtype=frame.dtype,
+                                          complevel=self.complevel, complib=self.complib,
+                                          dt=self.model.dt,
+                                          attrs={"step": self.step, "factor": self.factor})
+                self._output.truncate(frame_n)
+
+        if self.storage == "ffmpeg":
+            self._output.write(frame)
+        else:
+            self._output.append(frame, t)
+
+    def write(self):
+        """
+        No operation for this tracker. Exists to fulfill the interface requirements.
+        """
+        pass
+
+    def finalize(self):
+        """
+        Waits for the background writer and finishes the movie or closes the frame store.
+        """
+        self._close_writer()
+        if self._output is not None:
+            output, self._output = self._output, None
+            output.close()
@@ -5,6 +5,7 @@ import warnings
 from numba import njit
 
 from finitewave.core.tracker.tracker import Tracker
+from finitewave.tools.tip_trajectories import TipTrajectories
 
 
 @njit
@@ -177,13 +178,20 @@ class Spiral2DTracker(Tracker):
     file_name : str
         Name of the output file where spiral tip data is saved.
     swcore : list
-        List to store detected spiral wave core positions.
+        List to store detected spiral wave core positions as
+        ``[t, id, x, y]`` rows, where ``id`` is the trajectory id of the tip.
+    link_radius : float
+        Maximum distance (model units) between tips detected at successive
+        steps to be linked into the same trajectory.
+    max_gap : float
+        Maximum time a trajectory may stay undetected before it is closed.
+    tip_trajectories : TipTrajectories
+        Persistent tip trajectories with incrementally updated drift,
+        lifetime and meander.
     all : bool
         Flag to determine whether all tips or only first few are tracked.
-    step : int
-        Interval of steps for saving the spiral wave tips.
-    _t : float
-        Internal timer to track the current simulation time.
+    step : float
+        Interval in model time units between tip detections.
     _u_prev_step : np.ndarray
         Array to store the voltage values from the previous time step.
     _tipdata : np.ndarray
@@ -201,6 +209,12 @@ class Spiral2DTracker(Tracker):
         Saves the tracked spiral tip data to a file.
     output:
         Property that returns the tracked spiral core data.
+    trajectories:
+        Property that returns the points of each tip trajectory.
+    get_state():
+        Returns the tracked data to be stored in a checkpoint.
+    set_state(state):
+        Restores the tracked data from a checkpoint.
     """
 
     def __init__(self):
@@ -214,11 +228,14 @@ class Spiral2DTracker(Tracker):
         self.threshold = 0.2
         self.file_name = "swcore.txt"
         self.swcore = []
+        self.link_radius = 1.
+        self.max_gap = 0.
+        self.tip_trajectories = TipTrajectories()
 
         self.all = False
         self.step = 1
-        self._t = 0
         self._u_prev_step = np.array([])
+        self.state_vars = ["swcore", "tip_trajectories", "_u_prev_step"]
 
     def initialize(self, model):
         """
@@ -233,8 +250,11 @@ class Spiral2DTracker(Tracker):
         self.size_i, self.size_j = self.model.cardiac_tissue.shape
         self.dt = self.model.dt
         self.dr = self.model.dr
+        self.interval = max(1, self.model.time_to_step(self.step))
         self._u_prev_step = np.zeros([self.size_i, self.size_j])
         self._tipdata = np.zeros([102, 2])
+        self.swcore = []
+        self.tip_trajectories = TipTrajectories(self.link_radius, self.max_gap)
 
     def track_tipline(self, var1, var2, tipvals, tipdata, tipsfound):
         """
@@ -265,28 +285,25 @@ class Spiral2DTracker(Tracker):
         The tracker is updated at each simulation step, detecting any spiral tips
         based on the voltage data from the previous and current steps.
         """
-        if self._t > self.step:
-            tipvals = [0, 0]
-            tipvals[0] = self.threshold
-            tipvals[1] = self.threshold
+        tipvals = [0, 0]
+        tipvals[0] = self.threshold
+        tipvals[1] = self.threshold
 
-            tipsfound = 0
+        tipsfound = 0
 
-            self._tipdata, tipsfound = self.track_tipline(self._u_prev_step, self.model.u, tipvals, self._tipdata, tipsfound)
+        self._tipdata, tipsfound = self.track_tipline(self._u_prev_step, self.model.u, tipvals, self._tipdata, tipsfound)
 
-            if self.all:
-                if not tipsfound:
-                    self.swcore.append([self.model.t, 0, -1, -1])
+        if self.all:
+            if not tipsfound:
+                self.swcore.append([self.model.t, -1, -1, -1])
 
-            for i in range(tipsfound):
-                self.swcore.append([self.model.t, i])
-                for j in range(2):
-                    self.swcore[-1].append(self._tipdata[i][j] * self.dr)
+        positions = self._tipdata[:tipsfound] * self.dr
+        ids = self.tip_trajectories.update(self.model.t, positions)
 
-            self._u_prev_step = np.copy(self.model.u)
-            self._t = 0
-        else:
-            self._t += self.dt
+        for i in range(tipsfound):
+            self.swcore.append([self.model.t, ids[i], *positions[i]])
+
+        self._u_prev_step = np.copy(self.model.u)
 
     def write(self):
         """
@@ -305,3 +322,43 @@ class Spiral2DTracker(Tracker):
             List of tracked spiral core data.
         """
         return self.swcore
+
+    @property
+    def trajectories(self):
+        """
+        Get the points of each tip trajectory.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping trajectory id to an array of ``[t, x, y]``
+            rows.
+        """
+        return self.tip_trajectories.trajectories
+
+    def get_state(self):
+        """
+        Returns the tracked data to be stored in a checkpoint, with the tip
+        trajectories as plain data (see `TipTrajectories.get_state`).
+
+        Returns
+        -------
+        dict
+            Dictionary with the copied attributes.
+        """
+        state = Tracker.get_state(self)
+        state["tip_trajectories"] = self.tip_trajectories.get_state()
+        return state
+
+    def set_state(self, state):
+        """
+        Restores the tracked data saved by `get_state`.
+
+        Parameters
+        ----------
+        state : dict
+            Dictionary with the copied attributes.
+        """
+        Tracker.set_state(self, {**state, "tip_trajectories": None})
+        self.tip_trajectories = TipTrajectories(self.link_radius, self.max_gap)
+        self.tip_trajectories.set_state(state["tip_trajectories"])
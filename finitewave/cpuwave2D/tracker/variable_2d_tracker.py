@@ -31,6 +31,7 @@ class Variable2DTracker(Tracker):
         self.cell_ind = [1, 1]
         self.dir_name = "multi_vars"
         self.vars = {}
+        self.state_vars = ["vars"]
 
     def initialize(self, model):
         """
@@ -4,6 +4,7 @@ from scipy.spatial.distance import euclidean
 import json
 
 from finitewave.cpuwave2D.tracker.activation_time_2d_tracker import ActivationTime2DTracker
+from finitewave.tools.conduction_velocity import conduction_velocity
 
 
 def _local_velocity(act_t):
@@ -87,6 +88,26 @@ class Velocity2DTracker(ActivationTime2DTracker):
             front_vel[i] = euclidean(ind_stim[near_ind], ind_f)*dr/max_act
         return front_vel
 
+    def compute_velocity_field(self, method="lsq", radius=1):
+        """
+        Computes the conduction velocity vector of every node from the activation times.
+
+        Parameters
+        ----------
+        method : str, optional
+            ``"lsq"`` (least-squares fit over the neighbourhood, default) or ``"gradient"``
+            (central differences). See `conduction_velocity`.
+        radius : int, optional
+            Radius of the neighbourhood of the ``"lsq"`` method. Default is 1.
+
+        Returns
+        -------
+        numpy.ndarray
+            3D array of shape (*act_t.shape, 2) with the velocity vectors (NaN where undefined).
+        """
+        return conduction_velocity(self.act_t, self.model.dr, self.model.cardiac_tissue.mesh,
+                                   method, radius)
+
     @property
     def output(self):
         """
@@ -1,8 +1,11 @@
 
-from finitewave.cpuwave3D.fibrosis import Diffuse3DPattern, Structural3DPattern
+from finitewave.cpuwave3D.fibers import RotationalAnisotropy, RuleBasedAnisotropy
+from finitewave.cpuwave3D.fibrosis import Correlated3DPattern, Diffuse3DPattern, Structural3DPattern
 from finitewave.cpuwave3D.model import (
     diffuse_kernel_3d_iso,
     diffuse_kernel_3d_aniso,
+    diffuse_kernel_3d_iso_ext,
+    diffuse_kernel_3d_aniso_ext,
     _parallel,
     AlievPanfilov3D,
     AlievPanfilovKernels3D,
@@ -30,9 +33,11 @@ from finitewave.cpuwave3D.tracker import (
     ActionPotential3DTracker,
     ActivationTime3DTracker,
     AnimationSlice3DTracker,
+    APD3DTracker,
     ECG3DTracker,
     Period3DTracker,
     PeriodMap3DTracker,
+    PeriodStats3DTracker,
     Spiral3DTracker,
     Variable3DTracker,
     Velocity3DTracker,
@@ -1 +1,2 @@
-from finitewave.cpuwave3D.fibers.rotational_anisotropy  import RotationalAnisotropy
\ No newline at end of file
+from finitewave.cpuwave3D.fibers.rotational_anisotropy import RotationalAnisotropy
+from finitewave.cpuwave3D.fibers.rule_based_anisotropy import RuleBasedAnisotropy
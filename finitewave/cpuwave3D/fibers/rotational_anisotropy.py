@@ -1,5 +1,4 @@
 import numpy as np
-import math
 
 class RotationalAnisotropy:
     """
@@ -18,7 +17,7 @@ class RotationalAnisotropy:
 
     Methods
     -------
-    generate_fibers():
+    generate_fibers(mesh=None, dtype=np.float64):
         Generates and returns a 3D array of fibers with rotational anisotropy applied.
     test(fibers):
         Visualizes the generated fibers using a 3D quiver plot.
@@ -33,48 +32,56 @@ class RotationalAnisotropy:
         self.axis = 0
         self.init_v = [1, 0, 0]
 
-    def generate_fibers(self):
+    def generate_fibers(self, mesh=None, dtype=np.float64):
         """
         Generates a 3D array of fiber orientations based on rotational anisotropy.
 
         The fibers are initially aligned along `init_v` and then rotated according to the 
         specified range of angles (`alpha`) along the specified axis (`axis`).
 
+        The rotated vector depends only on the position along `axis`, so it is computed once for
+        each layer and broadcast over the grid.
+
+        Parameters
+        ----------
+        mesh : numpy.ndarray, optional
+            The tissue mesh of shape `size`. If given, the fibers are set only in the tissue nodes
+            (``mesh > 0``) and are zero elsewhere.
+        dtype : numpy.dtype, optional
+            The data type of the fibers array (e.g. ``np.float32`` to halve the memory).
+            Default is ``np.float64``.
+
         Returns
         -------
         numpy.ndarray
             A 4D NumPy array of shape (size[0], size[1], size[2], 3) containing the fiber vectors.
+
+        Raises
+        ------
+        ValueError
+            If the shape of `mesh` does not match `size`.
         """
-        fibers = np.zeros(list(self.size) + [3])
-        fibers[:,:,:,0] = self.init_v[0]
-        fibers[:,:,:,1] = self.init_v[1]
-        fibers[:,:,:,2] = self.init_v[2]
-        alpha_step = (self.alpha[1] - self.alpha[0])/self.size[self.axis]
-
-        c_fibers = np.copy(fibers)
-
-        for i in range(self.size[0]):
-            for j in range(self.size[1]):
-                for k in range(self.size[2]):
-                    c = i
-                    v = [1, 2]
-                    if self.axis == 1:
-                        c = j
-                        v = [0, 2]
-                    elif self.axis == 2:
-                        c = k
-                        v = [0, 1]
-
-                    ang = math.radians(self.alpha[0] + alpha_step*c)
-
-                    fibers[i, j, k, v[0]] = c_fibers[i, j, k, v[0]]*math.cos(ang) + c_fibers[i, j, k, v[1]]*math.sin(ang)
-                    fibers[i, j, k, v[1]] = -c_fibers[i, j, k, v[0]]*math.sin(ang) + c_fibers[i, j, k, v[1]]*math.cos(ang)
-
-                    norm = math.sqrt(fibers[i, j, k, 0]**2 + fibers[i, j, k, 1]**2 + fibers[i, j, k, 2]**2)
-
-                    fibers[i, j, k, 0] /= norm
-                    fibers[i, j, k, 1] /= norm
-                    fibers[i, j, k, 2] /= norm
+        if mesh is not None and np.shape(mesh) != tuple(self.size):
+            raise ValueError("Mesh shape must match the size of the fibers grid")
+
+        n = self.size[self.axis]
+        v = [[1, 2], [0, 2], [0, 1]][self.axis]
+        alpha_step = (self.alpha[1] - self.alpha[0])/n
+        ang = np.radians(self.alpha[0] + alpha_step*np.arange(n))
+
+        layers = np.zeros((n, 3))
+        layers[:] = self.init_v
+        layers[:, v[0]] = self.init_v[v[0]]*np.cos(ang) + self.init_v[v[1]]*np.sin(ang)
+        layers[:, v[1]] = -self.init_v[v[0]]*np.sin(ang) + self.init_v[v[1]]*np.cos(ang)
+        layers /= np.sqrt(np.sum(layers**2, axis=1))[:, np.newaxis]
+
+        shape = [1, 1, 1, 3]
+        shape[self.axis] = n
+        fibers = np.empty(list(self.size) + [3], dtype=dtype)
+        fibers[:] = layers.reshape(shape)
+
+        if mesh is not None:
+            fibers[np.asarray(mesh) <= 0] = 0
 
         return fibers
 
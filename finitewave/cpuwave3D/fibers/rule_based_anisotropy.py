@@ -0,0 +1,265 @@
+import numpy as np
+from scipy import ndimage
+
+from finitewave.cpuwave3D.model.diffuse_kernels_3d import diffuse_kernel_3d_iso
+from finitewave.cpuwave3D.stencil.isotropic_stencil_3d import IsotropicStencil3D
+
+
+class RuleBasedAnisotropy:
+    """
+    A class to generate fiber orientations on an arbitrary 3D ventricle mesh with a rule-based method.
+
+    Two Laplace problems are solved on the tissue nodes of the mesh: a transmural one (0 at the
+    endocardium, 1 at the epicardium) and an apico-basal one (0 at the apex, 1 at the base). The
+    gradients of the solutions define a local coordinate system (transmural, longitudinal and
+    circumferential directions) in which the fibers are rotated by the helix angle, which changes
+    linearly from `alpha_endo` to `alpha_epi` across the wall, and optionally by the transverse angle
+    (`beta_endo`, `beta_epi`) towards the transmural direction.
+
+    The Laplace operator is built from the isotropic stencil weights and applied with the isotropic
+    diffusion kernel, so no-flux conditions hold on the tissue boundary. The Laplace problems are solved
+    with the conjugate gradient method preconditioned by the diagonal of the operator.
+
+    Attributes
+    ----------
+    alpha_endo : float
+        Helix angle (degrees) at the endocardium. Default is 60.
+    alpha_epi : float
+        Helix angle (degrees) at the epicardium. Default is -60.
+    beta_endo : float
+        Transverse angle (degrees) at the endocardium. Default is 0.
+    beta_epi : float
+        Transverse angle (degrees) at the epicardium. Default is 0.
+    tol : float
+        Relative tolerance of the Laplace solver. Default is 1e-6.
+    max_iter : int
+        Maximum number of iterations of the Laplace solver. Default is 10000.
+    transmural : numpy.ndarray
+        Solution of the transmural Laplace problem, set by `generate_fibers`.
+    apicobasal : numpy.ndarray
+        Solution of the apico-basal Laplace problem, set by `generate_fibers`.
+
+    Methods
+    -------
+    generate_fibers(mesh, base, apex, endo=None, epi=None, dtype=np.float64):
+        Generates and returns a 4D array of fibers for the mesh.
+    solve_laplace(mesh, zero, one):
+        Solves the Laplace problem on the tissue nodes of the mesh.
+    surfaces(mesh):
+        Finds the endocardial and epicardial tissue nodes of the mesh.
+    """
+
+    def __init__(self):
+        """
+        Initializes the RuleBasedAnisotropy object with default values.
+        """
+        self.alpha_endo = 60.
+        self.alpha_epi = -60.
+        self.beta_endo = 0.
+        self.beta_epi = 0.
+        self.tol = 1e-6
+        self.max_iter = 10000
+        self.transmural = None
+        self.apicobasal = None
+
+    def generate_fibers(self, mesh, base, apex, endo=None, epi=None, dtype=np.float64):
+        """
+        Generates a 4D array of fiber orientations for the mesh.
+
+        Parameters
+        ----------
+        mesh : numpy.ndarray
+            3D array of the tissue. Nodes with ``mesh > 0`` are tissue.
+        base : numpy.ndarray
+            Boolean 3D array marking the tissue nodes of the base.
+        apex : numpy.ndarray
+            Boolean 3D array marking the tissue nodes of the apex.
+        endo : numpy.ndarray, optional
+            Boolean 3D array marking the endocardial tissue nodes. Found by `surfaces` if None.
+        epi : numpy.ndarray, optional
+            Boolean 3D array marking the epicardial tissue nodes. Found by `surfaces` if None.
+        dtype : numpy.dtype, optional
+            The data type of the fibers array. Default is ``np.float64``.
+
+        Returns
+        -------
+        numpy.ndarray
+            A 4D NumPy array of shape (*mesh.shape, 3) containing the unit fiber vectors
+            (zero outside the tissue).
+        """
+        tissue = np.asarray(mesh) > 0
+        if endo is None or epi is None:
+            found_endo, found_epi = self.surfaces(mesh)
+            endo = found_endo if endo is None else endo
+            epi = found_epi if epi is None else epi
+
+        # the base is cut through the wall, so it is neither endo- nor epicardium
+        endo = endo & tissue & ~base
+        epi = epi & tissue & ~base
+
+        self.transmural = self.solve_laplace(mesh, endo, epi)
+        self.apicobasal = self.solve_laplace(mesh, apex, base)
+
+        e_t = _normalize(_gradient(self.transmural, tissue))
+        e_l = _gradient(self.apicobasal, tissue)
+        e_l -= np.sum(e_l * e_t, axis=-1, keepdims=True) * e_t
+        e_l = _normalize(e_l)
+        # inside the boundary regions (e.g. a thick base) the gradients vanish
+        e_t = _fill_degenerate(e_t)
+        e_l = _fill_degenerate(e_l)
+        e_c = np.cross(e_l, e_t)
+
+        depth = self.transmural[..., np.newaxis]
+        alpha = np.radians(self.alpha_endo + (self.alpha_epi - self.alpha_endo) * depth)
+        beta = np.radians(self.beta_endo + (self.beta_epi - self.beta_endo) * depth)
+
+        fibers = np.cos(alpha) * e_c + np.sin(alpha) * e_l
+        fibers = np.cos(beta) * fibers + np.sin(beta) * e_t
+        fibers[~tissue] = 0
+        return _normalize(fibers).astype(dtype, copy=False)
+
+    def solve_laplace(self, mesh, zero, one):
+        """
+        Solves the Laplace problem on the tissue nodes of the mesh.
+
+        The solution is 0 on the `zero` nodes, 1 on the `one` nodes and satisfies no-flux conditions on
+        the rest of the tissue boundary. Nodes outside the tissue are set to 0.
+
+        Parameters
+        ----------
+        mesh : numpy.ndarray
+            3D array of the tissue. Nodes with ``mesh > 0`` are tissue.
+        zero : numpy.ndarray
+            Boolean 3D array marking the nodes with the value 0.
+        one : numpy.ndarray
+            Boolean 3D array marking the nodes with the value 1.
+
+        Returns
+        -------
+        numpy.ndarray
+            3D array with the solution.
+        """
+        # one layer of empty nodes keeps the stencil inside the array
+        m = np.pad((np.asarray(mesh) > 0).astype(np.float64), 1)
+        zero = np.pad(zero, 1)
+        one = np.pad(one, 1)
+        free = (m == 1) & ~zero & ~one
+
+        # with dt = dr = 1 the neighbour weights are 1 and the kernel
+        # computes u + L(u), where L is the Laplace operator
+        w = IsotropicStencil3D().get_weights(m, 1, None, 1, 1, 1, 1)
+        out = np.zeros_like(m)
+
+        def laplace(x):
+            diffuse_kernel_3d_iso(out, x, w, m)
+            return out - x
+
+        diag = 1 - w[..., 3]
+        diag[~free | (diag == 0)] = 1
+
+        u = np.zeros_like(m)
+        u[one & (m == 1)] = 1
+
+        r = laplace(u)
+        r[~free] = 0
+        r_norm = np.linalg.norm(r)
+        z = r / diag
+        p = z.copy()
+        rz = np.vdot(r, z)
+
+        for _ in range(self.max_iter):
+            if np.linalg.norm(r) <= self.tol * r_norm:
+                break
+            q = -laplace(p)
+            q[~free] = 0
+            a = rz / np.vdot(p, q)
+            u += a * p
+            r -= a * q
+            z = r / diag
+            rz, rz_old = np.vdot(r, z), rz
+            p *= rz / rz_old
+            p += z
+
+        return u[1:-1, 1:-1, 1:-1]
+
+    @staticmethod
+    def surfaces(mesh):
+        """
+        Finds the endocardial and epicardial tissue nodes of the mesh.
+
+        Empty nodes connected to the edge of the array are the outside of the heart; the other empty
+        nodes are the cavities. Tissue nodes next to a cavity are endocardial, tissue nodes next to the
+        outside are epicardial. The cavities must be closed (e.g. by a layer of tissue at the base);
+        for open geometries the surfaces must be passed to `generate_fibers`.
+
+        Parameters
+        ----------
+        mesh : numpy.ndarray
+            3D array of the tissue. Nodes with ``mesh > 0`` are tissue.
+
+        Returns
+        -------
+        endo : numpy.ndarray
+            Boolean 3D array marking the endocardial tissue nodes.
+        epi : numpy.ndarray
+            Boolean 3D array marking the epicardial tissue nodes.
+        """
+        tissue = np.pad(np.asarray(mesh) > 0, 1)
+        labels, _ = ndimage.label(~tissue)
+        outside = labels == labels[0, 0, 0]
+        cavity = ~tissue & ~outside
+
+        if not cavity.any():
+            raise ValueError("The mesh has no closed cavity: the endocardium and epicardium "
+                             "must be specified")
+
+        endo = tissue & ndimage.binary_dilation(cavity)
+        epi = tissue & ndimage.binary_dilation(outside)
+        return endo[1:-1, 1:-1, 1:-1], epi[1:-1, 1:-1, 1:-1]
+
+
+def _gradient(phi, tissue):
+    """
+    Computes the gradient of `phi` using only the tissue neighbours of each node (central differences
+    inside the tissue, one-sided differences at its boundary).
+    """
+    grad = np.zeros((*phi.shape, 3))
+    for axis in range(3):
+        lo = [slice(None)] * 3
+        hi = [slice(None)] * 3
+        lo[axis] = slice(None, -1)
+        hi[axis] = slice(1, None)
+        lo, hi = tuple(lo), tuple(hi)
+
+        # differences between neighbouring tissue nodes along the axis
+        pair = tissue[lo] & tissue[hi]
+        diff = np.where(pair, phi[hi] - phi[lo], 0)
+
+        total = np.zeros(phi.shape)
+        count = np.zeros(phi.shape)
+        total[lo] += diff
+        count[lo] += pair
+        total[hi] += diff
+        count[hi] += pair
+        grad[..., axis] = total / np.maximum(count, 1)
+    return grad
+
+
+def _fill_degenerate(v):
+    """
+    Replaces zero vectors by the nearest non-zero vector.
+    """
+    valid = np.any(v != 0, axis=-1)
+    if valid.all() or not valid.any():
+        return v
+    indices = ndimage.distance_transform_edt(~valid, return_distances=False,
+                                             return_indices=True)
+    return v[tuple(indices)]
+
+
+def _normalize(v):
+    """
+    Normalizes the vectors along the last axis (zero vectors stay zero).
+    """
+    norm = np.linalg.norm(v, axis=-1, keepdims=True)
+    return v / np.where(norm > 0, norm, 1)
@@ -1,2 +1,3 @@
+from finitewave.cpuwave3D.fibrosis.correlated_3d_pattern import Correlated3DPattern
 from finitewave.cpuwave3D.fibrosis.diffuse_3d_pattern import Diffuse3DPattern
 from finitewave.cpuwave3D.fibrosis.structural_3d_pattern import Structural3DPattern
\ No newline at end of file
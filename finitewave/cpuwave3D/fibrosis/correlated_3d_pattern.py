@@ -0,0 +1,138 @@
+import numpy as np
+
+from finitewave.core.fibrosis.fibrosis_pattern import FibrosisPattern
+from finitewave.core.fibrosis.correlated_field import correlated_field, field_threshold
+
+
+class Correlated3DPattern(FibrosisPattern):
+    """
+    A class to generate a spatially correlated fibrosis pattern in a 3D mesh grid.
+
+    A Gaussian random field with the correlation length `corr_length` is generated over the region
+    and the healthy nodes where the field exceeds a threshold become fibrosis. The threshold is chosen
+    so that the fraction `dens` of the healthy nodes of the region becomes fibrosis. Different
+    correlation lengths along the axes give elongated (interstitial) patches.
+
+    The field is stored in single precision and generated, thresholded and applied in slabs, so large
+    meshes (e.g. 500^3) need little memory beyond the field itself.
+
+    Attributes
+    ----------
+    x1, x2 : int
+        The start and end indices for the region of interest along the x-axis.
+    y1, y2 : int
+        The start and end indices for the region of interest along the y-axis.
+    z1, z2 : int
+        The start and end indices for the region of interest along the z-axis.
+    dens : float
+        The fraction of the healthy nodes of the region that becomes fibrosis (0 to 1).
+    corr_length : float or tuple of float
+        The correlation length (standard deviation of the Gaussian filter, in nodes) for all axes
+        or for each axis.
+    chunk : int
+        The number of layers processed at once. Default is 32.
+
+    Methods
+    -------
+    generate(size, mesh=None):
+        Generates a 3D mesh with a correlated fibrosis pattern within the specified region.
+    generate_batch(size, count, mesh=None):
+        Generates several realizations of the fibrosis pattern at once.
+    """
+
+    def __init__(self, x1, x2, y1, y2, z1, z2, dens, corr_length, seed=None):
+        """
+        Initializes the Correlated3DPattern object with the given region of interest, density and
+        correlation length.
+
+        Parameters
+        ----------
+        x1, x2 : int
+            The start and end indices for the region of interest along the x-axis.
+        y1, y2 : int
+            The start and end indices for the region of interest along the y-axis.
+        z1, z2 : int
+            The start and end indices for the region of interest along the z-axis.
+        dens : float
+            The fraction of the healthy nodes of the region that becomes fibrosis.
+        corr_length : float or tuple of float
+            The correlation length (in nodes) for all axes or for each axis.
+        seed : int, numpy.random.Generator or None, optional
+            Seed of the random generator of the pattern or a generator to use.
+        """
+        FibrosisPattern.__init__(self, seed)
+        self.x1 = x1
+        self.x2 = x2
+        self.y1 = y1
+        self.y2 = y2
+        self.z1 = z1
+        self.z2 = z2
+        self.dens = dens
+        self.corr_length = corr_length
+        self.chunk = 32
+
+    def generate(self, size, mesh=None):
+        """
+        Generates a 3D mesh with a correlated fibrosis pattern within the specified region.
+
+        If a mesh is provided, the pattern is applied to the existing mesh; otherwise, a new mesh of healthy
+        tissue (ones) is created.
+
+        Parameters
+        ----------
+        size : tuple of int
+            The size of the 3D mesh grid (x, y, z).
+        mesh : numpy.ndarray, optional
+            A 3D NumPy array representing the existing mesh grid to which the fibrosis pattern will be applied.
+            If None, a new mesh grid of the given size is created.
+
+        Returns
+        -------
+        numpy.ndarray
+            A 3D NumPy array of the same size as the input, with the correlated fibrosis pattern applied.
+        """
+        if mesh is None:
+            mesh = np.ones(size)
+
+        self._apply(mesh[np.newaxis])
+        return mesh
+
+    def generate_batch(self, size, count, mesh=None):
+        """
+        Generates several realizations of the correlated fibrosis pattern at once.
+
+        Parameters
+        ----------
+        size : tuple of int
+            The size of the 3D mesh grid (x, y, z).
+        count : int
+            The number of realizations.
+        mesh : numpy.ndarray, optional
+            The mesh to which the fibrosis pattern is applied (it is not modified). If None, a mesh of
+            healthy tissue with the given size is used.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape (count, *size) with the realizations.
+        """
+        if mesh is None:
+            mesh = np.ones(size)
+
+        meshes = np.repeat(mesh[np.newaxis], count, axis=0)
+        self._apply(meshes)
+        return meshes
+
+    def _apply(self, meshes):
+        """
+        Applies independent realizations of the pattern to a stack of meshes in place.
+        """
+        for mesh in meshes:
+            area = mesh[self.x1:self.x2, self.y1:self.y2, self.z1:self.z2]
+            field = correlated_field(area.shape, self.corr_length, self.rng,
+                                     chunk=self.chunk)
+            threshold = field_threshold(field, self.dens, area == 1,
+                                        chunk=self.chunk)
+            for start in range(0, area.shape[0], self.chunk):
+                block = area[start:start + self.chunk]
+                block[(block == 1) & (field[start:start + self.chunk] > threshold)] = 2
@@ -22,9 +22,11 @@ class Diffuse3DPattern(FibrosisPattern):
     -------
     generate(size, mesh=None):
         Generates a 3D mesh with a diffuse fibrosis pattern within the specified region.
+    generate_batch(size, count, mesh=None):
+        Generates several realizations of the fibrosis pattern at once.
     """
 
-    def __init__(self, x1, x2, y1, y2, z1, z2, dens):
+    def __init__(self, x1, x2, y1, y2, z1, z2, dens, seed=None):
         """
         Initializes the Diffuse3DPattern object with the given region of interest and density.
 
@@ -38,7 +40,10 @@ class Diffuse3DPattern(FibrosisPattern):
             The start and end indices for the region of interest along the z-axis.
         dens : float
             The density of fibrosis within the specified region.
+        seed : int, numpy.random.Generator or None, optional
+            Seed of the random generator of the pattern or a generator to use.
         """
+        FibrosisPattern.__init__(self, seed)
         self.x1 = x1
         self.x2 = x2
         self.y1 = y1
@@ -51,7 +56,8 @@ class Diffuse3DPattern(FibrosisPattern):
         """
         Generates a 3D mesh with a diffuse fibrosis pattern within the specified region.
 
-        If a mesh is provided, the pattern is applied to the existing mesh; otherwise, a new mesh is created.
+        If a mesh is provided, the pattern is applied to the existing mesh; otherwise, a new mesh of healthy
+        tissue (ones) is created.
 
         Parameters
         ----------
@@ -67,11 +73,41 @@ class Diffuse3DPattern(FibrosisPattern):
             A 3D NumPy array of the same size as the input, with the diffuse fibrosis pattern applied.
         """
         if mesh is None:
-            mesh = np.zeros(size)
-
-        msh_area = mesh[self.x1:self.x2, self.y1:self.y2, self.z1:self.z2]
-        fib_area = np.random.uniform(size=[self.x2-self.x1, self.y2-self.y1, self.z2-self.z1])
-        fib_area = np.where(np.logical_and(fib_area < self.dens, msh_area == 1), 2, msh_area)
-        mesh[self.x1:self.x2, self.y1:self.y2, self.z1:self.z2] = fib_area
+            mesh = np.ones(size)
 
+        self._apply(mesh[np.newaxis])
         return mesh
+
+    def generate_batch(self, size, count, mesh=None):
+        """
+        Generates several realizations of the diffuse fibrosis pattern at once.
+
+        Parameters
+        ----------
+        size : tuple of int
+            The size of the 3D mesh grid (x, y, z).
+        count : int
+            The number of realizations.
+        mesh : numpy.ndarray, optional
+            The mesh to which the fibrosis pattern is applied (it is not modified). If None, a mesh of
+            healthy tissue with the given size is used.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape (count, *size) with the realizations.
+        """
+        if mesh is None:
+            mesh = np.ones(size)
+
+        meshes = np.repeat(mesh[np.newaxis], count, axis=0)
+        self._apply(meshes)
+        return meshes
+
+    def _apply(self, meshes):
+        """
+        Applies independent realizations of the pattern to a stack of meshes in place.
+        """
+        area = meshes[:, self.x1:self.x2, self.y1:self.y2, self.z1:self.z2]
+        fibrosis = self.rng.random(area.shape) < self.dens
+        area[fibrosis & (area == 1)] = 2
@@ -1,5 +1,4 @@
 import numpy as np
-import random
 
 from finitewave.core.fibrosis.fibrosis_pattern import FibrosisPattern
 
@@ -25,9 +24,11 @@ class Structural3DPattern(FibrosisPattern):
     -------
     generate(size, mesh=None):
         Generates a 3D mesh with a structural fibrosis pattern within the specified region.
+    generate_batch(size, count, mesh=None):
+        Generates several realizations of the fibrosis pattern at once.
     """
 
-    def __init__(self, x1, x2, y1, y2, z1, z2, dens, length_i, length_j, length_k):
+    def __init__(self, x1, x2, y1, y2, z1, z2, dens, length_i, length_j, length_k, seed=None):
         """
         Initializes the Structural3DPattern object with the given region of interest, density, and block sizes.
 
@@ -43,7 +44,10 @@ class Structural3DPattern(FibrosisPattern):
             The density of fibrosis within the specified region.
         length_i, length_j, length_k : int
             The lengths of fibrosis blocks along each axis (x, y, z).
+        seed : int, numpy.random.Generator or None, optional
+            Seed of the random generator of the pattern or a generator to use.
         """
+        FibrosisPattern.__init__(self, seed)
         self.x1 = x1
         self.x2 = x2
         self.y1 = y1
@@ -77,14 +81,48 @@ class Structural3DPattern(FibrosisPattern):
         if mesh is None:
             mesh = np.zeros(size)
 
-        for i in range(self.x1, self.x2, self.length_i):
-            for j in range(self.y1, self.y2, self.length_j):
-                for k in range(self.z1, self.z2, self.length_k):
-                    if random.random() <= self.dens:
-                        i_s = min(self.length_i, self.x2 - i)
-                        j_s = min(self.length_j, self.y2 - j)
-                        k_s = min(self.length_k, self.z2 - k)
+        self._apply(mesh[np.newaxis])
+        return mesh
 
-                        mesh[i:i+i_s, j:j+j_s, k:k+k_s] = 2
+    def generate_batch(self, size, count, mesh=None):
+        """
+        Generates several realizations of the structural fibrosis pattern at once.
 
-        return mesh
+        Parameters
+        ----------
+        size : tuple of int
+            The size of the 3D mesh grid (x, y, z).
+        count : int
+            The number of realizations.
+        mesh : np.ndarray, optional
+            The mesh to which the fibrosis pattern is applied (it is not modified). If None,
+            a new mesh is created with the given size.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (count, *size) with the realizations.
+        """
+        if mesh is None:
+            mesh = np.zeros(size)
+
+        meshes = np.repeat(mesh[np.newaxis], count, axis=0)
+        self._apply(meshes)
+        return meshes
+
+    def _apply(self, meshes):
+        """
+        Applies independent realizations of the pattern to a stack of meshes in place.
+
+        Each block is drawn once and expanded to its nodes; the blocks at the far edges
+        of the region are cropped.
+        """
+        area = meshes[:, self.x1:self.x2, self.y1:self.y2, self.z1:self.z2]
+        lengths = (self.length_i, self.length_j, self.length_k)
+        n_blocks = [-(-n // length) for n, length in zip(area.shape[1:], lengths)]
+        blocks = self.rng.random((len(meshes), *n_blocks)) <= self.dens
+        for axis, length in enumerate(lengths, start=1):
+            blocks = np.repeat(blocks, length, axis=axis)
+
+        crop = tuple(slice(0, n) for n in area.shape)
+        area[blocks[crop]] = 2
@@ -1,4 +1,4 @@
-from finitewave.cpuwave3D.model.diffuse_kernels_3d import diffuse_kernel_3d_iso, diffuse_kernel_3d_aniso, _parallel
+from finitewave.cpuwave3D.model.diffuse_kernels_3d import diffuse_kernel_3d_iso, diffuse_kernel_3d_aniso, diffuse_kernel_3d_iso_ext, diffuse_kernel_3d_aniso_ext, _parallel
 
 from finitewave.cpuwave3D.model.aliev_panfilov_3d.aliev_panfilov_3d import AlievPanfilov3D
 from finitewave.cpuwave3D.model.aliev_panfilov_3d.aliev_panfilov_kernels_3d import AlievPanfilovKernels3D
@@ -50,7 +50,8 @@ class AlievPanfilov3D(CardiacModel):
         super().initialize()
         weights_shape = self.cardiac_tissue.weights.shape
         shape = self.cardiac_tissue.mesh.shape
-        self.diffuse_kernel = AlievPanfilovKernels3D().get_diffuse_kernel(weights_shape)
+        self.diffuse_kernel = AlievPanfilovKernels3D().get_diffuse_kernel(weights_shape,
+                                                                          self.fuse_stim)
         self.ionic_kernel = AlievPanfilovKernels3D().get_ionic_kernel()
         self.v = np.zeros(shape, dtype=_npfloat)
 
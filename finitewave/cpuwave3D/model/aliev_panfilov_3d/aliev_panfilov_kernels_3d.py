@@ -2,10 +2,11 @@ from numba import njit, prange
 
 from finitewave.core.exception.exceptions import IncorrectWeightsShapeError
 from finitewave.cpuwave3D.model.diffuse_kernels_3d \
-    import diffuse_kernel_3d_iso, diffuse_kernel_3d_aniso, _parallel
+    import (diffuse_kernel_3d_iso, diffuse_kernel_3d_aniso,
+            diffuse_kernel_3d_iso_ext, diffuse_kernel_3d_aniso_ext, _parallel)
 
 
-@njit(parallel=_parallel)
+@njit(parallel=_parallel, nogil=True)
 def ionic_kernel_3d(u_new, u, v, mesh, dt):
     """
     Computes the ionic kernel for the Aliev-Panfilov 3D model.
@@ -60,7 +61,7 @@ class AlievPanfilovKernels3D:
 
     Methods
     -------
-    get_diffuse_kernel(shape)
+    get_diffuse_kernel(shape, external_current=False)
         Returns the appropriate diffusion kernel function based on the shape of weights.
     
     get_ionic_kernel()
@@ -70,7 +71,7 @@ class AlievPanfilovKernels3D:
         pass
 
     @staticmethod
-    def get_diffuse_kernel(shape):
+    def get_diffuse_kernel(shape, external_current=False):
         """
         Retrieves the diffusion kernel function based on the shape of weights.
 
@@ -78,6 +79,9 @@ class AlievPanfilovKernels3D:
         ----------
         shape : tuple
             The shape of the weights array used for determining the diffusion kernel.
+        external_current : bool, optional
+            Whether to return the kernel that adds an external current to the
+            updated potential (see `CardiacModel.fuse_stim`). Default is False.
 
         Returns
         -------
@@ -90,8 +94,12 @@ class AlievPanfilovKernels3D:
             If the shape of the weights array is not recognized.
         """
         if shape[-1] == 7:
+            if external_current:
+                return diffuse_kernel_3d_iso_ext
             return diffuse_kernel_3d_iso
         if shape[-1] == 19:
+            if external_current:
+                return diffuse_kernel_3d_aniso_ext
             return diffuse_kernel_3d_aniso
         else:
             raise IncorrectWeightsShapeError(shape, 7, 19)
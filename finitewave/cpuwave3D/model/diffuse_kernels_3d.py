@@ -3,7 +3,7 @@ from numba import njit, prange
 _parallel = True
 
 
-@njit(parallel=_parallel)
+@njit(parallel=_parallel, nogil=True)
 def diffuse_kernel_3d_iso(u_new, u, w, mesh):
     """
     Performs isotropic diffusion on a 3D grid.
@@ -52,7 +52,7 @@ def diffuse_kernel_3d_iso(u_new, u, w, mesh):
                           u[i+1, j, k] * w[i, j, k, 6])
 
 
-@njit(parallel=_parallel)
+@njit(parallel=_parallel, nogil=True)
 def diffuse_kernel_3d_aniso(u_new, u, w, mesh):
     """
     Performs anisotropic diffusion on a 3D grid.
@@ -112,3 +112,110 @@ def diffuse_kernel_3d_aniso(u_new, u, w, mesh):
                           u[i+1, j, k-1] * w[i, j, k, 16] +
                           u[i-1, j, k+1] * w[i, j, k, 17] +
                           u[i+1, j, k+1] * w[i, j, k, 18])
+
+
+@njit(parallel=_parallel, nogil=True)
+def diffuse_kernel_3d_iso_ext(u_new, u, w, mesh, i_ext, dt):
+    """
+    Performs isotropic diffusion on a 3D grid and adds an external current.
+
+    Same as `diffuse_kernel_3d_iso`, with the external (stimulation) current added to
+    the updated potential during the same sweep: ``u_new += dt * i_ext``.
+
+    Parameters
+    ----------
+    u_new : numpy.ndarray
+        A 3D array to store the updated potential values after diffusion.
+    
+    u : numpy.ndarray
+        A 3D array representing the current potential values before diffusion.
+    
+    w : numpy.ndarray
+        The diffusion weights (see `diffuse_kernel_3d_iso`).
+    
+    mesh : numpy.ndarray
+        A 3D array representing the mesh of the tissue.
+
+    i_ext : numpy.ndarray
+        A 3D array with the external current at each node.
+
+    dt : float
+        Time step.
+    """
+    n_i = u.shape[0]
+    n_j = u.shape[1]
+    n_k = u.shape[2]
+    for ii in prange(n_i*n_j*n_k):
+        i = ii//(n_j*n_k)
+        j = (ii % (n_j*n_k))//n_k
+        k = (ii % (n_j*n_k)) % n_k
+        if mesh[i, j, k] != 1:
+            continue
+
+        u_new[i, j, k] = (u[i-1, j, k] * w[i, j, k, 0] +
+                          u[i, j-1, k] * w[i, j, k, 1] +
+                          u[i, j, k-1] * w[i, j, k, 2] +
+                          u[i, j, k] * w[i, j, k, 3] +
+                          u[i, j, k+1] * w[i, j, k, 4] +
+                          u[i, j+1, k] * w[i, j, k, 5] +
+                          u[i+1, j, k] * w[i, j, k, 6]) + dt * i_ext[i, j, k]
+
+
+@njit(parallel=_parallel, nogil=True)
+def diffuse_kernel_3d_aniso_ext(u_new, u, w, mesh, i_ext, dt):
+    """
+    Performs anisotropic diffusion on a 3D grid and adds an external current.
+
+    Same as `diffuse_kernel_3d_aniso`, with the external (stimulation) current added to
+    the updated potential during the same sweep: ``u_new += dt * i_ext``.
+
+    Parameters
+    ----------
+    u_new : numpy.ndarray
+        A 3D array to store the updated potential values after diffusion.
+    
+    u : numpy.ndarray
+        A 3D array representing the current potential values before diffusion.
+    
+    w : numpy.ndarray
+        The diffusion weights (see `diffuse_kernel_3d_aniso`).
+    
+    mesh : numpy.ndarray
+        A 3D array representing the mesh of the tissue.
+
+    i_ext : numpy.ndarray
+        A 3D array with the external current at each node.
+
+    dt : float
+        Time step.
+    """
+    n_i = u.shape[0]
+    n_j = u.shape[1]
+    n_k = u.shape[2]
+    for ii in prange(n_i*n_j*n_k):
+        i = ii//(n_j*n_k)
+        j = (ii % (n_j*n_k))//n_k
+        k = (ii % (n_j*n_k)) % n_k
+
+        if mesh[i, j, k] != 1:
+            continue
+
+        u_new[i, j, k] = (u[i-1, j-1, k] * w[i, j, k, 0] +
+                          u[i-1, j, k] * w[i, j, k, 1] +
+                          u[i-1, j+1, k] * w[i, j, k, 2] +
+                          u[i, j-1, k] * w[i, j, k, 3] +
+                          u[i, j, k] * w[i, j, k, 4] +
+                          u[i, j+1, k] * w[i, j, k, 5] +
+                          u[i+1, j-1, k] * w[i, j, k, 6] +
+                          u[i+1, j, k] * w[i, j, k, 7] +
+                          u[i+1, j+1, k] * w[i, j, k, 8] +
+                          u[i, j-1, k-1] * w[i, j, k, 9] +
+                          u[i, j-1, k+1] * w[i, j, k, 10] +
+                          u[i, j, k-1] * w[i, j, k, 11] +
+                          u[i, j, k+1] * w[i, j, k, 12] +
+                          u[i, j+1, k-1] * w[i, j, k, 13] +
+                          u[i, j+1, k+1] * w[i, j, k, 14] +
+                          u[i-1, j, k-1] * w[i, j, k, 15] +
+                          u[i+1, j, k-1] * w[i, j, k, 16] +
+                          u[i-1, j, k+1] * w[i, j, k, 17] +
+                          u[i+1, j, k+1] * w[i, j, k, 18]) + dt * i_ext[i, j, k]
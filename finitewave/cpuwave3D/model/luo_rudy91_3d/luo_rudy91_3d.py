@@ -76,7 +76,8 @@ class LuoRudy913D(CardiacModel):
         super().initialize()
         weights_shape = self.cardiac_tissue.weights.shape
         shape = self.cardiac_tissue.mesh.shape
-        self.diffuse_kernel = LuoRudy91Kernels3D().get_diffuse_kernel(weights_shape)
+        self.diffuse_kernel = LuoRudy91Kernels3D().get_diffuse_kernel(weights_shape,
+                                                                      self.fuse_stim)
         self.ionic_kernel = LuoRudy91Kernels3D().get_ionic_kernel()
 
         self.u = -84.5*np.ones(shape, dtype=_npfloat)
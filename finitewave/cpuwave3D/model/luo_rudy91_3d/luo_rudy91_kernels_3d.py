@@ -3,10 +3,11 @@ from numba import njit, prange
 
 from finitewave.core.exception.exceptions import IncorrectWeightsShapeError
 from finitewave.cpuwave3D.model.diffuse_kernels_3d \
-    import diffuse_kernel_3d_iso, diffuse_kernel_3d_aniso, _parallel
+    import (diffuse_kernel_3d_iso, diffuse_kernel_3d_aniso,
+            diffuse_kernel_3d_iso_ext, diffuse_kernel_3d_aniso_ext, _parallel)
 
 
-@njit(parallel=_parallel)
+@njit(parallel=_parallel, nogil=True)
 def ionic_kernel_3d(u_new, u, m, h, j_, d, f, x, Cai_c, mesh, dt):
     """
     Computes the ionic currents and updates the state variables in the 3D Luo-Rudy 1991 cardiac model.
@@ -186,7 +187,7 @@ class LuoRudy91Kernels3D:
 
     Methods
     -------
-    get_diffuse_kernel(shape):
+    get_diffuse_kernel(shape, external_current=False):
         Returns the diffusion kernel function based on the weight array shape.
     get_ionic_kernel():
         Returns the ionic kernel function used for updating membrane potentials and gating variables.
@@ -198,7 +199,7 @@ class LuoRudy91Kernels3D:
         pass
 
     @staticmethod
-    def get_diffuse_kernel(shape):
+    def get_diffuse_kernel(shape, external_current=False):
         """
         Retrieves the diffusion kernel function based on the weight shape.
 
@@ -206,6 +207,9 @@ class LuoRudy91Kernels3D:
         ----------
         shape : tuple
             The shape of the weight array used in the diffusion process.
+        external_current : bool, optional
+            Whether to return the kernel that adds an external current to the
+            updated potential (see `CardiacModel.fuse_stim`). Default is False.
 
         Returns
         -------
@@ -218,8 +222,12 @@ class LuoRudy91Kernels3D:
             If the shape of the weights array does not match expected values (7 or 19).
         """
         if shape[-1] == 7:
+            if external_current:
+                return diffuse_kernel_3d_iso_ext
             return diffuse_kernel_3d_iso
         if shape[-1] == 19:
+            if external_current:
+                return diffuse_kernel_3d_aniso_ext
             return diffuse_kernel_3d_aniso
         else:
             raise IncorrectWeightsShapeError(shape, 7, 19)
@@ -1,12 +1,13 @@
 from math import log, sqrt, exp
 from numba import njit, prange
 from finitewave.cpuwave3D.model.diffuse_kernels_3d \
-    import diffuse_kernel_3d_iso, diffuse_kernel_3d_aniso, _parallel
+    import (diffuse_kernel_3d_iso, diffuse_kernel_3d_aniso,
+            diffuse_kernel_3d_iso_ext, diffuse_kernel_3d_aniso_ext, _parallel)
 from finitewave.core.exception.exceptions import IncorrectWeightsShapeError
 
 
 # tp06 epi kernel
-@njit(parallel=_parallel)
+@njit(parallel=_parallel, nogil=True)
 def ionic_kernel_3d(u_new, u, Cai, CaSR, CaSS, Nai, Ki, M_, H_, J_, Xr1, Xr2,
                     Xs, R_, S_, D_, F_, F2_, FCass, RR, OO, mesh, dt):
     """
@@ -334,7 +335,7 @@ class TP06Kernels3D:
 
     Methods
     -------
-    get_diffuse_kernel(shape):
+    get_diffuse_kernel(shape, external_current=False):
         Returns the appropriate diffusion kernel function based on the shape of the weights.
     get_ionic_kernel():
         Returns the ionic kernel function for the TP06 model.
@@ -346,7 +347,7 @@ class TP06Kernels3D:
         pass
 
     @staticmethod
-    def get_diffuse_kernel(shape):
+    def get_diffuse_kernel(shape, external_current=False):
         """
         Returns the diffusion kernel function based on the shape of the weights.
 
@@ -354,6 +355,9 @@ class TP06Kernels3D:
         ----------
         shape : tuple
             The shape of the weights array.
+        external_current : bool, optional
+            Whether to return the kernel that adds an external current to the
+            updated potential (see `CardiacModel.fuse_stim`). Default is False.
 
         Returns
         -------
@@ -366,8 +370,12 @@ class TP06Kernels3D:
             If the shape of the weights does not match expected values (7 or 19).
         """
         if shape[-1] == 7:
+            if external_current:
+                return diffuse_kernel_3d_iso_ext
             return diffuse_kernel_3d_iso
         if shape[-1] == 19:
+            if external_current:
+                return diffuse_kernel_3d_aniso_ext
             return diffuse_kernel_3d_aniso
         else:
             raise IncorrectWeightsShapeError(shape, 7, 19)
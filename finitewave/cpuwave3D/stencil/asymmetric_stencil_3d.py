@@ -7,10 +7,56 @@ from finitewave.cpuwave2D.stencil.asymmetric_stencil_2d import (
     minor_component
 )
 
+_parallel = True
+
 
 @njit
-def compute_weights(w, m, d_xx, d_xy, d_xz, d_yx, d_yy, d_yz, d_zx, d_zy,
-                    d_zz):
+def half_step_diffusion(c, f, D_al, D_ac, i, j, k, axis, comp):
+    """
+    Computes a component of the diffusion tensor at the half-step between
+    the node (i, j, k) and the next node along the axis.
+
+    Parameters
+    ----------
+    c : np.ndarray
+        3D array of conductivity.
+    f : np.ndarray
+        Array of fiber orientations with shape ``(*mesh.shape, 3)``.
+    D_al : float
+        Longitudinal diffusion coefficient.
+    D_ac : float
+        Cross-sectional diffusion coefficient.
+    i, j, k : int
+        Node indices.
+    axis : int
+        Axis of the half-step (0 for x, 1 for y, 2 for z).
+    comp : int
+        Component of the diffusion tensor (0 for x, 1 for y, 2 for z).
+
+    Returns
+    -------
+    float
+        Diffusion component at the half-step.
+    """
+    i1 = i + (axis == 0)
+    j1 = j + (axis == 1)
+    k1 = k + (axis == 2)
+    if i1 == c.shape[0]:
+        i1 = 0
+    if j1 == c.shape[1]:
+        j1 = 0
+    if k1 == c.shape[2]:
+        k1 = 0
+
+    d0 = ((D_ac * (axis == comp) + (D_al - D_ac) * f[i, j, k, axis] * f[i, j, k, comp])
+          * c[i, j, k])
+    d1 = ((D_ac * (axis == comp) + (D_al - D_ac) * f[i1, j1, k1, axis] * f[i1, j1, k1, comp])
+          * c[i1, j1, k1])
+    return 0.5 * (d0 + d1)
+
+
+@njit(parallel=_parallel)
+def compute_weights(w, m, c, f, D_al, D_ac):
     """
     Computes the weights for diffusion on a 3D mesh using an asymmetric
     stencil.
@@ -22,29 +68,26 @@ def compute_weights(w, m, d_xx, d_xy, d_xz, d_yx, d_yy, d_yz, d_zx, d_zy,
     m : np.ndarray
         3D array representing the mesh grid of the tissue.
         Non-tissue areas are set to 0.
-    d_xx : np.ndarray
-        3D array of half-step diffusion x-components in the x-direction.
-    d_xy : np.ndarray
-        3D array of half-step diffusion y-components in the x-direction.
-    d_xz : np.ndarray
-        3D array of half-step diffusion z-components in the x-direction.
-    d_yx : np.ndarray
-        3D array of half-step diffusion x-components in the y-direction.
-    d_yy : np.ndarray
-        3D array of half-step diffusion y-components in the y-direction.
-    d_yz : np.ndarray
-        3D array of half-step diffusion z-components in the y-direction.
-    d_zx : np.ndarray
-        3D array of half-step diffusion x-components in the z-direction.
-    d_zy : np.ndarray
-        3D array of half-step diffusion y-components in the z-direction.
-    d_zz : np.ndarray
-        3D array of half-step diffusion z-components in the z-direction.
+    c : np.ndarray
+        3D array of conductivity.
+    f : np.ndarray
+        Array of fiber orientations with shape ``(*mesh.shape, 3)``.
+    D_al : float
+        Longitudinal diffusion coefficient.
+    D_ac : float
+        Cross-sectional diffusion coefficient.
 
     Returns
     -------
     np.ndarray
-        4D array of weights for diffusion, with the shape of (*mesh.shape, 9).
+        4D array of weights for diffusion, with the shape of (*mesh.shape, 19).
+
+    Notes
+    -----
+    The half-step diffusion components (``d_xy`` for the y component in the
+    x direction, etc.) are computed for each node from the fibers and the
+    conductivity (see `half_step_diffusion`), so no full-size arrays are
+    allocated.
     """
     n_i = m.shape[0]
     n_j = m.shape[1]
@@ -57,14 +100,33 @@ def compute_weights(w, m, d_xx, d_xy, d_xz, d_yx, d_yy, d_yz, d_zx, d_zy,
         if m[i, j, k] != 1:
             continue
 
+        d_xx_0 = half_step_diffusion(c, f, D_al, D_ac, i-1, j, k, 0, 0)
+        d_xy_0 = half_step_diffusion(c, f, D_al, D_ac, i-1, j, k, 0, 1)
+        d_xz_0 = half_step_diffusion(c, f, D_al, D_ac, i-1, j, k, 0, 2)
+        d_yx_0 = half_step_diffusion(c, f, D_al, D_ac, i, j-1, k, 1, 0)
+        d_yy_0 = half_step_diffusion(c, f, D_al, D_ac, i, j-1, k, 1, 1)
+        d_yz_0 = half_step_diffusion(c, f, D_al, D_ac, i, j-1, k, 1, 2)
+        d_zx_0 = half_step_diffusion(c, f, D_al, D_ac, i, j, k-1, 2, 0)
+        d_zy_0 = half_step_diffusion(c, f, D_al, D_ac, i, j, k-1, 2, 1)
+        d_zz_0 = half_step_diffusion(c, f, D_al, D_ac, i, j, k-1, 2, 2)
+        d_xx_1 = half_step_diffusion(c, f, D_al, D_ac, i, j, k, 0, 0)
+        d_xy_1 = half_step_diffusion(c, f, D_al, D_ac, i, j, k, 0, 1)
+        d_xz_1 = half_step_diffusion(c, f, D_al, D_ac, i, j, k, 0, 2)
+        d_yx_1 = half_step_diffusion(c, f, D_al, D_ac, i, j, k, 1, 0)
+        d_yy_1 = half_step_diffusion(c, f, D_al, D_ac, i, j, k, 1, 1)
+        d_yz_1 = half_step_diffusion(c, f, D_al, D_ac, i, j, k, 1, 2)
+        d_zx_1 = half_step_diffusion(c, f, D_al, D_ac, i, j, k, 2, 0)
+        d_zy_1 = half_step_diffusion(c, f, D_al, D_ac, i, j, k, 2, 1)
+        d_zz_1 = half_step_diffusion(c, f, D_al, D_ac, i, j, k, 2, 2)
+
         # q (i-1/2, j, k)
-        qx0_major = major_component(d_xx[i-1, j, k], m[i-1, j, k])
+        qx0_major = major_component(d_xx_0, m[i-1, j, k])
         # (i-1, j, k)
         w[i, j, k, 1] += qx0_major
         # (i, j, k)
         w[i, j, k, 4] -= qx0_major
 
-        qx0_xy_minor = minor_component(d_xy[i-1, j, k],
+        qx0_xy_minor = minor_component(d_xy_0,
                                        m[i-1, j-1, k], m[i, j-1, k],
                                        m[i-1, j, k], m[i, j, k],
                                        m[i-1, j+1, k], m[i, j+1, k])
@@ -81,7 +143,7 @@ def compute_weights(w, m, d_xx, d_xy, d_xz, d_yx, d_yy, d_yz, d_zx, d_zy,
         # (i, j+1, k)
         w[i, j, k, 5] -= qx0_xy_minor[5]
 
-        qx0_xz_minor = minor_component(d_xz[i-1, j, k],
+        qx0_xz_minor = minor_component(d_xz_0,
                                        m[i-1, j, k-1], m[i, j, k-1],
                                        m[i-1, j, k], m[i, j, k],
                                        m[i-1, j, k+1], m[i, j, k+1])
@@ -99,13 +161,13 @@ def compute_weights(w, m, d_xx, d_xy, d_xz, d_yx, d_yy, d_yz, d_zx, d_zy,
         w[i, j, k, 12] -= qx0_xz_minor[5]
 
         # q (i+1/2, j, k)
-        qx1_major = major_component(d_xx[i, j, k], m[i+1, j, k])
+        qx1_major = major_component(d_xx_1, m[i+1, j, k])
         # (i+1, j, k)
         w[i, j, k, 7] += qx1_major
         # (i, j, k)
         w[i, j, k, 4] -= qx1_major
 
-        qx1_xy_minor = minor_component(d_xy[i, j, k],
+        qx1_xy_minor = minor_component(d_xy_1,
                                        m[i+1, j-1, k], m[i, j-1, k],
                                        m[i+1, j, k], m[i, j, k],
                                        m[i+1, j+1, k], m[i, j+1, k])
@@ -122,7 +184,7 @@ def compute_weights(w, m, d_xx, d_xy, d_xz, d_yx, d_yy, d_yz, d_zx, d_zy,
         # (i, j+1, k)
         w[i, j, k, 5] += qx1_xy_minor[5]
 
-        qx1_xz_minor = minor_component(d_xz[i, j, k],
+        qx1_xz_minor = minor_component(d_xz_1,
                                        m[i+1, j, k-1], m[i, j, k-1],
                                        m[i+1, j, k], m[i, j, k],
                                        m[i+1, j, k+1], m[i, j, k+1])
@@ -140,13 +202,13 @@ def compute_weights(w, m, d_xx, d_xy, d_xz, d_yx, d_yy, d_yz, d_zx, d_zy,
         w[i, j, k, 12] += qx1_xz_minor[5]
 
         # q (i, j-1/2, k)
-        qy0_major = major_component(d_yy[i, j-1, k], m[i, j-1, k])
+        qy0_major = major_component(d_yy_0, m[i, j-1, k])
         # (i, j-1, k)
         w[i, j, k, 3] += qy0_major
         # (i, j, k)
         w[i, j, k, 4] -= qy0_major
 
-        qy0_yx_minor = minor_component(d_yx[i, j-1, k],
+        qy0_yx_minor = minor_component(d_yx_0,
                                        m[i-1, j-1, k], m[i-1, j, k],
                                        m[i, j-1, k], m[i, j, k],
                                        m[i+1, j-1, k], m[i+1, j, k])
@@ -163,7 +225,7 @@ def compute_weights(w, m, d_xx, d_xy, d_xz, d_yx, d_yy, d_yz, d_zx, d_zy,
         # (i+1, j, k)
         w[i, j, k, 7] -= qy0_yx_minor[5]
 
-        qy0_yz_minor = minor_component(d_yz[i, j-1, k],
+        qy0_yz_minor = minor_component(d_yz_0,
                                        m[i, j-1, k-1], m[i, j, k-1],
                                        m[i, j-1, k], m[i, j, k],
                                        m[i, j-1, k+1], m[i, j, k+1])
@@ -181,13 +243,13 @@ def compute_weights(w, m, d_xx, d_xy, d_xz, d_yx, d_yy, d_yz, d_zx, d_zy,
         w[i, j, k, 12] -= qy0_yz_minor[5]
 
         # q (i, j+1/2, k)
-        qy1_major = major_component(d_yy[i, j, k], m[i, j+1, k])
+        qy1_major = major_component(d_yy_1, m[i, j+1, k])
         # (i, j+1, k)
         w[i, j, k, 5] += qy1_major
         # (i, j, k)
         w[i, j, k, 4] -= qy1_major
 
-        qy1_yx_minor = minor_component(d_yx[i, j, k],
+        qy1_yx_minor = minor_component(d_yx_1,
                                        m[i-1, j+1, k], m[i-1, j, k],
                                        m[i, j+1, k], m[i, j, k],
                                        m[i+1, j+1, k], m[i+1, j, k])
@@ -204,7 +266,7 @@ def compute_weights(w, m, d_xx, d_xy, d_xz, d_yx, d_yy, d_yz, d_zx, d_zy,
         # (i+1, j, k)
         w[i, j, k, 7] += qy1_yx_minor[5]
 
-        qy1_yz_minor = minor_component(d_yz[i, j, k],
+        qy1_yz_minor = minor_component(d_yz_1,
                                        m[i, j+1, k-1], m[i, j, k-1],
                                        m[i, j+1, k], m[i, j, k],
                                        m[i, j+1, k+1], m[i, j, k+1])
@@ -222,13 +284,13 @@ def compute_weights(w, m, d_xx, d_xy, d_xz, d_yx, d_yy, d_yz, d_zx, d_zy,
         w[i, j, k, 12] += qy1_yz_minor[5]
 
         # q (i, j, k-1/2)
-        qz0_major = major_component(d_zz[i, j, k-1], m[i, j, k-1])
+        qz0_major = major_component(d_zz_0, m[i, j, k-1])
         # (i, j, k-1)
         w[i, j, k, 11] += qz0_major
         # (i, j, k)
         w[i, j, k, 4] -= qz0_major
 
-        qz0_zx_minor = minor_component(d_zx[i, j, k-1],
+        qz0_zx_minor = minor_component(d_zx_0,
                                        m[i-1, j, k-1], m[i-1, j, k],
                                        m[i, j, k-1], m[i, j, k],
                                        m[i+1, j, k-1], m[i+1, j, k])
@@ -245,7 +307,7 @@ def compute_weights(w, m, d_xx, d_xy, d_xz, d_yx, d_yy, d_yz, d_zx, d_zy,
         # (i+1, j, k)
         w[i, j, k, 7] -= qz0_zx_minor[5]
 
-        qz0_zy_minor = minor_component(d_zy[i, j, k-1],
+        qz0_zy_minor = minor_component(d_zy_0,
                                        m[i, j-1, k-1], m[i, j-1, k],
                                        m[i, j, k-1], m[i, j, k],
                                        m[i, j+1, k-1], m[i, j+1, k])
@@ -263,13 +325,13 @@ def compute_weights(w, m, d_xx, d_xy, d_xz, d_yx, d_yy, d_yz, d_zx, d_zy,
         w[i, j, k, 5] -= qz0_zy_minor[5]
 
         # q (i, j, k+1/2)
-        qz1_major = major_component(d_zz[i, j, k], m[i, j, k+1])
+        qz1_major = major_component(d_zz_1, m[i, j, k+1])
         # (i, j, k+1)
         w[i, j, k, 12] += qz1_major
         # (i, j, k)
         w[i, j, k, 4] -= qz1_major
 
-        qz1_zx_minor = minor_component(d_zx[i, j, k],
+        qz1_zx_minor = minor_component(d_zx_1,
                                        m[i-1, j, k+1], m[i-1, j, k],
                                        m[i, j, k+1], m[i, j, k],
                                        m[i+1, j, k+1], m[i+1, j, k])
@@ -286,7 +348,7 @@ def compute_weights(w, m, d_xx, d_xy, d_xz, d_yx, d_yy, d_yz, d_zx, d_zy,
         # (i+1, j, k)
         w[i, j, k, 7] += qz1_zx_minor[5]
 
-        qz1_zy_minor = minor_component(d_zy[i, j, k],
+        qz1_zy_minor = minor_component(d_zy_1,
                                        m[i, j-1, k+1], m[i, j-1, k],
                                        m[i, j, k+1], m[i, j, k],
                                        m[i, j+1, k+1], m[i, j+1, k])
@@ -348,23 +410,17 @@ class AsymmetricStencil3D(AsymmetricStencil2D):
         The method assumes asymmetric diffusion where different coefficients are used for different directions.
         The weights are computed for eight surrounding directions and the central weight, based on the asymmetric stencil.
         Heterogeneity in the diffusion coefficients is handled by adjusting the weights based on fiber orientations.
+        The half-step diffusion tensors are computed per node by a parallel compiled kernel, so apart from
+        the weights only a one-byte copy of the mesh is allocated.
         """
-        mesh = mesh.copy()
-        mesh[mesh != 1] = 0
+        mesh = (mesh == 1).astype(np.int8)
         weights = np.zeros((*mesh.shape, 19), dtype='float32')
+        if conductivity is None:
+            conductivity = 1
+        conductivity = np.broadcast_to(np.asarray(conductivity, dtype=np.float64),
+                                       mesh.shape)
 
-        d_xx, d_xy, d_xz = self.compute_half_step_diffusion(mesh, conductivity,
-                                                            fibers, D_al, D_ac,
-                                                            0, num_axes=3)
-        d_yx, d_yy, d_yz = self.compute_half_step_diffusion(mesh, conductivity,
-                                                            fibers, D_al, D_ac,
-                                                            1, num_axes=3)
-        d_zx, d_zy, d_zz = self.compute_half_step_diffusion(mesh, conductivity,
-                                                            fibers, D_al, D_ac,
-                                                            2, num_axes=3)
-
-        weights = compute_weights(weights, mesh, d_xx, d_xy, d_xz, d_yx, d_yy,
-                                  d_yz, d_zx, d_zy, d_zz)
+        compute_weights(weights, mesh, conductivity, fibers, D_al, D_ac)
 
         weights *= dt/dr**2
         weights[:, :, :, 4] += 1
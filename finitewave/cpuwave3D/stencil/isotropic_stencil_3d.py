@@ -1,8 +1,80 @@
 import numbers
 import numpy as np
+from numba import njit, prange
 
 from finitewave.core.stencil.stencil import Stencil
 
+_parallel = True
+
+
+@njit(parallel=_parallel)
+def compute_weights(w, m, d, dt, dr):
+    """
+    Computes the weights for diffusion on a 3D mesh using the isotropic
+    stencil in a single pass over the nodes.
+
+    Parameters
+    ----------
+    w : np.ndarray
+        4D array to store the weights for diffusion. Shape is (*mesh.shape, 7).
+        Must be filled with zeros.
+    m : np.ndarray
+        3D array representing the mesh grid of the tissue. Only nodes equal
+        to 1 are treated as tissue.
+    d : np.ndarray
+        3D array of diffusion coefficients.
+    dt : float
+        Temporal resolution.
+    dr : float
+        Spatial resolution.
+
+    Returns
+    -------
+    np.ndarray
+        4D array of weights for diffusion, with the shape of (*mesh.shape, 7).
+
+    Notes
+    -----
+    The mesh is treated as periodic (the neighbours of the edge nodes are
+    taken from the opposite edge), as the tissue edges are normally empty.
+    """
+    n_i = m.shape[0]
+    n_j = m.shape[1]
+    n_k = m.shape[2]
+    for i in prange(n_i):
+        i0 = i - 1 if i > 0 else n_i - 1
+        i1 = i + 1 if i < n_i - 1 else 0
+        for j in range(n_j):
+            j0 = j - 1 if j > 0 else n_j - 1
+            j1 = j + 1 if j < n_j - 1 else 0
+            for k in range(n_k):
+                if m[i, j, k] != 1:
+                    continue
+                k0 = k - 1 if k > 0 else n_k - 1
+                k1 = k + 1 if k < n_k - 1 else 0
+
+                a = d[i, j, k] * dt / (dr**2)
+                b = dt / (2*dr)
+                diff_i = d[i0, j, k] - d[i1, j, k]
+                diff_j = d[i, j0, k] - d[i, j1, k]
+                diff_k = d[i, j, k0] - d[i, j, k1]
+                w0 = a * (m[i0, j, k] == 1) - b * diff_i
+                w1 = a * (m[i, j0, k] == 1) - b * diff_j
+                w2 = a * (m[i, j, k0] == 1) - b * diff_k
+                w4 = a * (m[i, j, k1] == 1) + b * diff_k
+                w5 = a * (m[i, j1, k] == 1) + b * diff_j
+                w6 = a * (m[i1, j, k] == 1) + b * diff_i
+
+                w[i, j, k, 0] = w0
+                w[i, j, k, 1] = w1
+                w[i, j, k, 2] = w2
+                w[i, j, k, 4] = w4
+                w[i, j, k, 5] = w5
+                w[i, j, k, 6] = w6
+                w[i, j, k, 3] = 1 - w0 - w1 - w2 - w4 - w5 - w6
+
+    return w
+
 
 class IsotropicStencil3D(Stencil):
     """
@@ -53,41 +125,12 @@ class IsotropicStencil3D(Stencil):
         Notes
         -----
         The method assumes isotropic diffusion where `D_al` is used as the diffusion coefficient.
-        The weights are computed for four directions (up, right, down, left) and the central weight.
+        The weights are computed for six directions and the central weight by a compiled kernel in a
+        single pass, without full-size temporary arrays.
         Heterogeneity in the diffusion coefficients is handled by adjusting the weights based on
         differences in the diffusion coefficients along the rows and columns.
         """
-        mesh = mesh.copy()
-        mesh[mesh != 1] = 0
         weights = np.zeros((*mesh.shape, 7))
-
-        diffuse = D_al * conductivity * np.ones(mesh.shape)
-
-        weights[:, :, :, 0] = diffuse * dt / (dr**2) * np.roll(mesh, 1, axis=0)
-        weights[:, :, :, 1] = diffuse * dt / (dr**2) * np.roll(mesh, 1, axis=1)
-        weights[:, :, :, 2] = diffuse * dt / (dr**2) * np.roll(mesh, 1, axis=2)
-        weights[:, :, :, 4] = diffuse * dt / (dr**2) * np.roll(mesh, -1,
-                                                               axis=2)
-        weights[:, :, :, 5] = diffuse * dt / (dr**2) * np.roll(mesh, -1,
-                                                               axis=1)
-        weights[:, :, :, 6] = diffuse * dt / (dr**2) * np.roll(mesh, -1,
-                                                               axis=0)
-
-        # heterogeneity
-        diff_i = np.roll(diffuse, 1, axis=0) - np.roll(diffuse, -1, axis=0)
-        diff_j = np.roll(diffuse, 1, axis=1) - np.roll(diffuse, -1, axis=1)
-        diff_k = np.roll(diffuse, 1, axis=2) - np.roll(diffuse, -1, axis=2)
-
-        weights[:, :, :, 0] -= dt / (2*dr) * diff_i
-        weights[:, :, :, 1] -= dt / (2*dr) * diff_j
-        weights[:, :, :, 2] -= dt / (2*dr) * diff_k
-        weights[:, :, :, 4] += dt / (2*dr) * diff_k
-        weights[:, :, :, 5] += dt / (2*dr) * diff_j
-        weights[:, :, :, 6] += dt / (2*dr) * diff_i
-
-        for i in [0, 1, 2, 4, 5, 6]:
-            weights[:, :, :, i] *= mesh
-            weights[:, :, :, 3] -= weights[:, :, :, i]
-        weights[:, :, :, 3] += 1
-        weights[:, :, :, 3] *= mesh
-        return weights
+        diffuse = np.broadcast_to(np.asarray(D_al * conductivity, dtype=np.float64),
+                                  mesh.shape)
+        return compute_weights(weights, mesh, diffuse, dt, dr)
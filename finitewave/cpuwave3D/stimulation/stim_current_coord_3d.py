@@ -1,4 +1,7 @@
+import numpy as np
+
 from finitewave.core.stimulation.stim_current import StimCurrent
+from finitewave.core.stimulation.stim_kernels import roi_index
 
 
 class StimCurrentCoord3D(StimCurrent):
@@ -61,6 +64,22 @@ class StimCurrentCoord3D(StimCurrent):
         self.z1 = z1
         self.z2 = z2
 
+    def compute_index(self, mesh):
+        """
+        Computes the flat indices of the stimulated tissue nodes.
+
+        Parameters
+        ----------
+        mesh : numpy.ndarray
+            The tissue mesh.
+
+        Returns
+        -------
+        numpy.ndarray
+            Flat (C-order) indices of the stimulated nodes.
+        """
+        return roi_index(mesh, np.s_[self.x1:self.x2, self.y1:self.y2, self.z1:self.z2])
+
     def stimulate(self, model):
         """
         Applies the stimulation current to the specified rectangular region of the cardiac tissue model.
@@ -82,13 +101,4 @@ class StimCurrentCoord3D(StimCurrent):
         the state of the tissue.
         """
         if not self.passed:
-            # ROI - region of interest
-            roi_x1, roi_x2 = self.x1, self.x2
-            roi_y1, roi_y2 = self.y1, self.y2
-            roi_z1, roi_z2 = self.z1, self.z2
-
-            roi_mesh = model.cardiac_tissue.mesh[roi_x1:roi_x2, roi_y1:roi_y2 ,roi_z1:roi_z2]
-
-            mask = (roi_mesh == 1)
-
-            model.u[roi_x1:roi_x2, roi_y1:roi_y2, roi_z1:roi_z2][mask] += self._dt * self.curr_value
\ No newline at end of file
+            self.apply_current(model)
\ No newline at end of file
@@ -85,3 +85,4 @@ class CardiacTissue3D(CardiacTissue):
         self.weights = self.stencil.get_weights(self.mesh, self.conductivity,
                                                 self.fibers, self.D_al,
                                                 self.D_ac, dt, dr)
+        self._dirty = None
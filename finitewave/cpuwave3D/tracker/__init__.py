@@ -1,9 +1,11 @@
 from finitewave.cpuwave3D.tracker.action_potential_3d_tracker import ActionPotential3DTracker
 from finitewave.cpuwave3D.tracker.activation_time_3d_tracker import ActivationTime3DTracker
 from finitewave.cpuwave3D.tracker.animation_slice_3d_tracker import AnimationSlice3DTracker
+from finitewave.cpuwave3D.tracker.apd_3d_tracker import APD3DTracker
 from finitewave.cpuwave3D.tracker.ecg_3d_tracker import ECG3DTracker
 from finitewave.cpuwave3D.tracker.period_3d_tracker import Period3DTracker
 from finitewave.cpuwave3D.tracker.period_map_3d_tracker import PeriodMap3DTracker
+from finitewave.cpuwave3D.tracker.period_stats_3d_tracker import PeriodStats3DTracker
 from finitewave.cpuwave3D.tracker.spiral_3d_tracker import Spiral3DTracker
 from finitewave.cpuwave3D.tracker.variable_3d_tracker import Variable3DTracker
 from finitewave.cpuwave3D.tracker.velocity_3d_tracker import Velocity3DTracker
@@ -39,6 +39,7 @@ class ActionPotential3DTracker(Tracker):
         self.act_pot  = np.array([])
         self.cell_ind = [1, 1, 1]
         self.file_name = "act_pot"
+        self.state_vars = ["act_pot"]
 
     def initialize(self, model):
         """
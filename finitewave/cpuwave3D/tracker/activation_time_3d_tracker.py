@@ -39,6 +39,7 @@ class ActivationTime3DTracker(Tracker):
         self.act_t = np.array([])
         self.threshold = -40
         self.file_name = "act_time_3d"
+        self.state_vars = ["act_t"]
 
     def initialize(self, model):
         """
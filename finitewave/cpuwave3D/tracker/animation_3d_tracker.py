@@ -1,4 +1,5 @@
 from pathlib import Path
+import json
 import numpy as np
 import pyvista as pv
 import shutil as shatilib
@@ -6,23 +7,23 @@ import shutil as shatilib
 from finitewave.core.tracker.tracker import Tracker
 from finitewave.tools.vis_mesh_builder_3d import VisMeshBuilder3D
 from finitewave.tools.animation_3d_builder import Animation3DBuilder
+from finitewave.tools.frame_store import FrameStore
 
 
 class Animation3DTracker(Tracker):
     """
     A class to track and save frames of a 3D cardiac tissue model simulation for animation purposes.
 
-    This tracker periodically saves the state of a specified target array from the model to disk as NumPy files,
-    which can later be used to create animations.
+    This tracker periodically saves the state of a specified target array from the model to disk, either as one
+    NumPy file per frame or appended to a single chunked HDF5 frame store, which can later be used to create
+    animations.
 
     Attributes
     ----------
-    step : int
-        Interval in time steps at which frames are saved.
+    step : float
+        Interval in model time units at which frames are saved.
     start : float
         The time at which to start recording frames.
-    _t : float
-        Internal counter for keeping track of the elapsed time since the last frame was saved.
     dir_name : str
         Directory name where animation frames are stored.
     _frame_n : int
@@ -35,6 +36,17 @@ class Animation3DTracker(Tracker):
         Internal storage for the data type of the saved frames.
     _frame_format_mult : float
         Internal storage for the multiplier for scaling the saved frames.
+    storage : str
+        Frame storage backend: "npy" (one file per frame in `dir_name`) or "h5" (single chunked
+        file `dir_name`.h5 that also stores the tissue mesh as mask, see FrameStore).
+    complevel : int
+        Compression level of the "h5" storage (0 disables compression).
+    complib : str
+        Compression library of the "h5" storage.
+    mask_compress : bool
+        If True, only the values of the tissue nodes (``mesh > 0``) are saved, as frames shaped like
+        ``mesh[mesh > 0]``. The mesh is written once (``mask.npy`` in `dir_name` or the mask of the frame
+        store).
 
     Methods
     -------
@@ -43,7 +55,9 @@ class Animation3DTracker(Tracker):
     track():
         Saves frames based on the specified step interval and target array.
     write():
-        No operation. Exists to fulfill the interface requirements.
+        Builds the animation from the saved frames.
+    finalize():
+        Closes the frame store.
     """
     def __init__(self):
         """
@@ -55,9 +69,23 @@ class Animation3DTracker(Tracker):
         self.target_array = ""
         self.dir_name = "animation"
 
-        self._t = 0
         self._frame_n = 0
 
+        self.frame_format = {
+            "type": "float64",
+            "mult": 1
+        }
+        self._frame_format_type = ""
+        self._frame_format_mult = 1
+
+        self.storage = "npy"
+        self.complevel = 0
+        self.complib = "blosc"
+        self.mask_compress = False
+        self._mask_index = None
+        self._frame_store = None
+        self.state_vars = ["_frame_n"]
+
     def initialize(self, model):
         """
         Initializes the tracker with the simulation model and sets up directories for saving frames.
@@ -69,32 +97,132 @@ class Animation3DTracker(Tracker):
         """
         self.model = model
 
-        self._t = 0
         self._frame_n = 0
         self._dt = self.model.dt
-        self._step = self.step - self._dt
 
-        if not Path(self.path).joinpath(self.dir_name).exists():
+        self.start_step = self.model.time_to_step(self.start)
+        self.interval = max(1, self.model.time_to_step(self.step))
+
+        self.finalize()
+
+        if (self.storage == "npy"
+                and not Path(self.path).joinpath(self.dir_name).exists()):
             Path(self.path).joinpath(self.dir_name).mkdir(parents=True)
 
+        self._frame_format_type = self.frame_format["type"]
+        self._frame_format_mult = self.frame_format["mult"]
+
+        mesh = self.model.cardiac_tissue.mesh
+        self._mask_index = None
+        if self.mask_compress:
+            # flat indices in C order, the same order as mesh[mesh > 0]
+            self._mask_index = np.flatnonzero(mesh > 0)
+
+        if self.storage == "npy":
+            path = Path(self.path).joinpath(self.dir_name)
+            if self.mask_compress:
+                np.save(path.joinpath("mask.npy"), mesh)
+            with open(path.joinpath("attrs.json"), "w") as file:
+                json.dump(self._frame_attrs(), file)
+
+        self._start_writer()
+
+    def _frame_attrs(self):
+        """
+        Returns the metadata saved with the frames.
+        """
+        return {"dt": self._dt, "step": self.step,
+                "mult": self._frame_format_mult,
+                "mask_compress": self.mask_compress}
+
     def track(self):
         """
         Saves frames based on the specified step interval and target array.
 
         The frames are saved in the specified directory as NumPy files.
         """
+        frame = self.model.__dict__[self.target_array]
+        if self._mask_index is not None:
+            frame = frame.reshape(-1)[self._mask_index]
+        self._save_frame(self._format_frame(frame))
+
+    def _format_frame(self, frame):
+        """
+        Scales the frame by the frame format multiplier and casts it to the
+        frame format type. Integer types are rounded and clipped to the range
+        of the type, so that values out of range saturate instead of wrapping
+        around.
+
+        Parameters
+        ----------
+        frame : np.ndarray
+            Frame to format.
+
+        Returns
+        -------
+        np.ndarray
+            Formatted frame.
+        """
+        if self._frame_format_mult != 1:
+            frame = frame * self._frame_format_mult
+        if np.issubdtype(np.dtype(self._frame_format_type), np.integer):
+            info = np.iinfo(self._frame_format_type)
+            frame = np.clip(np.rint(frame), info.min, info.max)
+        return frame.astype(self._frame_format_type, copy=False)
+
+    def _save_frame(self, frame):
+        """
+        Saves a frame with the selected storage backend, in the background
+        writer if `async_write` is set.
+
+        Parameters
+        ----------
+        frame : np.ndarray
+            Frame to save.
+        """
+        self._submit(self._write_frame, frame, self._frame_n, self.model.t)
+        self._frame_n += 1
+
+    def _write_frame(self, frame, frame_n, t):
+        """
+        Writes a frame with the selected storage backend.
+
+        Parameters
+        ----------
+        frame : np.ndarray
+            Frame to write.
+        frame_n : int
+            Frame number.
+        t : float
+            Model time of the frame.
+        """
         path = Path(self.path)
-        if not self.model.t >= self.start:
-            return
-
-        if self._t > self._step:
-            frame = self.model.__dict__[self.target_array]
-            np.save(path.joinpath(self.dir_name, f"{self._frame_n}.npy"),
-                    frame)
-            self._frame_n += 1
-            self._t = 0
+
+        if self.storage == "h5":
+            # a new store for the first frame; later frames (a continued or
+            # resumed run) are appended to the frames recorded before them
+            if self._frame_store is None:
+                self._frame_store = FrameStore(
+                    path.joinpath(f"{self.dir_name}.h5"),
+                    mode="w" if frame_n == 0 else "a",
+                    shape=frame.shape, dtype=frame.dtype,
+                    complevel=self.complevel, complib=self.complib,
+                    mask=self.model.cardiac_tissue.mesh,
+                    attrs=self._frame_attrs())
+                self._frame_store.truncate(frame_n)
+            self._frame_store.append(frame, t)
         else:
-            self._t += self._dt
+            np.save(path.joinpath(self.dir_name, f"{frame_n}.npy"), frame)
+
+    def finalize(self):
+        """
+        Waits for the background writer and closes the frame store of the
+        "h5" storage.
+        """
+        self._close_writer()
+        if self._frame_store is not None:
+            self._frame_store.close()
+            self._frame_store = None
 
     def write(self, path=None, clim=[0, 1], cmap="viridis", scalar_bar=False,
               format="mp4", clear=False, **kwargs):
@@ -116,8 +244,13 @@ class Animation3DTracker(Tracker):
         if path is None:
             path = self.path
 
+        frames_path = Path(self.path).joinpath(self.dir_name)
+        if self.storage == "h5":
+            self.finalize()
+            frames_path = frames_path.with_name(f"{self.dir_name}.h5")
+
         animation_builder = Animation3DBuilder()
-        animation_builder.write(Path(self.path).joinpath(self.dir_name),
+        animation_builder.write(frames_path,
                                 path_save=path,
                                 mask=self.model.cardiac_tissue.mesh,
                                 scalar_name=self.target_array,
@@ -125,4 +258,7 @@ class Animation3DTracker(Tracker):
                                 scalar_bar=scalar_bar, format=format, **kwargs)
 
         if clear:
-            shatilib.rmtree(Path(self.path).joinpath(self.dir_name))
+            if self.storage == "h5":
+                frames_path.unlink()
+            else:
+                shatilib.rmtree(frames_path)
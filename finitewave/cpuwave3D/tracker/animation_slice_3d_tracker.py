@@ -2,13 +2,13 @@ import os
 import numpy as np
 
 from finitewave.core.tracker.tracker import Tracker
+from finitewave.tools.frame_store import FrameStore
 
 
 class AnimationSlice3DTracker(Tracker):
     def __init__(self):
         Tracker.__init__(self)
         self.step = 1
-        self._t   = 0
 
         self.dir_name = "animation"
 
@@ -29,17 +29,26 @@ class AnimationSlice3DTracker(Tracker):
         self._frame_format_type = ""
         self._frame_format_mult = 1
 
+        self.storage = "npy"
+        self.complevel = 0
+        self.complib = "blosc"
+        self._frame_store = None
+        self.state_vars = ["_frame_n"]
+
     def initialize(self, model):
         self.model = model
 
-        self._t   = 0
         self._frame_n = 0
         self._dt  = self.model.dt
-        self._step = self.step - self._dt      
+        self.interval = max(1, self.model.time_to_step(self.step))
+
+        self.finalize()
 
-        if not os.path.exists(os.path.join(self.path, self.dir_name)):
+        if self.storage == "npy" and not os.path.exists(os.path.join(self.path, self.dir_name)):
             os.makedirs(os.path.join(self.path, self.dir_name))
 
+        self._start_writer()
+
         if self.slice_d == 0:
             self._get_slice = lambda a: a[self.slice_n,:,:]
         elif self.slice_d == 1:
@@ -51,13 +60,35 @@ class AnimationSlice3DTracker(Tracker):
         self._frame_format_mult = self.frame_format["mult"]   
 
     def track(self):
-        if self._t > self._step:
-            frame = (self._get_slice(self.model.__dict__[self.target_array])*self._frame_format_mult).astype(self._frame_format_type)
-            np.save(os.path.join(self.path, self.dir_name, str(self._frame_n)), frame)
-            self._frame_n += 1
-            self._t = 0
+        frame = (self._get_slice(self.model.__dict__[self.target_array])*self._frame_format_mult).astype(self._frame_format_type)
+        self._save_frame(frame)
+
+    def _save_frame(self, frame):
+        self._submit(self._write_frame, frame, self._frame_n, self.model.t)
+        self._frame_n += 1
+
+    def _write_frame(self, frame, frame_n, t):
+        if self.storage == "h5":
+            # a new store for the first frame; later frames (a continued or resumed run) are appended to
+            # the frames recorded before them
+            if self._frame_store is None:
+                self._frame_store = FrameStore(os.path.join(self.path, self.dir_name + ".h5"),
+                                               mode="w" if frame_n == 0 else "a",
+                                               shape=frame.shape, dtype=frame.dtype,
+                                               complevel=self.complevel, complib=self.complib,
+                                               dt=self.model.dt,
+                                               attrs={"step": self.step, "mult": self._frame_format_mult,
+                                                      "slice_n": self.slice_n, "slice_d": self.slice_d})
+                self._frame_store.truncate(frame_n)
+            self._frame_store.append(frame, t)
         else:
-            self._t += self._dt
+            np.save(os.path.join(self.path, self.dir_name, str(frame_n)), frame)
 
     def write(self):
         pass
+
+    def finalize(self):
+        self._close_writer()
+        if self._frame_store is not None:
+            self._frame_store.close()
+            self._frame_store = None
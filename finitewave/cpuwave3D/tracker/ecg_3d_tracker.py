@@ -36,9 +36,12 @@ class ECG3DTracker(Tracker):
         self.step = 1
         self._index = 0
         self.memory_save = memory_save
+        self.state_vars = ["ecg", "_index"]
 
     def initialize(self, model):
         self.model = model
+        self.interval = self.step
+        self._index = 0
         n = self.measure_coords.shape[0]
         m = int(np.ceil(model.t_max / (self.step * model.dt)))
         self.ecg = np.zeros((n, m), dtype=model.npfloat)
@@ -84,9 +87,8 @@ class ECG3DTracker(Tracker):
         return self.uni_voltage(current) / self.model.dr
 
     def track(self):
-        if self.model.step % self.step == 0:
-            self.ecg[:, self._index] = self.calc_ecg()
-            self._index += 1
+        self.ecg[:, self._index] = self.calc_ecg()
+        self._index += 1
 
     def write(self):
         if not os.path.exists(self.dir_name):
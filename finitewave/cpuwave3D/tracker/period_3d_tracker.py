@@ -33,6 +33,7 @@ class Period3DTracker(Tracker):
         self._step            = 0
 
         self.file_name = "period"
+        self.state_vars = ["_periods", "_detectors_state", "_step"]
 
     def initialize(self, model):
         self.model = model
@@ -162,9 +162,9 @@ class Spiral3DTracker(Tracker):
         self.all = False
 
         self.step = 1
-        self._t   = 0
 
         self._u_prev_step = np.array([])
+        self.state_vars = ["swcore", "_u_prev_step"]
 
     def initialize(self, model):
         self.model = model
@@ -172,6 +172,7 @@ class Spiral3DTracker(Tracker):
         self.size_i, self.size_j, self.size_k = self.model.cardiac_tissue.shape
         self.dt = self.model.dt
         self.dr = self.model.dr
+        self.interval = max(1, self.model.time_to_step(self.step))
         self._u_prev_step = np.zeros([self.size_i, self.size_j, self.size_k])
         self._tipdata = np.zeros([102, 2])
 
@@ -179,33 +180,29 @@ class Spiral3DTracker(Tracker):
         return _track_tipline(self.size_i, self.size_j, var1, var2, tipvals, tipdata, tipsfound, mesh)
 
     def track(self):
-        if self._t > self.step:
 
-            tipvals = [0, 0]
-            tipvals[0] = self.threshold
-            tipvals[1] = self.threshold
+        tipvals = [0, 0]
+        tipvals[0] = self.threshold
+        tipvals[1] = self.threshold
 
-            tipsfound = 0
-            sum = 0
+        tipsfound = 0
+        sum = 0
 
-            for k in range(self.size_k):
+        for k in range(self.size_k):
 
-                self._tipdata, tipsfound = self.track_tipline(self._u_prev_step[:,:,k], self.model.u[:,:,k], tipvals, self._tipdata, tipsfound, self.model.cardiac_tissue.mesh[:,:,k])
+            self._tipdata, tipsfound = self.track_tipline(self._u_prev_step[:,:,k], self.model.u[:,:,k], tipvals, self._tipdata, tipsfound, self.model.cardiac_tissue.mesh[:,:,k])
 
-                if self.all:
-                    if not tipsfound:
-                        self.swcore.append([self.model.t, 0, -1, -1])
-                for i in range(tipsfound):
-                    self.swcore.append([self.model.t, i+sum])
-                    for j in range(2):
-                        self.swcore[-1].append(self._tipdata[i][j]*self.dr)
-                    self.swcore[-1].append(k*self.dr)
+            if self.all:
+                if not tipsfound:
+                    self.swcore.append([self.model.t, 0, -1, -1])
+            for i in range(tipsfound):
+                self.swcore.append([self.model.t, i+sum])
+                for j in range(2):
+                    self.swcore[-1].append(self._tipdata[i][j]*self.dr)
+                self.swcore[-1].append(k*self.dr)
 
-                sum += tipsfound
-            self._u_prev_step = np.copy(self.model.u)
-            self._t = 0
-        else:
-            self._t += self.dt
+            sum += tipsfound
+        self._u_prev_step = np.copy(self.model.u)
 
     def write(self):
         np.savetxt(os.path.join(self.path, self.file_name), np.array(self.swcore))
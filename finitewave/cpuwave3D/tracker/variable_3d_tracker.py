@@ -11,6 +11,7 @@ class Variable3DTracker(Tracker):
         self.cell_ind = [1, 1, 1]
         self.dir_name = "multi_vars"
         self.vars = {}
+        self.state_vars = ["vars"]
 
     def initialize(self, model):
         self.model = model
@@ -4,6 +4,7 @@ from scipy.spatial.distance import euclidean
 import json
 
 from finitewave.cpuwave3D.tracker.activation_time_3d_tracker import ActivationTime3DTracker
+from finitewave.tools.conduction_velocity import conduction_velocity
 
 
 class Velocity3DTracker(ActivationTime3DTracker):
@@ -34,6 +35,15 @@ class Velocity3DTracker(ActivationTime3DTracker):
 
         return euclidean([ind_stim_i, ind_stim_j, ind_stim_k], [ind_front_i, ind_front_j, ind_front_k])*dr/max_act
 
+    def compute_velocity_field(self, method="lsq", radius=1):
+        """
+        Computes the conduction velocity vector of every node from the activation times
+        (see `conduction_velocity`). Returns a 4D array of shape (*act_t.shape, 3) with the
+        velocity vectors (NaN where undefined).
+        """
+        return conduction_velocity(self.act_t, self.model.dr, self.model.cardiac_tissue.mesh,
+                                   method, radius)
+
     @property
     def output(self):
         return self.compute_velocity_front()
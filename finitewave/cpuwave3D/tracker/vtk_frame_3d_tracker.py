@@ -1,6 +1,8 @@
+import os
 from pathlib import Path
 
 from finitewave.tools.vis_mesh_builder_3d import VisMeshBuilder3D
+from finitewave.tools.vtkhdf_writer import VTKHDFWriter
 from finitewave.core.tracker.tracker import Tracker
 
 
@@ -8,12 +10,28 @@ class VTKFrame3DTracker(Tracker):
     """
     A class for tracking and saving VTK frames in a 3D model.
 
+    The thresholded grid of the tissue is built once at initialization,
+    only the scalar array is updated for each frame. How the frames are
+    stored depends on `file_type`:
+
+    - ".vtkhdf": a single file `file_name`.vtkhdf (see VTKHDFWriter) holds
+      the grid, written once, and the cell scalars of every frame. ParaView
+      (5.12 or newer) opens it as a time series.
+    - ".vtu": one complete XML file per frame (the grid is repeated in
+      every file) in the directory `file_name`, plus a ParaView collection
+      `file_name`.pvd with the frame times written at the end of the
+      simulation.
+    - ".vtk": one complete legacy file per frame in the directory
+      `file_name`.
+
     Attributes:
-        step (int): The step size for tracking frames.
-        file_name (str): The name of the file to save the frames
-                         ".vtk" or ".vtu"
+        step (float): The interval in model time units between frames.
+        file_name (str): The name of the frame file (".vtkhdf") or
+                         directory (".vtk", ".vtu").
         target_array (str): The name of the target array to be tracked.
-        file_type (str): The file type of the saved frames.
+        file_type (str): The file type of the saved frames: ".vtk"
+                         (default), ".vtu" or ".vtkhdf".
+        async_write (bool): Write the frames in a background thread.
     """
     def __init__(self):
         Tracker.__init__(self)
@@ -22,19 +40,27 @@ class VTKFrame3DTracker(Tracker):
         self.target_array = ""
         self.file_type = ".vtk"
 
-        self._t = 0
         self._frame_n = 0
+        self._frames = []
+        self._mesh_builder = None
+        self._series = None
+        self.state_vars = ["_frame_n", "_frames"]
 
     def initialize(self, model):
         self.model = model
 
-        self._t = 0
         self._frame_n = 0
+        self._frames = []
         self._dt = self.model.dt
+        self.interval = max(1, self.model.time_to_step(self.step))
 
         self.path = Path(self.path)
 
-        if not self.path.joinpath(self.file_name).exists():
+        if self.file_type not in (".vtk", ".vtu", ".vtkhdf"):
+            raise ValueError("File type must be '.vtk', '.vtu' or '.vtkhdf'")
+
+        if (self.file_type != ".vtkhdf"
+                and not self.path.joinpath(self.file_name).exists()):
             self.path.joinpath(self.file_name).mkdir(parents=True)
 
         if self.target_array == "":
@@ -43,22 +69,71 @@ class VTKFrame3DTracker(Tracker):
         if self.target_array not in self.model.__dict__:
             raise ValueError(f"Array {self.target_array} not found in model.")
 
-    def track(self):
-        if self._t > self.step:
-            frame_name = self.path.joinpath(self.file_name,
-                                            f"frame{self._frame_n}"
-                                            ).with_suffix(self.file_type)
+        self._mesh_builder = VisMeshBuilder3D()
+        self._mesh_builder.build_mesh(self.model.cardiac_tissue.mesh)
+
+        self.finalize()  # Close the file of a previous run
+        self._start_writer()
 
-            self.write_frame(frame_name)
+    def track(self):
+        if self.file_type == ".vtkhdf":
+            values = self._mesh_builder.cell_scalars(
+                self.model.__dict__[self.target_array])
+            self._submit(self._write_vtkhdf_frame, values, self._frame_n,
+                         self.model.t)
             self._frame_n += 1
-            self._t = 0
-        else:
-            self._t += self._dt
+            return
+
+        frame_name = self.path.joinpath(self.file_name,
+                                        f"frame{self._frame_n}"
+                                        ).with_suffix(self.file_type)
+
+        self.write_frame(frame_name)
+        self._frame_n += 1
 
     def write_frame(self, frame_name):
         state_var = self.model.__dict__[self.target_array]
+        self._frames.append((self.model.t, str(frame_name)))
+        self._submit(self._write_vtk_frame, state_var, frame_name)
 
-        vtk_mesh_builder = VisMeshBuilder3D()
-        vtk_mesh = vtk_mesh_builder.build_mesh(self.model.cardiac_tissue.mesh)
-        vtk_mesh = vtk_mesh_builder.add_scalar(state_var, self.target_array)
+    def _write_vtk_frame(self, state_var, frame_name):
+        vtk_mesh = self._mesh_builder.add_scalar(state_var, self.target_array)
         vtk_mesh.save(frame_name)
+
+    def _write_vtkhdf_frame(self, values, frame_n, t):
+        # the file (with the grid) is created with the first frame; later
+        # frames (a continued or resumed run) are appended to the frames
+        # recorded before them
+        if self._series is None:
+            self._series = VTKHDFWriter(
+                self.path.joinpath(self.file_name).with_suffix(".vtkhdf"),
+                self._mesh_builder.grid, name=self.target_array,
+                mode="w" if frame_n == 0 else "a", dtype=values.dtype)
+            self._series.truncate(frame_n)
+        self._series.append(values, t)
+
+    def write_collection(self):
+        """Write the ParaView collection (.pvd) of the saved frames.
+        """
+        pvd_path = self.path.joinpath(self.file_name).with_suffix(".pvd")
+        datasets = "\n".join(
+            f'    <DataSet timestep="{t}" part="0" '
+            f'file="{Path(os.path.relpath(frame_name, pvd_path.parent)).as_posix()}"/>'
+            for t, frame_name in self._frames)
+
+        with open(pvd_path, "w") as file:
+            file.write('<?xml version="1.0"?>\n'
+                       '<VTKFile type="Collection" version="0.1">\n'
+                       '  <Collection>\n'
+                       f'{datasets}\n'
+                       '  </Collection>\n'
+                       '</VTKFile>\n')
+
+    def finalize(self):
+        self._close_writer()
+        if self._series is not None:
+            self._series.close()
+            self._series = None
+        # legacy .vtk frames can not be read from a collection
+        if self._frames and self.file_type == ".vtu":
+            self.write_collection()
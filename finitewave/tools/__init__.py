@@ -1,6 +1,11 @@
 from finitewave.tools.animation_builder import AnimationBuilder
+from finitewave.tools.conduction_velocity import conduction_velocity
 from finitewave.tools.drift_velocity_calculation import DriftVelocityCalculation
+from finitewave.tools.tip_trajectories import TipTrajectory, TipTrajectories
 from finitewave.tools.potential_period_animation_builder import PotentialPeriodAnimationBuilder
 from finitewave.tools.vtk_mesh_builder import VTKMeshBuilder
 from finitewave.tools.vis_mesh_builder_3d import VisMeshBuilder3D
+from finitewave.tools.vtkhdf_writer import VTKHDFWriter
 from finitewave.tools.animation_3d_builder import Animation3DBuilder
+from finitewave.tools.frame_store import FrameStore, NpyFrames, open_frames
+from finitewave.tools.frame_renderer import FFMpegPipe, ImageFrameRenderer, MeshFrameRenderer, render_frames
@@ -1,9 +1,8 @@
 from pathlib import Path
 import numpy as np
-import pyvista as pv
-from natsort import natsorted
 
-from finitewave.tools.vis_mesh_builder_3d import VisMeshBuilder3D
+from finitewave.tools.frame_renderer import FFMpegPipe, MeshFrameRenderer, render_frames
+from finitewave.tools.frame_store import open_frames
 
 
 class Animation3DBuilder:
@@ -14,14 +13,18 @@ class Animation3DBuilder:
         """Load the scalar field from a file.
 
         Args:
-            path (str): Path to the snapshot folder.
+            path (str or np.array): Path to the snapshot file or the
+                snapshot itself.
             mask (np.array, optional): Mask to apply to the scalar field.
 
         Returns:
             np.array: Scalar field.
         """
 
-        scalar = np.load(path).astype(float)
+        if isinstance(path, np.ndarray):
+            scalar = path.astype(float)
+        else:
+            scalar = np.load(path).astype(float)
 
         if mask is None:
             return scalar
@@ -37,13 +40,40 @@ class Animation3DBuilder:
         raise ValueError("Mask and scalar must have the same shape, or scalar"
                          + " must have the same shape as mask[mask > 0]")
 
+    def load_frame(self, frames, index, mask=None):
+        """Load a frame written by an animation tracker.
+
+        Frames of tissue nodes only are expanded to the mask and quantized
+        frames are divided by the frame format multiplier (``mult``) stored
+        with the frames.
+
+        Args:
+            frames (FrameStore or NpyFrames): Frames opened with
+                `open_frames`.
+            index (int): Index of the frame.
+            mask (np.array, optional): Mask to apply to the scalar field.
+                Defaults to the mask stored with the frames.
+
+        Returns:
+            np.array: Scalar field.
+        """
+        if mask is None:
+            mask = frames.mask
+        return self.load_scalar(frames[index], mask) / frames.attrs.get("mult", 1)
+
     def write(self, path, mask=None, path_save=None, window_size=(800, 800),
               clim=[0, 1], scalar_name="Scalar", animation_name="animation",
-              cmap="viridis", scalar_bar=False, format="mp4", **kwargs):
+              cmap="viridis", scalar_bar=False, format="mp4", workers=1,
+              **kwargs):
         """Write the animation to a file.
 
+        The frames are loaded ahead in a background thread, rendered
+        off-screen (by a pool of worker processes if ``workers > 1``) and
+        streamed in order to a single ffmpeg process.
+
         Args:
-            path (str): Path to the snapshot folder.
+            path (str): Path to the snapshot folder or to the .h5 frame
+                store.
             mask (np.array, optional): Mask to apply to the scalar field.
                 Defaults to None.
             path_save (str, optional): Path to save the animation.
@@ -57,47 +87,58 @@ class Animation3DBuilder:
             scalar_bar (bool, optional): Show scalar bar. Defaults to False.
             format (str, optional): Format of the animation. Defaults to "mp4".
                 Other options are "gif".
+            workers (int, optional): Number of rendering processes.
+                Defaults to 1 (rendered in this process). The workers are
+                forked, so the calling script needs no
+                ``if __name__ == "__main__":`` guard; if the process cannot
+                be forked safely the frames are rendered in this process
+                (see `render_frames`).
+            **kwargs: ``framerate`` (or ``fps``) of the animation (defaults
+                to 24 for mp4 and 10 for gif) and ``quality`` of the mp4
+                video from 0 to 10 (defaults to 5).
         """
 
-        files = natsorted(Path(path).glob("*.npy"))
+        path = Path(path)
+
+        with open_frames(path) as frames:
+            self._write_frames(frames, path, mask, path_save, window_size,
+                               clim, scalar_name, animation_name, cmap,
+                               scalar_bar, format, workers, **kwargs)
 
-        if len(files) == 0:
+    def _write_frames(self, frames, path, mask, path_save, window_size, clim,
+                      scalar_name, animation_name, cmap, scalar_bar, format,
+                      workers=1, **kwargs):
+        if len(frames) == 0:
             raise ValueError("No files found")
 
+        if format not in ("mp4", "gif"):
+            raise ValueError("Format must be 'mp4' or 'gif'")
+
         if path_save is None:
             path_save = path.parent
 
-        scalar = self.load_scalar(files[0], mask)
-
         if mask is None:
-            mask = np.ones_like(scalar)
+            mask = frames.mask
 
-        mesh_builder = VisMeshBuilder3D()
-        mesh_builder.build_mesh(mask)
-
-        pl = pv.Plotter(notebook=False, off_screen=True,
-                        window_size=window_size)
+        if mask is None:
+            mask = np.ones_like(self.load_scalar(frames[0]))
 
+        fps = kwargs.pop("framerate", kwargs.pop("fps", 24 if format == "mp4" else 10))
+        # quality 0-10 as in pyvista.Plotter.open_movie
+        crf = None
         if format == "mp4":
-            pl.open_movie(Path(path_save).joinpath(f'{animation_name}.mp4'),
-                          **kwargs)
-        elif format == "gif":
-            pl.open_gif(str(Path(path_save).joinpath(f'{animation_name}.gif')),
-                        **kwargs)
-        else:
-            raise ValueError("Format must be 'mp4' or 'gif'")
-
-        mesh_builder.add_scalar(scalar, scalar_name)
-        pl.add_mesh(mesh_builder.grid, scalars=scalar_name,
-                    clim=clim, cmap=cmap, show_scalar_bar=scalar_bar)
-
-        pl.show(auto_close=False)
-
-        pl.write_frame()
-
-        for filename in files[1:]:
-            scalar = self.load_scalar(filename, mask)
-            mesh_builder.add_scalar(scalar, scalar_name)
-            pl.write_frame()
-
-        pl.close()
+            crf = int(round(51 * (1 - kwargs.pop("quality", 5) / 10)))
+
+        renderer = MeshFrameRenderer(mask, window_size, clim, scalar_name,
+                                     cmap, scalar_bar)
+        images = render_frames(
+            renderer, lambda i: self.load_frame(frames, i, mask),
+            len(frames), workers)
+
+        file_name = Path(path_save).joinpath(f'{animation_name}.{format}')
+        try:
+            with FFMpegPipe(file_name, fps, crf=crf) as pipe:
+                for image in images:
+                    pipe.write(image)
+        finally:
+            renderer.close()
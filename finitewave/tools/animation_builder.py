@@ -1,10 +1,9 @@
-import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.animation import FFMpegWriter
-import time
 import sys
 import os
 
+from finitewave.tools.frame_store import open_frames
+from finitewave.tools.frame_renderer import FFMpegPipe, ImageFrameRenderer, render_frames
+
 
 class AnimationBuilder:
     def __init__(self):
@@ -16,26 +15,37 @@ class AnimationBuilder:
         # take into account the user path:
         self._prefix = os.getcwd()
 
-    def write_2d_mp4(self, file_name, title="", fps=5, dpi=100):
-        metadata = dict(title=title, artist='finitewave')
-        writer = FFMpegWriter(fps=fps, metadata=metadata)
+    def write_2d_mp4(self, file_name, title="", fps=5, dpi=100, workers=1):
+        """
+        Writes the frames of `dir_name` to a movie with ffmpeg.
 
-        frames_list = os.listdir(self.dir_name)
-        frames_list.sort(key=lambda x: int(x.split(".")[0]))
+        Parameters
+        ----------
+        file_name : str
+            Name of the movie file.
+        title : str, optional
+            Title stored in the movie metadata. Default is "".
+        fps : float, optional
+            Frame rate of the movie. Default is 5.
+        dpi : int, optional
+            Resolution of the frames. Default is 100.
+        workers : int, optional
+            Number of processes that render the frames. Default is 1 (rendered in this process).
+            The workers are forked, so the calling script needs no ``if __name__ == "__main__":``
+            guard; if the process cannot be forked safely the frames are rendered in this process
+            (see `render_frames`).
+        """
+        # dir_name is a directory of .npy frames or an .h5 frame store
+        with open_frames(os.path.join(self._prefix, self.dir_name)) as frames:
+            N = len(frames)
+            if not N:
+                return
 
-        if not len(frames_list):
-            return
-        fig = plt.figure()
-        frame_data = np.load(os.path.join(self._prefix, self.dir_name, frames_list[0]))
-        anim = plt.imshow(frame_data, vmax=self.vmax, vmin=self.vmin, animated=True)
-        plt.colorbar(anim)
-        with writer.saving(fig, os.path.join(self._prefix, file_name), dpi):
-            start_time = time.time()
-            N = len(frames_list)
-            for i in range(1, N):
-                frame_data = np.load(os.path.join(self._prefix, self.dir_name, frames_list[i]))
-                anim.set_array(frame_data)
-                writer.grab_frame()
-                sys.stdout.write("Writing frames: %d  of %d\r" % (i, N))
-                sys.stdout.flush()
-        plt.close()
+            # frames are rendered (by worker processes if workers > 1) and streamed to ffmpeg in order
+            renderer = ImageFrameRenderer([self.vmin], [self.vmax], dpi=dpi)
+            images = render_frames(renderer, lambda i: (frames[i],), N, workers)
+            with FFMpegPipe(os.path.join(self._prefix, file_name), fps, title) as pipe:
+                for i, image in enumerate(images):
+                    pipe.write(image)
+                    sys.stdout.write("Writing frames: %d  of %d\r" % (i + 1, N))
+                    sys.stdout.flush()
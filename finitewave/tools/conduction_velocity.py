@@ -0,0 +1,196 @@
+import numpy as np
+from numba import njit, prange
+
+
+def conduction_velocity(act_t, dr, mesh=None, method="lsq", radius=1):
+    """
+    Computes the conduction velocity vector of every node from an activation time map.
+
+    The local gradient ``g`` of the activation time is estimated at each activated node and the
+    conduction velocity is ``g / |g|^2`` (pointing in the direction of propagation, with the magnitude
+    equal to the inverse of the gradient magnitude). Two estimates of the gradient are available:
+
+    - ``"gradient"``: central differences along each axis (one-sided where a neighbour is not
+      activated or not tissue).
+    - ``"lsq"``: least-squares fit of a plane to the activation times of the nodes within `radius`
+      of the node, which is less sensitive to the discrete steps of the activation times.
+
+    The computation runs in parallel over the nodes in compiled kernels.
+
+    Parameters
+    ----------
+    act_t : numpy.ndarray
+        2D or 3D array of activation times (negative for nodes that were not activated), e.g. the
+        output of the activation time trackers.
+    dr : float
+        Spatial resolution of the mesh.
+    mesh : numpy.ndarray, optional
+        The tissue mesh; only nodes with ``mesh == 1`` are used. Default is None (all nodes).
+    method : str, optional
+        ``"lsq"`` (default) or ``"gradient"``.
+    radius : int, optional
+        Radius of the neighbourhood (in nodes) of the ``"lsq"`` method. Default is 1.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (*act_t.shape, act_t.ndim) with the conduction velocity vectors (in units of
+        `dr` per unit of time). The vectors are NaN where the gradient cannot be estimated or
+        vanishes (e.g. at nodes activated simultaneously by a stimulus).
+    """
+    act_t = np.ascontiguousarray(act_t, dtype=np.float64)
+    valid = act_t >= 0
+    if mesh is not None:
+        valid &= np.asarray(mesh) == 1
+
+    if act_t.ndim == 2:
+        kernels = {"gradient": _gradient_2d, "lsq": _lsq_2d}
+    elif act_t.ndim == 3:
+        kernels = {"gradient": _gradient_3d, "lsq": _lsq_3d}
+    else:
+        raise ValueError("Activation time map must be 2D or 3D")
+
+    if method not in kernels:
+        raise ValueError(f"Unknown method {method!r}: use 'lsq' or 'gradient'")
+
+    grad = np.full((*act_t.shape, act_t.ndim), np.nan)
+    if method == "lsq":
+        kernels[method](grad, act_t, valid, int(radius))
+    else:
+        kernels[method](grad, act_t, valid)
+
+    grad /= dr
+    norm2 = np.sum(grad**2, axis=-1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(norm2 > 0, grad / norm2, np.nan)
+
+
+@njit
+def _difference(t_prev, t_next, t_node, has_prev, has_next):
+    """
+    Returns the difference of the activation time along one axis (per node spacing).
+    """
+    if has_prev and has_next:
+        return 0.5 * (t_next - t_prev)
+    if has_next:
+        return t_next - t_node
+    if has_prev:
+        return t_node - t_prev
+    return np.nan
+
+
+@njit(parallel=True)
+def _gradient_2d(grad, act_t, valid):
+    n_i, n_j = act_t.shape
+    for i in prange(n_i):
+        for j in range(n_j):
+            if not valid[i, j]:
+                continue
+            t = act_t[i, j]
+            grad[i, j, 0] = _difference(act_t[max(i - 1, 0), j], act_t[min(i + 1, n_i - 1), j], t,
+                                        i > 0 and valid[i - 1, j],
+                                        i < n_i - 1 and valid[i + 1, j])
+            grad[i, j, 1] = _difference(act_t[i, max(j - 1, 0)], act_t[i, min(j + 1, n_j - 1)], t,
+                                        j > 0 and valid[i, j - 1],
+                                        j < n_j - 1 and valid[i, j + 1])
+
+
+@njit(parallel=True)
+def _gradient_3d(grad, act_t, valid):
+    n_i, n_j, n_k = act_t.shape
+    for i in prange(n_i):
+        for j in range(n_j):
+            for k in range(n_k):
+                if not valid[i, j, k]:
+                    continue
+                t = act_t[i, j, k]
+                grad[i, j, k, 0] = _difference(act_t[max(i - 1, 0), j, k],
+                                               act_t[min(i + 1, n_i - 1), j, k], t,
+                                               i > 0 and valid[i - 1, j, k],
+                                               i < n_i - 1 and valid[i + 1, j, k])
+                grad[i, j, k, 1] = _difference(act_t[i, max(j - 1, 0), k],
+                                               act_t[i, min(j + 1, n_j - 1), k], t,
+                                               j > 0 and valid[i, j - 1, k],
+                                               j < n_j - 1 and valid[i, j + 1, k])
+                grad[i, j, k, 2] = _difference(act_t[i, j, max(k - 1, 0)],
+                                               act_t[i, j, min(k + 1, n_k - 1)], t,
+                                               k > 0 and valid[i, j, k - 1],
+                                               k < n_k - 1 and valid[i, j, k + 1])
+
+
+@njit(parallel=True)
+def _lsq_2d(grad, act_t, valid, radius):
+    n_i, n_j = act_t.shape
+    for i in prange(n_i):
+        for j in range(n_j):
+            if not valid[i, j]:
+                continue
+            t = act_t[i, j]
+            # normal equations of the fit dt = g . d over the neighbours
+            a_xx = a_xy = a_yy = 0.
+            b_x = b_y = 0.
+            for ni in range(max(i - radius, 0), min(i + radius + 1, n_i)):
+                for nj in range(max(j - radius, 0), min(j + radius + 1, n_j)):
+                    d_x = ni - i
+                    d_y = nj - j
+                    if d_x * d_x + d_y * d_y > radius * radius or not valid[ni, nj]:
+                        continue
+                    dt = act_t[ni, nj] - t
+                    a_xx += d_x * d_x
+                    a_xy += d_x * d_y
+                    a_yy += d_y * d_y
+                    b_x += d_x * dt
+                    b_y += d_y * dt
+
+            det = a_xx * a_yy - a_xy * a_xy
+            if det <= 1e-12 * (a_xx + a_yy) ** 2:
+                continue
+            grad[i, j, 0] = (a_yy * b_x - a_xy * b_y) / det
+            grad[i, j, 1] = (a_xx * b_y - a_xy * b_x) / det
+
+
+@njit(parallel=True)
+def _lsq_3d(grad, act_t, valid, radius):
+    n_i, n_j, n_k = act_t.shape
+    for i in prange(n_i):
+        for j in range(n_j):
+            for k in range(n_k):
+                if not valid[i, j, k]:
+                    continue
+                t = act_t[i, j, k]
+                # normal equations of the fit dt = g . d over the neighbours
+                a_xx = a_xy = a_xz = a_yy = a_yz = a_zz = 0.
+                b_x = b_y = b_z = 0.
+                for ni in range(max(i - radius, 0), min(i + radius + 1, n_i)):
+                    for nj in range(max(j - radius, 0), min(j + radius + 1, n_j)):
+                        for nk in range(max(k - radius, 0), min(k + radius + 1, n_k)):
+                            d_x = ni - i
+                            d_y = nj - j
+                            d_z = nk - k
+                            if (d_x * d_x + d_y * d_y + d_z * d_z > radius * radius
+                                    or not valid[ni, nj, nk]):
+                                continue
+                            dt = act_t[ni, nj, nk] - t
+                            a_xx += d_x * d_x
+                            a_xy += d_x * d_y
+                            a_xz += d_x * d_z
+                            a_yy += d_y * d_y
+                            a_yz += d_y * d_z
+                            a_zz += d_z * d_z
+                            b_x += d_x * dt
+                            b_y += d_y * dt
+                            b_z += d_z * dt
+
+                # inverse of the symmetric matrix by cofactors
+                c_xx = a_yy * a_zz - a_yz * a_yz
+                c_xy = a_xz * a_yz - a_xy * a_zz
+                c_xz = a_xy * a_yz - a_xz * a_yy
+                c_yy = a_xx * a_zz - a_xz * a_xz
+                c_yz = a_xy * a_xz - a_xx * a_yz
+                c_zz = a_xx * a_yy - a_xy * a_xy
+                det = a_xx * c_xx + a_xy * c_xy + a_xz * c_xz
+                if det <= 1e-12 * (a_xx + a_yy + a_zz) ** 3:
+                    continue
+                grad[i, j, k, 0] = (c_xx * b_x + c_xy * b_y + c_xz * b_z) / det
+                grad[i, j, k, 1] = (c_xy * b_x + c_yy * b_y + c_yz * b_z) / det
+                grad[i, j, k, 2] = (c_xz * b_x + c_yz * b_y + c_zz * b_z) / det
@@ -11,16 +11,21 @@ class DriftVelocityCalculation:
     def __init__(self):
         self.swcore = []
         self.time_span = 0.
+        self.tip_id = None
 
     def compute_drift(self):
         swcore = np.array(self.swcore)
-        step   = swcore[1, 0] - swcore[0, 0]
+        # rows without a detected tip carry the id -1
+        swcore = swcore[swcore[:, 1] >= 0]
+        if self.tip_id is not None:
+            swcore = swcore[swcore[:, 1] == self.tip_id]
 
-        indx = int(self.time_span/step)
+        if self.time_span > 0:
+            swcore = swcore[swcore[:, 0] >= swcore[-1, 0] - self.time_span]
 
-        time   = swcore[-indx:, 0]
-        comp_x = swcore[-indx:, 2]
-        comp_y = swcore[-indx:, 3]
+        time   = swcore[:, 0]
+        comp_x = swcore[:, 2]
+        comp_y = swcore[:, 3]
 
         a_x, b_x = curve_fit(_line, time, comp_x)[0]
         a_y, b_y = curve_fit(_line, time, comp_y)[0]
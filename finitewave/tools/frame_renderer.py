@@ -0,0 +1,433 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+import multiprocessing
+import subprocess
+import tempfile
+import warnings
+import numpy as np
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from finitewave.core.model.fork_safety import fork_safe
+
+
+def render_frames(renderer, load, count, workers=1, batch_size=8):
+    """
+    Renders frames, optionally in parallel, and yields the images in order.
+
+    The frame data is loaded in the calling process by a background thread, one batch ahead of the
+    rendering. By default the frames are rendered in the calling process. With ``workers > 1`` the
+    batches are rendered off-screen by a pool of worker processes (each with its own copy of
+    `renderer`); at most two batches per worker are in flight, so the memory stays bounded for any
+    number of frames.
+
+    The workers are created with the ``fork`` start method, so the calling script is not imported
+    again by them and needs no ``if __name__ == "__main__":`` guard. If the process cannot be forked
+    safely (see `fork_safe`), the frames are rendered in the calling process with a warning. Set
+    ``NUMBA_THREADING_LAYER=workqueue`` to fork after parallel (3D) kernels.
+
+    Parameters
+    ----------
+    renderer : object
+        Picklable object with a ``render(data)`` method that returns the image of a frame as an RGB
+        ``uint8`` array of shape (height, width, 3).
+    load : callable
+        Function ``load(i)`` that returns the data of the frame `i` passed to ``renderer.render``.
+    count : int
+        Number of frames.
+    workers : int, optional
+        Number of worker processes. Default is 1 (the frames are rendered in the calling process).
+    batch_size : int, optional
+        Number of frames sent to a worker at once. Default is 8.
+
+    Yields
+    ------
+    numpy.ndarray
+        The RGB images of the frames, in order.
+    """
+    if workers > 1 and not fork_safe():
+        warnings.warn("The process cannot be forked safely, the frames are rendered in this process",
+                      RuntimeWarning)
+        workers = 1
+
+    batches = iter([range(start, min(start + batch_size, count))
+                    for start in range(0, count, batch_size)])
+
+    with ExitStack() as stack:
+        pool = None
+        if workers > 1:
+            # the renderer state (figure, plotter) is created in the workers; the workers are
+            # started before the loader thread so that they are not forked while it reads
+            pool = stack.enter_context(ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker, initargs=(renderer,)))
+            pool.submit(int).result()
+
+        loader = stack.enter_context(ThreadPoolExecutor(max_workers=1))
+
+        def load_next():
+            batch = next(batches, None)
+            if batch is None:
+                return None
+            return loader.submit(lambda: [load(i) for i in batch])
+
+        next_load = load_next()
+
+        if pool is None:
+            while next_load is not None:
+                data = next_load.result()
+                next_load = load_next()
+                for frame_data in data:
+                    yield renderer.render(frame_data)
+            return
+
+        pending = deque()
+        while next_load is not None or pending:
+            while next_load is not None and len(pending) < 2 * workers:
+                data = next_load.result()
+                next_load = load_next()
+                pending.append(pool.submit(_render_batch, data))
+            yield from pending.popleft().result()
+
+
+_worker_renderer = None
+
+
+def _init_worker(renderer):
+    global _worker_renderer
+    _worker_renderer = renderer
+
+
+def _render_batch(data):
+    return [_worker_renderer.render(frame_data) for frame_data in data]
+
+
+class FFMpegPipe:
+    """
+    Streams raw RGB frames into an ffmpeg process that encodes the movie.
+
+    The ffmpeg process is started with the first frame, whose size defines the size of the movie (odd
+    sizes are padded to even ones for the h264 codec). The ffmpeg executable is taken from the
+    matplotlib ``animation.ffmpeg_path`` setting. Files with the ``.gif`` extension are written as GIF
+    animations.
+
+    Attributes
+    ----------
+    file_name : str
+        Path to the movie file.
+    fps : float
+        Frame rate of the movie.
+    title : str
+        Title stored in the movie metadata.
+    crf : int or None
+        Constant rate factor of the h264 codec (0-51, lower is better). Default is None
+        (ffmpeg default).
+
+    Methods
+    -------
+    write(image):
+        Writes an RGB frame.
+    close():
+        Finishes the movie and waits for ffmpeg.
+    """
+
+    def __init__(self, file_name, fps=5, title="", crf=None):
+        """
+        Initializes the pipe. The ffmpeg process is started by the first `write`.
+
+        Parameters
+        ----------
+        file_name : str
+            Path to the movie file.
+        fps : float, optional
+            Frame rate of the movie. Default is 5.
+        title : str, optional
+            Title stored in the movie metadata. Default is "".
+        crf : int, optional
+            Constant rate factor of the h264 codec. Default is None.
+        """
+        self.file_name = str(file_name)
+        self.fps = fps
+        self.title = title
+        self.crf = crf
+        self._process = None
+        self._log = None
+        self._shape = None
+
+    def write(self, image):
+        """
+        Writes an RGB frame.
+
+        Parameters
+        ----------
+        image : numpy.ndarray
+            RGB ``uint8`` array of shape (height, width, 3). All frames must have the same size.
+        """
+        image = np.ascontiguousarray(image, dtype=np.uint8)
+        if self._process is None:
+            self._open(image.shape)
+        elif image.shape != self._shape:
+            raise ValueError(f"Frame shape {image.shape} differs from the movie shape {self._shape}")
+
+        try:
+            self._process.stdin.write(memoryview(image).cast("B"))
+        except BrokenPipeError:
+            self.close()
+
+    def close(self):
+        """
+        Finishes the movie and waits for ffmpeg to exit.
+
+        Raises
+        ------
+        RuntimeError
+            If ffmpeg failed.
+        """
+        if self._process is None:
+            return
+
+        process, self._process = self._process, None
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        process.wait()
+
+        self._log.seek(0)
+        log = self._log.read().decode(errors="replace")
+        self._log.close()
+        if process.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed with code {process.returncode}:\n{log}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _open(self, shape):
+        height, width = shape[:2]
+        self._shape = shape
+
+        args = [matplotlib.rcParams["animation.ffmpeg_path"], "-y", "-loglevel", "error",
+                "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}",
+                "-r", str(self.fps), "-i", "-"]
+        if not self.file_name.endswith(".gif"):
+            args += ["-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+                     "-vcodec", "h264", "-pix_fmt", "yuv420p"]
+            if self.crf is not None:
+                args += ["-crf", str(self.crf)]
+        args += ["-metadata", f"title={self.title}", "-metadata", "artist=finitewave",
+                 self.file_name]
+
+        self._log = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(args, stdin=subprocess.PIPE,
+                                         stdout=subprocess.DEVNULL, stderr=self._log)
+
+
+class ImageFrameRenderer:
+    """
+    Renders 2D frames as images with matplotlib (off-screen, with the Agg canvas).
+
+    Every frame is a tuple with the data of each panel; the panels are shown side by side with their
+    colorbars. The figure is created with the first frame in the process that renders it.
+
+    Attributes
+    ----------
+    vmin : list of float
+        Lower colour limit of each panel.
+    vmax : list of float
+        Upper colour limit of each panel.
+    cmap : list of str
+        Colormap of each panel (None for the matplotlib default).
+    figsize : tuple of float or None
+        Size of the figure in inches (None for the matplotlib default).
+    dpi : int
+        Resolution of the figure.
+
+    Methods
+    -------
+    render(data):
+        Returns the RGB image of the frame.
+    """
+
+    def __init__(self, vmin, vmax, cmap=None, figsize=None, dpi=100):
+        """
+        Initializes the renderer.
+
+        Parameters
+        ----------
+        vmin : list of float
+            Lower colour limit of each panel.
+        vmax : list of float
+            Upper colour limit of each panel.
+        cmap : list of str, optional
+            Colormap of each panel. Default is None (matplotlib default for all panels).
+        figsize : tuple of float, optional
+            Size of the figure in inches. Default is None.
+        dpi : int, optional
+            Resolution of the figure. Default is 100.
+        """
+        self.vmin = list(vmin)
+        self.vmax = list(vmax)
+        self.cmap = list(cmap) if cmap is not None else [None] * len(self.vmin)
+        self.figsize = figsize
+        self.dpi = dpi
+        self._figure = None
+        self._images = None
+
+    def __getstate__(self):
+        # the figure is created in the rendering process
+        state = self.__dict__.copy()
+        state["_figure"] = None
+        state["_images"] = None
+        return state
+
+    def render(self, data):
+        """
+        Returns the RGB image of the frame.
+
+        Parameters
+        ----------
+        data : tuple of numpy.ndarray
+            2D data of each panel.
+
+        Returns
+        -------
+        numpy.ndarray
+            RGB ``uint8`` array of shape (height, width, 3).
+        """
+        if self._figure is None:
+            self._setup(data)
+        for image, panel_data in zip(self._images, data):
+            image.set_array(panel_data)
+
+        canvas = self._figure.canvas
+        canvas.draw()
+        return np.asarray(canvas.buffer_rgba())[..., :3].copy()
+
+    def _setup(self, data):
+        self._figure = Figure(figsize=self.figsize, dpi=self.dpi)
+        FigureCanvasAgg(self._figure)
+        axes = self._figure.subplots(1, len(data), squeeze=False)[0]
+        self._images = []
+        for ax, panel_data, vmin, vmax, cmap in zip(axes, data, self.vmin, self.vmax, self.cmap):
+            image = ax.imshow(panel_data, vmin=vmin, vmax=vmax, cmap=cmap)
+            if len(data) == 1:
+                self._figure.colorbar(image, ax=ax)
+            else:
+                self._figure.colorbar(image, ax=ax, fraction=0.046, pad=0.04)
+            self._images.append(image)
+        if len(data) > 1:
+            self._figure.subplots_adjust(wspace=0.5)
+            self._figure.tight_layout()
+
+
+class MeshFrameRenderer:
+    """
+    Renders 3D frames on the tissue mesh with pyvista (off-screen).
+
+    The plotter is created with the first frame in the process that renders it.
+
+    Attributes
+    ----------
+    mask : numpy.ndarray
+        3D array of the tissue (nodes with ``mask > 0`` are shown).
+    window_size : tuple of int
+        Size of the image in pixels.
+    clim : list of float
+        Colour limits.
+    scalar_name : str
+        Name of the scalar field.
+    cmap : str
+        Colormap.
+    scalar_bar : bool
+        Show the scalar bar.
+
+    Methods
+    -------
+    render(scalar):
+        Returns the RGB image of the frame.
+    """
+
+    def __init__(self, mask, window_size=(800, 800), clim=(0, 1), scalar_name="Scalar",
+                 cmap="viridis", scalar_bar=False):
+        """
+        Initializes the renderer.
+
+        Parameters
+        ----------
+        mask : numpy.ndarray
+            3D array of the tissue.
+        window_size : tuple of int, optional
+            Size of the image in pixels. Default is (800, 800).
+        clim : list of float, optional
+            Colour limits. Default is (0, 1).
+        scalar_name : str, optional
+            Name of the scalar field. Default is "Scalar".
+        cmap : str, optional
+            Colormap. Default is "viridis".
+        scalar_bar : bool, optional
+            Show the scalar bar. Default is False.
+        """
+        self.mask = mask
+        self.window_size = window_size
+        self.clim = clim
+        self.scalar_name = scalar_name
+        self.cmap = cmap
+        self.scalar_bar = scalar_bar
+        self._plotter = None
+        self._mesh_builder = None
+
+    def __getstate__(self):
+        # the plotter is created in the rendering process
+        state = self.__dict__.copy()
+        state["_plotter"] = None
+        state["_mesh_builder"] = None
+        return state
+
+    def render(self, scalar):
+        """
+        Returns the RGB image of the frame.
+
+        Parameters
+        ----------
+        scalar : numpy.ndarray
+            3D scalar field of the frame.
+
+        Returns
+        -------
+        numpy.ndarray
+            RGB ``uint8`` array of shape (height, width, 3).
+        """
+        if self._plotter is None:
+            self._setup(scalar)
+        else:
+            self._mesh_builder.add_scalar(scalar, self.scalar_name)
+        self._plotter.render()
+        return self._plotter.screenshot(return_img=True)
+
+    def close(self):
+        """
+        Closes the plotter.
+        """
+        if self._plotter is not None:
+            self._plotter.close()
+            self._plotter = None
+
+    def _setup(self, scalar):
+        import pyvista as pv
+        from finitewave.tools.vis_mesh_builder_3d import VisMeshBuilder3D
+
+        self._mesh_builder = VisMeshBuilder3D()
+        self._mesh_builder.build_mesh(self.mask)
+        self._mesh_builder.add_scalar(scalar, self.scalar_name)
+
+        self._plotter = pv.Plotter(notebook=False, off_screen=True,
+                                   window_size=self.window_size)
+        self._plotter.add_mesh(self._mesh_builder.grid, scalars=self.scalar_name,
+                               clim=self.clim, cmap=self.cmap,
+                               show_scalar_bar=self.scalar_bar)
+        self._plotter.show(auto_close=False)
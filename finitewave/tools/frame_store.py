@@ -0,0 +1,331 @@
+from pathlib import Path
+import json
+import numpy as np
+import tables
+
+
+class FrameStore:
+    """
+    Chunked on-disk container for animation frames.
+
+    Frames are appended to a single extendable HDF5 array (PyTables) instead
+    of being written as one ``.npy`` file per frame. The store keeps the
+    frame times and metadata (dt, frame shape, optional tissue mask and any
+    user attributes) next to the frames and provides random access by frame
+    index.
+
+    Attributes
+    ----------
+    path : Path
+        Path to the HDF5 file.
+    mode : str
+        File mode: ``"w"`` to create a new store, ``"a"`` to append to an
+        existing one, ``"r"`` to read an existing one.
+
+    Methods
+    -------
+    append(frame, t):
+        Appends a frame recorded at time `t`.
+    truncate(n_frames):
+        Keeps only the first `n_frames` frames.
+    flush():
+        Flushes buffered frames to disk.
+    close():
+        Closes the file.
+    times:
+        Property that returns the frame times.
+    mask:
+        Property that returns the stored tissue mask (or None).
+    attrs:
+        Property that returns the stored metadata.
+    """
+
+    def __init__(self, path, mode="r", shape=None, dtype="float64",
+                 complevel=0, complib="blosc", dt=None, mask=None,
+                 expected_frames=1000, attrs=None):
+        """
+        Opens or creates a frame store.
+
+        Parameters
+        ----------
+        path : str or Path
+            Path to the HDF5 file.
+        mode : str, optional
+            ``"r"`` (default) to read an existing store, ``"w"`` to create a
+            new one (an existing file is overwritten), ``"a"`` to append to
+            an existing store (created as in ``"w"`` mode if the file does
+            not exist).
+        shape : tuple, optional
+            Shape of a single frame. Required to create a new store.
+        dtype : str or np.dtype, optional
+            Data type of the stored frames. Default is ``"float64"``.
+        complevel : int, optional
+            Compression level (0-9). Default is 0 (no compression).
+        complib : str, optional
+            Compression library supported by PyTables (``"blosc"``,
+            ``"zlib"``, ``"lzo"``, ``"bzip2"``). Default is ``"blosc"``.
+        dt : float, optional
+            Time step of the model that produced the frames.
+        mask : np.ndarray, optional
+            Tissue mask stored once with the frames.
+        expected_frames : int, optional
+            Expected number of frames, used to tune the HDF5 layout.
+        attrs : dict, optional
+            Additional metadata stored with the frames.
+        """
+        self.path = Path(path)
+        self.mode = mode
+
+        if mode not in ("r", "w", "a"):
+            raise ValueError("Mode must be 'r', 'w' or 'a'")
+
+        if mode == "r" or (mode == "a" and self.path.exists()):
+            self._file = tables.open_file(str(self.path), mode=mode)
+            self._frames = self._file.root.frames
+            self._times = self._file.root.t
+            return
+
+        if shape is None:
+            raise ValueError("Frame shape is required to create a FrameStore")
+
+        shape = tuple(int(s) for s in shape)
+        dtype = np.dtype(dtype)
+        filters = None
+        if complevel:
+            filters = tables.Filters(complevel=complevel, complib=complib,
+                                     shuffle=True)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = tables.open_file(str(self.path), mode="w")
+        self._frames = self._file.create_earray(
+            "/", "frames", atom=tables.Atom.from_dtype(dtype),
+            shape=(0, *shape), filters=filters,
+            chunkshape=self._chunkshape(shape, dtype),
+            expectedrows=expected_frames)
+        self._times = self._file.create_earray(
+            "/", "t", atom=tables.Float64Atom(), shape=(0,),
+            expectedrows=expected_frames)
+
+        if mask is not None:
+            self._file.create_array("/", "mask", obj=np.asarray(mask))
+
+        self._frames.attrs.shape = shape
+        self._frames.attrs.dt = dt
+        for key, value in (attrs or {}).items():
+            self._frames.attrs[key] = value
+
+    @staticmethod
+    def _chunkshape(shape, dtype, chunk_bytes=2**20):
+        """
+        Returns a chunk shape holding one frame, split along the first axis
+        so that a chunk does not exceed `chunk_bytes`.
+        """
+        row_bytes = dtype.itemsize * int(np.prod(shape[1:], dtype=np.int64))
+        rows = max(1, min(shape[0], chunk_bytes // max(row_bytes, 1)))
+        return (1, rows, *shape[1:])
+
+    def append(self, frame, t=np.nan):
+        """
+        Appends a frame to the store.
+
+        Parameters
+        ----------
+        frame : np.ndarray
+            Frame with the store frame shape.
+        t : float, optional
+            Time of the frame.
+        """
+        self._frames.append(np.asarray(frame)[np.newaxis])
+        self._times.append([t])
+
+    def truncate(self, n_frames):
+        """
+        Keeps only the first `n_frames` frames of the store (e.g. to drop the
+        frames written after the checkpoint a simulation is resumed from).
+
+        Parameters
+        ----------
+        n_frames : int
+            Number of frames to keep.
+        """
+        if n_frames < len(self):
+            self._frames.truncate(n_frames)
+            self._times.truncate(n_frames)
+
+    def flush(self):
+        """
+        Flushes buffered frames to disk.
+        """
+        if self._file.isopen and self.mode != "r":
+            self._file.flush()
+
+    def close(self):
+        """
+        Closes the file.
+        """
+        if self._file.isopen:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self._frames.nrows
+
+    def __getitem__(self, index):
+        return self._frames[index]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._frames[i]
+
+    @property
+    def shape(self):
+        """
+        Returns the shape of a single frame.
+        """
+        return tuple(int(s) for s in self._frames.shape[1:])
+
+    @property
+    def dtype(self):
+        """
+        Returns the data type of the stored frames.
+        """
+        return self._frames.dtype
+
+    @property
+    def times(self):
+        """
+        Returns the frame times.
+
+        Returns
+        -------
+        np.ndarray
+            Array with the time of each frame.
+        """
+        return self._times[:]
+
+    @property
+    def mask(self):
+        """
+        Returns the tissue mask stored with the frames.
+
+        Returns
+        -------
+        np.ndarray or None
+            Stored mask or None if the store has no mask.
+        """
+        if "/mask" in self._file:
+            return self._file.root.mask[:]
+        return None
+
+    @property
+    def attrs(self):
+        """
+        Returns the metadata stored with the frames.
+
+        Returns
+        -------
+        dict
+            Dictionary with the frame metadata (``shape``, ``dt`` and user
+            attributes).
+        """
+        attrs = self._frames.attrs
+        return {name: attrs[name] for name in attrs._v_attrnamesuser}
+
+
+class NpyFrames:
+    """
+    Read-only access to frames stored as one ``.npy`` file per frame.
+
+    Provides the same reading interface as `FrameStore` for directories
+    written by the animation trackers with ``storage="npy"``. Only files with
+    a numeric stem are treated as frames; ``mask.npy`` and ``attrs.json``
+    hold the mask and the metadata written by the tracker, if any.
+
+    Attributes
+    ----------
+    path : Path
+        Path to the directory with the frames.
+    files : list of Path
+        Frame files sorted by frame number.
+    """
+
+    def __init__(self, path):
+        """
+        Lists the frames in the directory.
+
+        Parameters
+        ----------
+        path : str or Path
+            Path to the directory with the frames.
+        """
+        self.path = Path(path)
+        self.files = sorted((f for f in self.path.glob("*.npy")
+                             if f.stem.isdigit()),
+                            key=lambda f: int(f.stem))
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self.files)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return np.array([np.load(f) for f in self.files[index]])
+        return np.load(self.files[index])
+
+    def __iter__(self):
+        for f in self.files:
+            yield np.load(f)
+
+    @property
+    def times(self):
+        return None
+
+    @property
+    def mask(self):
+        path = self.path.joinpath("mask.npy")
+        if path.exists():
+            return np.load(path)
+        return None
+
+    @property
+    def attrs(self):
+        path = self.path.joinpath("attrs.json")
+        if path.exists():
+            with open(path) as file:
+                return json.load(file)
+        return {}
+
+
+def open_frames(path):
+    """
+    Opens frames written by an animation tracker.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to an HDF5 frame store or to a directory with ``.npy`` frames.
+
+    Returns
+    -------
+    FrameStore or NpyFrames
+        Reader with random access by frame index.
+    """
+    path = Path(path)
+    if path.is_dir():
+        return NpyFrames(path)
+    if not path.exists() and path.with_suffix(".h5").exists():
+        path = path.with_suffix(".h5")
+    return FrameStore(path, mode="r")
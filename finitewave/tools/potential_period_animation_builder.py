@@ -1,10 +1,9 @@
-import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.animation import FFMpegWriter
-import time
 import sys
 import os
 
+from finitewave.tools.frame_store import open_frames
+from finitewave.tools.frame_renderer import FFMpegPipe, ImageFrameRenderer, render_frames
+
 
 class PotentialPeriodAnimationBuilder:
     def __init__(self):
@@ -22,55 +21,53 @@ class PotentialPeriodAnimationBuilder:
         # take into account the user path:
         self._prefix = os.getcwd()
 
-    def write_2d_mp4(self, file_name, title="", fps=5, dpi=100):
-        metadata = dict(title=title, artist='finitewave')
-        writer = FFMpegWriter(fps=fps, metadata=metadata)
-
-        pot_frames_list = os.listdir(self.file_name_pot)
-        pot_frames_list.sort(key=lambda x: int(x.split(".")[0]))
-
-        per_frames_list = os.listdir(self.file_name_per)
-        per_frames_list.sort(key=lambda x: int(x.split(".")[0]))
-
-        if not (len(pot_frames_list) and len(per_frames_list)):
+    def write_2d_mp4(self, file_name, title="", fps=5, dpi=100, workers=1):
+        """
+        Writes the potential and period frames side by side to a movie with ffmpeg.
+
+        Parameters
+        ----------
+        file_name : str
+            Name of the movie file.
+        title : str, optional
+            Title stored in the movie metadata. Default is "".
+        fps : float, optional
+            Frame rate of the movie. Default is 5.
+        dpi : int, optional
+            Resolution of the frames. Default is 100.
+        workers : int, optional
+            Number of processes that render the frames. Default is 1 (rendered in this process).
+            The workers are forked, so the calling script needs no ``if __name__ == "__main__":``
+            guard; if the process cannot be forked safely the frames are rendered in this process
+            (see `render_frames`).
+        """
+        # frames are directories of .npy files or .h5 frame stores
+        pot_frames = open_frames(os.path.join(self._prefix, self.file_name_pot))
+        per_frames = open_frames(os.path.join(self._prefix, self.file_name_per))
+        with pot_frames, per_frames:
+            pipe = FFMpegPipe(os.path.join(self._prefix, file_name), fps, title)
+            with pipe:
+                self._write_frames(pot_frames, per_frames, pipe, dpi, workers)
+
+    def _write_frames(self, pot_frames, per_frames, pipe, dpi, workers=1):
+        if not (len(pot_frames) and len(per_frames)):
             return
 
-        fig, ax = plt.subplots(1,2)
-
-        fig.subplots_adjust(wspace=0.5)
-
-        ax_pot = ax[0]
-        ax_per = ax[1]
-
         if not self.colormap_pot:
             self.colormap_pot = "viridis"
 
         if not self.colormap_per:
             self.colormap_per = "viridis"
 
-        pot_frame_data = np.load(os.path.join(self._prefix, self.file_name_pot, pot_frames_list[0]))
-        per_frame_data = np.load(os.path.join(self._prefix, self.file_name_per, per_frames_list[0]))
-
-        anim_pot  = ax_pot.imshow(pot_frame_data, vmax=self.vmax_pot, vmin=self.vmin_pot, animated=True, cmap=self.colormap_pot)
-        anim_per  = ax_per.imshow(per_frame_data, vmax=self.vmax_per, vmin=self.vmin_per, animated=True, cmap=self.colormap_per)
-
-        fig.colorbar(anim_pot, ax=ax_pot, fraction=0.046, pad=0.04)
-        fig.colorbar(anim_per, ax=ax_per, fraction=0.046, pad=0.04)
-
-        fig.set_figheight(10)
-        fig.set_figwidth(10)
-        plt.tight_layout()
-
-
-        with writer.saving(fig, os.path.join(self._prefix, file_name), dpi):
-            start_time = time.time()
-            N = len(pot_frames_list)
-            for i in range(1, N):
-                pot_frame_data = np.load(os.path.join(self._prefix, self.file_name_pot, pot_frames_list[i]))
-                per_frame_data = np.load(os.path.join(self._prefix, self.file_name_per, per_frames_list[i]))
-                anim_pot.set_array(pot_frame_data)
-                anim_per.set_array(per_frame_data)
-
-                writer.grab_frame()
-                sys.stdout.write("Writing frames: %d  of %d\r" % (i, N))
-                sys.stdout.flush()
+        renderer = ImageFrameRenderer([self.vmin_pot, self.vmin_per],
+                                      [self.vmax_pot, self.vmax_per],
+                                      [self.colormap_pot, self.colormap_per],
+                                      figsize=(10, 10), dpi=dpi)
+
+        # frames are rendered (by worker processes if workers > 1) and streamed to ffmpeg in order
+        N = min(len(pot_frames), len(per_frames))
+        images = render_frames(renderer, lambda i: (pot_frames[i], per_frames[i]), N, workers)
+        for i, image in enumerate(images):
+            pipe.write(image)
+            sys.stdout.write("Writing frames: %d  of %d\r" % (i + 1, N))
+            sys.stdout.flush()
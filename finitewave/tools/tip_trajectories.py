@@ -0,0 +1,357 @@
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+class TipTrajectory:
+    """
+    A single spiral tip trajectory with incrementally updated statistics.
+
+    Points are stored in a growing NumPy buffer and the statistics (drift,
+    lifetime, meander) are updated on every appended point, so they are
+    available at any time without rescanning the trajectory.
+
+    Attributes
+    ----------
+    id : int
+        Identifier of the trajectory.
+    dim : int
+        Number of spatial coordinates of the tip (2 or 3).
+    n : int
+        Number of points in the trajectory.
+    t_birth : float
+        Time of the first point.
+    t_last : float
+        Time of the last point.
+    path_length : float
+        Accumulated length of the tip path.
+    """
+
+    def __init__(self, traj_id, t, position):
+        """
+        Initializes the trajectory with its first point.
+
+        Parameters
+        ----------
+        traj_id : int
+            Identifier of the trajectory.
+        t : float
+            Time of the first point.
+        position : np.ndarray
+            Tip coordinates of the first point.
+        """
+        self.id = traj_id
+        self.dim = len(position)
+        self.n = 0
+        self.t_birth = t
+        self.t_last = t
+        self.path_length = 0.
+
+        self._data = np.zeros([16, self.dim + 1])
+        # running sums for the least-squares drift and the radius of gyration
+        # (time is measured from t_birth to keep the sums well conditioned)
+        self._sum_t = 0.
+        self._sum_tt = 0.
+        self._sum_x = np.zeros(self.dim)
+        self._sum_tx = np.zeros(self.dim)
+        self._sum_xx = np.zeros(self.dim)
+
+        self.append(t, position)
+
+    def append(self, t, position):
+        """
+        Appends a point to the trajectory and updates the statistics.
+
+        Parameters
+        ----------
+        t : float
+            Time of the point.
+        position : np.ndarray
+            Tip coordinates.
+        """
+        if self.n == len(self._data):
+            self._data = np.concatenate([self._data, np.zeros_like(self._data)])
+
+        if self.n:
+            self.path_length += np.linalg.norm(position - self._data[self.n - 1, 1:])
+
+        self._data[self.n, 0] = t
+        self._data[self.n, 1:] = position
+        self.n += 1
+        self.t_last = t
+
+        tau = t - self.t_birth
+        self._sum_t += tau
+        self._sum_tt += tau**2
+        self._sum_x += position
+        self._sum_tx += tau * position
+        self._sum_xx += position**2
+
+    @property
+    def points(self):
+        """
+        Returns the trajectory points.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n, 1 + dim) with rows ``[t, x, y(, z)]``.
+        """
+        return self._data[:self.n]
+
+    @property
+    def position(self):
+        """
+        Returns the last tip position.
+
+        Returns
+        -------
+        np.ndarray
+            Coordinates of the last point.
+        """
+        return self._data[self.n - 1, 1:]
+
+    @property
+    def lifetime(self):
+        """
+        Returns the time between the first and the last point.
+
+        Returns
+        -------
+        float
+            Lifetime of the trajectory.
+        """
+        return self.t_last - self.t_birth
+
+    @property
+    def drift(self):
+        """
+        Returns the drift velocity of the tip.
+
+        The drift is the slope of the least-squares linear fit of the tip
+        coordinates over time.
+
+        Returns
+        -------
+        np.ndarray
+            Drift velocity vector. Zeros if the trajectory has less than
+            two distinct time points.
+        """
+        denom = self.n * self._sum_tt - self._sum_t**2
+        if self.n < 2 or denom <= 0:
+            return np.zeros(self.dim)
+        return (self.n * self._sum_tx - self._sum_t * self._sum_x) / denom
+
+    @property
+    def meander(self):
+        """
+        Returns the meander radius of the tip (radius of gyration of the
+        trajectory around its centroid).
+
+        Returns
+        -------
+        float
+            Meander radius.
+        """
+        mean = self._sum_x / self.n
+        return np.sqrt(max(np.sum(self._sum_xx / self.n - mean**2), 0.))
+
+
+class TipTrajectories:
+    """
+    Links spiral wave tips detected at successive time points into
+    persistent trajectories.
+
+    Tips are matched to the last positions of the active trajectories with a
+    nearest-neighbour search over a k-d tree. Each tip is matched to at most
+    one trajectory and vice versa (closest pairs first). Unmatched tips start
+    new trajectories; trajectories that stay unmatched longer than `max_gap`
+    are closed.
+
+    Attributes
+    ----------
+    link_radius : float
+        Maximum distance between the last trajectory position and a new tip
+        for them to be linked (model units).
+    max_gap : float
+        Maximum time a trajectory may stay unmatched before it is closed.
+    active : dict
+        Trajectories that can still be extended, keyed by id.
+    closed : dict
+        Finished trajectories, keyed by id.
+
+    Methods
+    -------
+    reset():
+        Removes all trajectories.
+    update(t, positions):
+        Links the tips detected at time `t` to the trajectories.
+    trajectories:
+        Property that returns the points of all trajectories.
+    summary():
+        Returns per-trajectory statistics as NumPy arrays.
+    get_state():
+        Returns the trajectories as plain data (for checkpoints).
+    set_state(state):
+        Restores the trajectories saved by `get_state`.
+    """
+
+    def __init__(self, link_radius=1., max_gap=0.):
+        """
+        Initializes the TipTrajectories with the given linking parameters.
+
+        Parameters
+        ----------
+        link_radius : float, optional
+            Maximum linking distance (model units). Default is 1.
+        max_gap : float, optional
+            Maximum time a trajectory may stay unmatched. Default is 0
+            (a trajectory must be continued at the next detection).
+        """
+        self.link_radius = link_radius
+        self.max_gap = max_gap
+        self.reset()
+
+    def reset(self):
+        """
+        Removes all trajectories and resets the id counter.
+        """
+        self.active = {}
+        self.closed = {}
+        self._next_id = 0
+
+    def update(self, t, positions):
+        """
+        Links the tips detected at time `t` to the trajectories.
+
+        Parameters
+        ----------
+        t : float
+            Detection time.
+        positions : np.ndarray
+            Array of shape (m, dim) with the tip coordinates.
+
+        Returns
+        -------
+        np.ndarray
+            Array of m trajectory ids assigned to the tips.
+        """
+        positions = np.asarray(positions, dtype=float)
+        ids = -np.ones(len(positions), dtype=int)
+
+        active = list(self.active.values())
+        if len(active) and len(positions):
+            tree = cKDTree(np.array([traj.position for traj in active]))
+            k = min(3, len(active))
+            dist, ind = tree.query(positions, k=k,
+                                   distance_upper_bound=self.link_radius)
+            dist = dist.reshape(len(positions), k)
+            ind = ind.reshape(len(positions), k)
+
+            tips, nbrs = np.nonzero(np.isfinite(dist))
+            order = np.argsort(dist[tips, nbrs], kind="stable")
+            used = set()
+            for tip, nbr in zip(tips[order], nbrs[order]):
+                traj = active[ind[tip, nbr]]
+                if ids[tip] >= 0 or traj.id in used:
+                    continue
+                traj.append(t, positions[tip])
+                ids[tip] = traj.id
+                used.add(traj.id)
+
+        for tip in np.flatnonzero(ids < 0):
+            traj = TipTrajectory(self._next_id, t, positions[tip])
+            self.active[traj.id] = traj
+            ids[tip] = traj.id
+            self._next_id += 1
+
+        for traj in active:
+            if t - traj.t_last > self.max_gap:
+                self.closed[traj.id] = self.active.pop(traj.id)
+
+        return ids
+
+    def get_state(self):
+        """
+        Returns the trajectories as plain data.
+
+        Returns
+        -------
+        dict
+            Dictionary with the ``ids`` of the trajectories, their
+            ``points``, the ids of the ``active`` trajectories and the
+            next trajectory id.
+        """
+        trajs = self.trajectories
+        return {"ids": list(trajs),
+                "points": [points.copy() for points in trajs.values()],
+                "active": list(self.active),
+                "next_id": self._next_id}
+
+    def set_state(self, state):
+        """
+        Restores the trajectories saved by `get_state`.
+
+        The points are appended again in order, so the statistics of the
+        trajectories are the same as before they were saved.
+
+        Parameters
+        ----------
+        state : dict
+            Dictionary returned by `get_state`.
+        """
+        self.reset()
+        active = set(state["active"])
+        for traj_id, points in zip(state["ids"], state["points"]):
+            points = np.asarray(points, dtype=float)
+            traj = TipTrajectory(traj_id, points[0, 0], points[0, 1:])
+            for point in points[1:]:
+                traj.append(point[0], point[1:])
+            (self.active if traj_id in active else self.closed)[traj_id] = traj
+        self._next_id = state["next_id"]
+
+    def __len__(self):
+        return len(self.active) + len(self.closed)
+
+    def __getitem__(self, traj_id):
+        if traj_id in self.active:
+            return self.active[traj_id]
+        return self.closed[traj_id]
+
+    @property
+    def trajectories(self):
+        """
+        Returns the points of all trajectories.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping trajectory id to an array of shape
+            (n, 1 + dim) with rows ``[t, x, y(, z)]``.
+        """
+        trajs = {**self.closed, **self.active}
+        return {traj_id: trajs[traj_id].points for traj_id in sorted(trajs)}
+
+    def summary(self):
+        """
+        Returns per-trajectory statistics.
+
+        Returns
+        -------
+        dict
+            Dictionary of NumPy arrays ordered by trajectory id with keys
+            ``id``, ``n``, ``t_birth``, ``lifetime``, ``drift`` (shape
+            (n_traj, dim)), ``drift_speed``, ``meander`` and ``path_length``.
+        """
+        trajs = {**self.closed, **self.active}
+        trajs = [trajs[traj_id] for traj_id in sorted(trajs)]
+        drift = np.array([traj.drift for traj in trajs]).reshape(len(trajs), -1)
+        return {
+            "id": np.array([traj.id for traj in trajs], dtype=int),
+            "n": np.array([traj.n for traj in trajs], dtype=int),
+            "t_birth": np.array([traj.t_birth for traj in trajs]),
+            "lifetime": np.array([traj.lifetime for traj in trajs]),
+            "drift": drift,
+            "drift_speed": np.linalg.norm(drift, axis=1),
+            "meander": np.array([traj.meander for traj in trajs]),
+            "path_length": np.array([traj.path_length for traj in trajs]),
+        }
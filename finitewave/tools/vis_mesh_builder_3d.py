@@ -25,6 +25,10 @@ class VisMeshBuilder3D:
         # Threshold the mesh to remove empty space
         self.grid = grid.threshold(0.5)
         self._mesh = mesh
+        # Flat (C order) indices of the grid cells, which follow the
+        # Fortran order of the image cells
+        self._scalar_index = np.ravel_multi_index(
+            np.nonzero(mesh.T > 0)[::-1], mesh.shape)
         return self.grid
 
     def add_scalar(self, scalars, name='Scalars'):
@@ -39,13 +43,24 @@ class VisMeshBuilder3D:
             grid (pv.UnstructuredGrid): pyvista Unstructured Grid.
         """
 
+        self.grid.cell_data[name] = self.cell_scalars(scalars)
+        self.grid.set_active_scalars(name)
+        return self.grid
+
+    def cell_scalars(self, scalars):
+        """Gather the values of a scalar field at the cells of the mesh
+        (the nodes of the non-empty space, in the cell order of the grid).
+
+        Args:
+            scalars (np.array): 3D scalar field.
+
+        Returns:
+            values (np.array): Values of the grid cells.
+        """
         if scalars.shape != self._mesh.shape:
             raise ValueError("Scalars must have the same shape asthe mesh.")
 
-        scalars_flat = scalars.T[self._mesh.T > 0].flatten(order='F')
-        self.grid.cell_data[name] = scalars_flat
-        self.grid.set_active_scalars(name)
-        return self.grid
+        return scalars.reshape(-1)[self._scalar_index]
 
     def add_vector(self, vectors, name='Vectors'):
         """Add a vector field to the mesh. The vector field is flattened
@@ -0,0 +1,178 @@
+from pathlib import Path
+import numpy as np
+import tables
+import pyvista as pv
+from vtk.util.numpy_support import vtk_to_numpy
+
+
+class VTKHDFWriter:
+    """
+    Writes a time series of cell scalars on a fixed unstructured grid to a
+    single VTKHDF file.
+
+    The grid (points, connectivity, cell types) is written once when the
+    file is created; each step only appends the scalar values of the cells
+    and the step time. The file follows the transient ``UnstructuredGrid``
+    layout of the VTKHDF format (version 2.0) and can be opened as a time
+    series by ParaView (5.12 or newer), ``vtkHDFReader`` or ``pyvista.read``.
+
+    Attributes
+    ----------
+    path : Path
+        Path to the ``.vtkhdf`` file.
+    name : str
+        Name of the cell scalar array.
+    n_cells : int
+        Number of cells of the grid.
+
+    Methods
+    -------
+    append(values, t):
+        Appends the cell values of a step at time `t`.
+    truncate(n_steps):
+        Keeps only the first `n_steps` steps.
+    close():
+        Closes the file.
+    """
+
+    # per-step offsets of the (static) geometry in the grid arrays
+    _GEOMETRY_OFFSETS = ("PartOffsets", "PointOffsets", "CellOffsets",
+                         "ConnectivityIdOffsets")
+
+    def __init__(self, path, grid=None, name="Scalars", mode="w",
+                 dtype="float32"):
+        """
+        Creates a new file or opens an existing one for appending.
+
+        Parameters
+        ----------
+        path : str or Path
+            Path to the ``.vtkhdf`` file.
+        grid : vtk.vtkUnstructuredGrid, optional
+            The grid of the time series. Required to create a new file.
+        name : str, optional
+            Name of the cell scalar array. Default is ``"Scalars"``.
+        mode : str, optional
+            ``"w"`` (default) to create a new file (an existing file is
+            overwritten) or ``"a"`` to append to an existing file (created
+            as in ``"w"`` mode if it does not exist).
+        dtype : str or np.dtype, optional
+            Data type of the stored scalars. Default is ``"float32"``.
+        """
+        if mode not in ("w", "a"):
+            raise ValueError("Mode must be 'w' or 'a'")
+
+        self.path = Path(path)
+        self.name = name
+
+        if mode == "a" and self.path.exists():
+            self._file = tables.open_file(str(self.path), mode="a")
+            root = self._file.root.VTKHDF
+            self.n_cells = int(root.NumberOfCells[0])
+            self._values = root.CellData._f_get_child(name)
+            self._steps = root.Steps
+            self._value_offsets = root.Steps.CellDataOffsets._f_get_child(name)
+            return
+
+        if grid is None:
+            raise ValueError("Grid is required to create a VTKHDF file")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = tables.open_file(str(self.path), mode="w")
+        root = self._file.create_group("/", "VTKHDF")
+        root._v_attrs.Version = np.array([2, 0], dtype=np.int64)
+        root._v_attrs.Type = np.bytes_("UnstructuredGrid")
+
+        cells = grid.GetCells()
+        geometry = {
+            "Points": vtk_to_numpy(grid.GetPoints().GetData()).astype(np.float64),
+            "Connectivity": vtk_to_numpy(cells.GetConnectivityArray()).astype(np.int64),
+            "Offsets": vtk_to_numpy(cells.GetOffsetsArray()).astype(np.int64),
+            "Types": np.asarray(pv.wrap(grid).celltypes, dtype=np.uint8),
+        }
+        self.n_cells = int(grid.GetNumberOfCells())
+        counts = {
+            "NumberOfPoints": grid.GetNumberOfPoints(),
+            "NumberOfCells": self.n_cells,
+            "NumberOfConnectivityIds": geometry["Connectivity"].size,
+        }
+        for key, count in counts.items():
+            self._file.create_array(root, key, obj=np.array([count], dtype=np.int64))
+        for key, value in geometry.items():
+            self._file.create_array(root, key, obj=value)
+
+        cell_data = self._file.create_group(root, "CellData")
+        self._values = self._file.create_earray(
+            cell_data, name, atom=tables.Atom.from_dtype(np.dtype(dtype)),
+            shape=(0,), chunkshape=(max(1, min(self.n_cells, 2**18)),))
+
+        self._steps = self._file.create_group(root, "Steps")
+        self._steps._v_attrs.NSteps = np.int64(0)
+        self._file.create_earray(self._steps, "Values",
+                                 atom=tables.Float64Atom(), shape=(0,))
+        self._file.create_earray(self._steps, "NumberOfParts",
+                                 atom=tables.Int64Atom(), shape=(0,))
+        for key in self._GEOMETRY_OFFSETS:
+            self._file.create_earray(self._steps, key,
+                                     atom=tables.Int64Atom(), shape=(0,))
+        offsets = self._file.create_group(self._steps, "CellDataOffsets")
+        self._value_offsets = self._file.create_earray(
+            offsets, name, atom=tables.Int64Atom(), shape=(0,))
+
+    def __len__(self):
+        return int(self._steps._v_attrs.NSteps)
+
+    def append(self, values, t):
+        """
+        Appends the cell values of a step.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Values of the cells (in the cell order of the grid).
+        t : float
+            Time of the step.
+        """
+        values = np.asarray(values).reshape(-1)
+        if values.size != self.n_cells:
+            raise ValueError("Number of values must match the number of cells")
+
+        n_steps = len(self)
+        self._values.append(values)
+        self._value_offsets.append([n_steps * self.n_cells])
+        self._steps.Values.append([t])
+        self._steps.NumberOfParts.append([1])
+        # every step uses the geometry written with the file
+        for key in self._GEOMETRY_OFFSETS:
+            self._steps._f_get_child(key).append([0])
+        self._steps._v_attrs.NSteps = np.int64(n_steps + 1)
+
+    def truncate(self, n_steps):
+        """
+        Keeps only the first `n_steps` steps of the file.
+
+        Parameters
+        ----------
+        n_steps : int
+            Number of steps to keep.
+        """
+        if n_steps >= len(self):
+            return
+        self._values.truncate(n_steps * self.n_cells)
+        self._value_offsets.truncate(n_steps)
+        for key in ("Values", "NumberOfParts", *self._GEOMETRY_OFFSETS):
+            self._steps._f_get_child(key).truncate(n_steps)
+        self._steps._v_attrs.NSteps = np.int64(n_steps)
+
+    def close(self):
+        """
+        Closes the file.
+        """
+        if self._file.isopen:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
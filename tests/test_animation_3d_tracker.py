@@ -0,0 +1,100 @@
+import unittest
+import tempfile
+from pathlib import Path
+import numpy as np
+
+import finitewave as fw
+
+
+class TestAnimation3DTracker(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def run_model(self, storage, frame_format):
+        """
+        Records the potential with a mask compressed, quantized tracker and with a full reference tracker.
+        """
+        n = 10
+        tissue = fw.CardiacTissue3D([n, n, n])
+        tissue.mesh = np.ones([n, n, n], dtype="uint8")
+        tissue.mesh[4:6, 4:6, 4:6] = 0
+        tissue.add_boundaries()
+
+        aliev_panfilov = fw.AlievPanfilov3D()
+        aliev_panfilov.dt = 0.01
+        aliev_panfilov.dr = 0.25
+        aliev_panfilov.t_max = 3
+        aliev_panfilov.prog_bar = False
+
+        stim_sequence = fw.StimSequence()
+        stim_sequence.add_stim(fw.StimVoltageCoord3D(0, 1, 0, 3, 0, n, 0, n))
+
+        tracker_sequence = fw.TrackerSequence()
+        reference = fw.Animation3DTracker()
+        reference.path = self.path
+        reference.dir_name = "reference"
+        reference.target_array = "u"
+        reference.step = 0.5
+        tracker_sequence.add_tracker(reference)
+
+        tracker = fw.Animation3DTracker()
+        tracker.path = self.path
+        tracker.target_array = "u"
+        tracker.step = 0.5
+        tracker.storage = storage
+        tracker.mask_compress = True
+        tracker.frame_format = frame_format
+        tracker_sequence.add_tracker(tracker)
+
+        aliev_panfilov.cardiac_tissue = tissue
+        aliev_panfilov.stim_sequence = stim_sequence
+        aliev_panfilov.tracker_sequence = tracker_sequence
+        aliev_panfilov.run()
+
+        frames_path = self.path / ("animation.h5" if storage == "h5" else "animation")
+        return tissue.mesh, frames_path
+
+    def test_mask_compress(self):
+        mult = 1000
+        builder = fw.Animation3DBuilder()
+        for storage in ["npy", "h5"]:
+            mesh, frames_path = self.run_model(storage, {"type": "int16", "mult": mult})
+            tissue_nodes = mesh > 0
+
+            with fw.open_frames(self.path / "reference") as reference, \
+                    fw.open_frames(frames_path) as frames:
+                self.assertEqual(len(frames), 6)
+                self.assertEqual(len(frames), len(reference))
+                self.assertTrue(np.array_equal(frames.mask, mesh))
+                self.assertEqual(frames.attrs["mult"], mult)
+                self.assertTrue(frames.attrs["mask_compress"])
+
+                for i in range(len(frames)):
+                    u = reference[i]
+                    self.assertEqual(frames[i].dtype, np.int16)
+                    self.assertEqual(frames[i].shape, u[tissue_nodes].shape)
+                    self.assertTrue(np.all(np.abs(frames[i] / mult - u[tissue_nodes]) <= 1 / mult))
+
+                    # the builder expands the frames to the mesh and divides them by mult
+                    expanded = builder.load_frame(frames, i)
+                    self.assertEqual(expanded.shape, mesh.shape)
+                    self.assertFalse(np.any(expanded[~tissue_nodes]))
+                    self.assertTrue(np.all(np.abs(expanded - u)[tissue_nodes] <= 1 / mult))
+
+    def test_integer_overflow(self):
+        # values out of the range of the type saturate instead of wrapping around
+        mesh, frames_path = self.run_model("npy", {"type": "int8", "mult": 1000})
+        with fw.open_frames(self.path / "reference") as reference, \
+                fw.open_frames(frames_path) as frames:
+            for i in range(len(frames)):
+                expected = np.clip(np.rint(reference[i][mesh > 0] * 1000), -128, 127)
+                self.assertTrue(np.array_equal(frames[i], expected))
+            self.assertTrue(np.any(frames[0] == 127))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import numpy as np
+
+import finitewave as fw
+
+
+class TestAPDTracker(unittest.TestCase):
+    def test_paced_tissue(self):
+        n = 30
+        tissue = fw.CardiacTissue2D([n, n])
+        tissue.mesh = np.ones([n, n], dtype="uint8")
+        tissue.add_boundaries()
+
+        aliev_panfilov = fw.AlievPanfilov2D()
+        aliev_panfilov.dt = 0.01
+        aliev_panfilov.dr = 0.25
+        aliev_panfilov.t_max = 110
+        aliev_panfilov.prog_bar = False
+
+        stim_sequence = fw.StimSequence()
+        for t in [0, 35, 70]:
+            stim_sequence.add_stim(fw.StimVoltageCoord2D(t, 1, 0, n, 0, 3))
+
+        tracker_sequence = fw.TrackerSequence()
+        apd_tracker = fw.APD2DTracker()
+        apd_tracker.threshold = 0.5
+        apd_tracker.percent = 90
+        tracker_sequence.add_tracker(apd_tracker)
+
+        act_pot_tracker = fw.ActionPotential2DTracker()
+        act_pot_tracker.cell_ind = [15, 15]
+        tracker_sequence.add_tracker(act_pot_tracker)
+
+        aliev_panfilov.cardiac_tissue = tissue
+        aliev_panfilov.stim_sequence = stim_sequence
+        aliev_panfilov.tracker_sequence = tracker_sequence
+        aliev_panfilov.run()
+
+        events = apd_tracker.events
+        cell = np.all(events["node"] == [15, 15], axis=1)
+        self.assertEqual(np.sum(cell), 3)
+        self.assertEqual(apd_tracker.count[15, 15], 3)
+        self.assertTrue(np.isnan(events["di"][cell][0]))
+        # the APD of a beat and the DI of the next one span the cycle
+        start, apd, di = events["start"][cell], events["apd"][cell], events["di"][cell]
+        self.assertTrue(np.allclose(apd[:-1] + di[1:], np.diff(start)))
+        self.assertAlmostEqual(apd_tracker.apd[15, 15], apd[-1])
+        self.assertAlmostEqual(apd_tracker.beat_map(1)[15, 15], apd[1])
+        self.assertAlmostEqual(apd_tracker.beat_map(-1, "di")[15, 15], di[-1])
+
+        # APD90 of the first beat from the recorded action potential
+        u = act_pot_tracker.output
+        up = np.argmax(u > 0.5)
+        level = u[up:].max() - 0.9 * (u[up:].max() - u[:up].min())
+        end = up + np.argmax(u[up:] < level)
+        self.assertAlmostEqual(apd[0], (end - up) * aliev_panfilov.dt, delta=2 * aliev_panfilov.dt)
+
+
+if __name__ == "__main__":
+    unittest.main()
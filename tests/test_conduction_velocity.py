@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+
+import finitewave as fw
+
+
+class TestConductionVelocity(unittest.TestCase):
+    def test_plane_wave_2d(self):
+        dr = 0.25
+        velocity = np.array([0.3, 0.4])
+        i, j = np.meshgrid(np.arange(50), np.arange(40), indexing="ij")
+        act_t = (i * velocity[0] + j * velocity[1]) * dr / np.dot(velocity, velocity)
+        mesh = np.ones(act_t.shape)
+        mesh[10:20, 10:20] = 0
+
+        for method in ["gradient", "lsq"]:
+            cv = fw.conduction_velocity(act_t, dr, mesh, method, radius=2)
+            self.assertTrue(np.all(np.isnan(cv[mesh == 0])))
+            self.assertTrue(np.allclose(cv[mesh == 1], velocity))
+
+    def test_plane_wave_3d(self):
+        dr = 0.25
+        velocity = np.array([0.2, -0.3, 0.4])
+        i, j, k = np.meshgrid(*[np.arange(20)] * 3, indexing="ij")
+        act_t = (i * velocity[0] + j * velocity[1] + k * velocity[2]) * dr / np.dot(velocity, velocity)
+        act_t -= act_t.min()
+        act_t[:2] = -1
+
+        for method in ["gradient", "lsq"]:
+            cv = fw.conduction_velocity(act_t, dr, method=method)
+            self.assertTrue(np.all(np.isnan(cv[:2])))
+            self.assertTrue(np.allclose(cv[2:], velocity))
+
+    def test_tracker_velocity_field(self):
+        n = 60
+        tissue = fw.CardiacTissue2D([n, n])
+        tissue.mesh = np.ones([n, n], dtype="uint8")
+        tissue.add_boundaries()
+
+        aliev_panfilov = fw.AlievPanfilov2D()
+        aliev_panfilov.dt = 0.01
+        aliev_panfilov.dr = 0.25
+        aliev_panfilov.t_max = 12
+        aliev_panfilov.prog_bar = False
+
+        stim_sequence = fw.StimSequence()
+        stim_sequence.add_stim(fw.StimVoltageCoord2D(0, 1, 0, n, 0, 3))
+
+        tracker_sequence = fw.TrackerSequence()
+        velocity_tracker = fw.Velocity2DTracker()
+        velocity_tracker.threshold = 0.5
+        tracker_sequence.add_tracker(velocity_tracker)
+
+        aliev_panfilov.cardiac_tissue = tissue
+        aliev_panfilov.stim_sequence = stim_sequence
+        aliev_panfilov.tracker_sequence = tracker_sequence
+        aliev_panfilov.run()
+
+        cv = velocity_tracker.compute_velocity_field()[15:45, 15:45]
+        self.assertTrue(np.allclose(cv[..., 0], 0))
+        self.assertAlmostEqual(np.median(cv[..., 1]), 1.6, delta=0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
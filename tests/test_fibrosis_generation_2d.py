@@ -29,3 +29,59 @@ class TestFibrosisGeneration2D(unittest.TestCase):
         self.assertAlmostEqual(percentage, 0.37,
                                msg="Diffuse fibrosis percentage is incorrect! (apply method)",
                                delta=0.01)
+
+    def test_seed_and_batch(self):
+        n = self.n
+        for make in (lambda seed: fw.Diffuse2DPattern(0, n, 0, n, 0.3, seed=seed),
+                     lambda seed: fw.Structural2DPattern(0, n, 0, n, 0.3, 4, 7, seed=seed)):
+            first = make(42).generate([n, n])
+            second = make(42).generate([n, n])
+            self.assertTrue(np.array_equal(first, second))
+
+            batch = make(42).generate_batch([n, n], 3, self.tissue.mesh)
+            self.assertEqual(batch.shape, (3, n, n))
+            self.assertFalse(np.array_equal(batch[0], batch[1]))
+            for mesh in batch:
+                percentage = np.mean(mesh[1:-1, 1:-1] == 2)
+                self.assertAlmostEqual(percentage, 0.3, delta=0.05)
+
+    def test_structural_blocks(self):
+        pattern = fw.Structural2DPattern(10, 47, 5, 50, 0.5, 4, 7, seed=0)
+        mesh = pattern.generate([60, 60])
+        self.assertTrue(np.all(mesh[:10] == 0))
+        self.assertTrue(np.all(mesh[47:] == 0))
+        # every block is either fully fibrotic or healthy (cropped at the region edge)
+        for i in range(10, 47, 4):
+            for j in range(5, 50, 7):
+                block = mesh[i:min(i + 4, 47), j:min(j + 7, 50)]
+                self.assertEqual(len(np.unique(block)), 1)
+
+    def test_correlated_pattern(self):
+        n = self.n
+        pattern = fw.Correlated2DPattern(0, n, 0, n, 0.3, 5, seed=1)
+        mesh = pattern.generate([n, n], self.tissue.mesh.copy())
+        self.assertAlmostEqual(np.mean(mesh[1:-1, 1:-1] == 2), 0.3, delta=0.01)
+        self.assertTrue(np.all(mesh[0] == 0))
+        self.assertTrue(np.array_equal(
+            mesh, fw.Correlated2DPattern(0, n, 0, n, 0.3, 5, seed=1).generate(
+                [n, n], self.tissue.mesh.copy())))
+
+        # neighbouring nodes agree far more often than for diffuse fibrosis
+        diffuse = fw.Diffuse2DPattern(0, n, 0, n, 0.3, seed=1).generate([n, n])
+        agree = lambda m: np.mean(m[1:] == m[:-1])
+        self.assertGreater(agree(mesh), agree(diffuse) + 0.2)
+
+        # elongated patches along the second axis
+        mesh = fw.Correlated2DPattern(0, n, 0, n, 0.3, (1, 8), seed=1).generate([n, n])
+        self.assertGreater(np.mean(mesh[:, 1:] == mesh[:, :-1]),
+                           np.mean(mesh[1:] == mesh[:-1]))
+
+        # the density bounds are exact
+        healthy = self.tissue.mesh == 1
+        for dens, expected in [(1., 2), (1.5, 2), (0., 1), (-0.5, 1)]:
+            mesh = fw.Correlated2DPattern(0, n, 0, n, dens, 5, seed=1).generate(
+                [n, n], self.tissue.mesh.copy())
+            self.assertTrue(np.all(mesh[healthy] == expected))
+            self.assertTrue(np.all(mesh[~healthy] == 0))
+            mesh = fw.Correlated2DPattern(0, n, 0, n, dens, 5, seed=1).generate([n, n])
+            self.assertTrue(np.all(mesh == expected))
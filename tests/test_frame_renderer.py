@@ -0,0 +1,65 @@
+import os
+import unittest
+from unittest import mock
+import shutil
+import tempfile
+from pathlib import Path
+import numpy as np
+import matplotlib
+
+import finitewave as fw
+from finitewave.core.model.fork_safety import fork_safe
+
+
+class PidRenderer:
+    def render(self, data):
+        return np.full((1, 1, 3), os.getpid() % 256, dtype=np.uint8), os.getpid()
+
+
+class TestFrameRenderer(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.frames = rng.random([11, 30, 20])
+        self.renderer = fw.ImageFrameRenderer([0], [1], dpi=50)
+
+    def test_parallel_rendering_keeps_order(self):
+        load = lambda i: (self.frames[i],)
+        serial = list(fw.render_frames(self.renderer, load, len(self.frames), workers=1))
+        parallel = list(fw.render_frames(self.renderer, load, len(self.frames), workers=2,
+                                         batch_size=3))
+        self.assertEqual(len(serial), len(self.frames))
+        self.assertEqual(serial[0].dtype, np.uint8)
+        self.assertEqual(serial[0].shape[2], 3)
+        for a, b in zip(serial, parallel):
+            self.assertTrue(np.array_equal(a, b))
+        self.assertFalse(np.array_equal(serial[0], serial[1]))
+
+    def test_worker_processes(self):
+        if not fork_safe():
+            self.skipTest("a threading layer that is not fork-safe has started")
+
+        results = list(fw.render_frames(PidRenderer(), lambda i: i, 6, workers=2, batch_size=2))
+        self.assertEqual(len(results), 6)
+        self.assertNotIn(os.getpid(), [pid for _, pid in results])
+
+    def test_fork_unsafe(self):
+        # frames are rendered in this process if it cannot be forked safely
+        with mock.patch("finitewave.tools.frame_renderer.fork_safe", return_value=False):
+            with self.assertWarns(RuntimeWarning):
+                results = list(fw.render_frames(PidRenderer(), lambda i: i, 6, workers=2))
+        self.assertEqual([pid for _, pid in results], [os.getpid()] * 6)
+
+    @unittest.skipUnless(shutil.which(matplotlib.rcParams["animation.ffmpeg_path"]),
+                         "ffmpeg is not available")
+    def test_ffmpeg_pipe(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = Path(tmp_dir) / "movie.mp4"
+            load = lambda i: (self.frames[i],)
+            with fw.FFMpegPipe(file_name, fps=5) as pipe:
+                for image in fw.render_frames(self.renderer, load, len(self.frames), workers=1):
+                    pipe.write(image)
+            self.assertGreater(file_name.stat().st_size, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+import tempfile
+from pathlib import Path
+import numpy as np
+
+import finitewave as fw
+
+
+class TestFrameStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_h5_and_npy_frames_match(self):
+        n = 40
+        tissue = fw.CardiacTissue2D([n, n])
+        tissue.mesh = np.ones([n, n], dtype="uint8")
+        tissue.add_boundaries()
+        tissue.fibers = np.zeros([n, n, 2])
+
+        aliev_panfilov = fw.AlievPanfilov2D()
+        aliev_panfilov.dt = 0.01
+        aliev_panfilov.dr = 0.25
+        aliev_panfilov.t_max = 5
+        aliev_panfilov.prog_bar = False
+
+        stim_sequence = fw.StimSequence()
+        stim_sequence.add_stim(fw.StimVoltageCoord2D(0, 1, 0, n, 0, 5))
+
+        tracker_sequence = fw.TrackerSequence()
+        for storage, async_write in [("h5", False), ("npy", False),
+                                     ("h5", True)]:
+            tracker = fw.Animation2DTracker()
+            tracker.target_array = "u"
+            tracker.path = self.path
+            tracker.dir_name = storage + "_async" * async_write
+            tracker.storage = storage
+            tracker.complevel = 5
+            tracker.async_write = async_write
+            tracker.queue_size = 2
+            tracker_sequence.add_tracker(tracker)
+
+        aliev_panfilov.cardiac_tissue = tissue
+        aliev_panfilov.stim_sequence = stim_sequence
+        aliev_panfilov.tracker_sequence = tracker_sequence
+        aliev_panfilov.run()
+
+        with fw.open_frames(self.path / "h5.h5") as h5_frames, \
+                fw.open_frames(self.path / "npy") as npy_frames, \
+                fw.open_frames(self.path / "h5_async.h5") as async_frames:
+            self.assertEqual(len(h5_frames), 5)
+            self.assertEqual(len(h5_frames), len(npy_frames))
+            self.assertEqual(len(h5_frames), len(async_frames))
+            self.assertTrue(np.array_equal(h5_frames.times,
+                                           async_frames.times))
+            self.assertEqual(h5_frames.shape, (n, n))
+            self.assertEqual(h5_frames.attrs["dt"], 0.01)
+            self.assertTrue(np.all(np.diff(h5_frames.times) > 0))
+            for i in range(len(h5_frames)):
+                self.assertTrue(np.array_equal(h5_frames[i], npy_frames[i]))
+                self.assertTrue(np.array_equal(h5_frames[i],
+                                               async_frames[i]))
+
+    def test_continued_run(self):
+        n = 20
+        tissue = fw.CardiacTissue2D([n, n])
+        tissue.mesh = np.ones([n, n], dtype="uint8")
+        tissue.add_boundaries()
+
+        aliev_panfilov = fw.AlievPanfilov2D()
+        aliev_panfilov.dt = 0.01
+        aliev_panfilov.dr = 0.25
+        aliev_panfilov.t_max = 3
+        aliev_panfilov.prog_bar = False
+
+        stim_sequence = fw.StimSequence()
+        stim_sequence.add_stim(fw.StimVoltageCoord2D(0, 1, 0, n, 0, 5))
+
+        tracker_sequence = fw.TrackerSequence()
+        tracker = fw.Animation2DTracker()
+        tracker.target_array = "u"
+        tracker.path = self.path
+        tracker.storage = "h5"
+        tracker_sequence.add_tracker(tracker)
+
+        aliev_panfilov.cardiac_tissue = tissue
+        aliev_panfilov.stim_sequence = stim_sequence
+        aliev_panfilov.tracker_sequence = tracker_sequence
+        aliev_panfilov.run()
+        with fw.open_frames(self.path / "animation.h5") as frames:
+            first = frames[:]
+
+        # the frames of the second segment are appended to the first ones
+        aliev_panfilov.t_max = 6
+        aliev_panfilov.run(initialize=False)
+        with fw.open_frames(self.path / "animation.h5") as frames:
+            self.assertEqual(len(frames), 2 * len(first))
+            self.assertTrue(np.array_equal(frames[:len(first)], first))
+            self.assertTrue(np.all(np.diff(frames.times) > 0))
+
+        # a new run starts a new store
+        aliev_panfilov.t_max = 3
+        aliev_panfilov.run()
+        with fw.open_frames(self.path / "animation.h5") as frames:
+            self.assertEqual(len(frames), len(first))
+
+
+if __name__ == "__main__":
+    unittest.main()
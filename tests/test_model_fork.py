@@ -0,0 +1,94 @@
+import multiprocessing
+import os
+import unittest
+import warnings
+from unittest import mock
+
+import numpy as np
+
+import finitewave as fw
+from finitewave.core.model.fork_safety import fork_safe
+
+
+class TestModelFork(unittest.TestCase):
+    def setUp(self):
+        n = 50
+        self.n = n
+
+        model = fw.AlievPanfilov2D()
+        model.dt = 0.01
+        model.dr = 0.25
+        model.t_max = 5
+        model.prog_bar = False
+        model.cardiac_tissue = fw.CardiacTissue2D([n, n])
+        model.stim_sequence = fw.StimSequence()
+        model.stim_sequence.add_stim(fw.StimVoltageCoord2D(0, 1, 0, 5, 0, n))
+        model.run()
+        self.model = model
+
+    def add_stim(self, t):
+        def setup(branch):
+            branch.stim_sequence.add_stim(fw.StimVoltageCoord2D(t, 1, 0, self.n, 0, 5))
+            branch.t_max = 10
+        return setup
+
+    def test_fork(self):
+        branch = self.model.fork()
+
+        self.assertIs(branch.cardiac_tissue, self.model.cardiac_tissue)
+        self.assertIsNot(branch.u, self.model.u)
+        self.assertIs(branch.stim_sequence.model, branch)
+
+        self.add_stim(6)(branch)
+        branch.run(initialize=False)
+
+        clone = self.model.clone()
+        self.add_stim(6)(clone)
+        clone.run(initialize=False)
+
+        self.assertEqual(self.model.step, 500)
+        self.assertEqual(len(self.model.stim_sequence.sequence), 1)
+        self.assertTrue(np.array_equal(branch.u, clone.u))
+
+    def test_run_forks(self):
+        setups = [self.add_stim(6), self.add_stim(8)]
+        results = self.model.run_forks(setups)
+        parallel_results = self.model.run_forks(setups, processes=2)
+
+        self.assertFalse(np.array_equal(results[0]["u"], results[1]["u"]))
+        for result, parallel_result in zip(results, parallel_results):
+            self.assertTrue(np.array_equal(result["u"], parallel_result["u"]))
+            self.assertTrue(np.array_equal(result["v"], parallel_result["v"]))
+
+    def test_worker_processes(self):
+        # the branches run in worker processes, not in this process
+        if not fork_safe():
+            self.skipTest("a threading layer that is not fork-safe has started")
+
+        setups = [self.add_stim(6), self.add_stim(8)]
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            pids = self.model.run_forks(setups, result=lambda branch: os.getpid(), processes=2)
+
+        self.assertEqual(len(pids), 2)
+        self.assertNotIn(os.getpid(), pids)
+
+    def test_fork_unsafe(self):
+        # the branches run sequentially if the process cannot be forked safely
+        setups = [self.add_stim(6), self.add_stim(8)]
+        with mock.patch("finitewave.core.model.cardiac_model.fork_safe", return_value=False):
+            with self.assertWarns(RuntimeWarning):
+                pids = self.model.run_forks(setups, result=lambda branch: os.getpid(), processes=2)
+
+        self.assertEqual(pids, [os.getpid()] * 2)
+
+    def test_threading_layer(self):
+        # forking is unsafe once a threading layer other than workqueue has started
+        with mock.patch("numba.threading_layer", return_value="tbb"):
+            self.assertFalse(fork_safe())
+        with mock.patch("numba.threading_layer", return_value="workqueue"):
+            self.assertEqual(fork_safe(), "fork" in multiprocessing.get_all_start_methods())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+import tempfile
+from pathlib import Path
+import numpy as np
+
+import finitewave as fw
+
+
+class TestPeriodStats(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def prepare_model(self, n, t_max):
+        tissue = fw.CardiacTissue2D([n, n])
+        tissue.mesh = np.ones([n, n], dtype="uint8")
+        tissue.add_boundaries()
+
+        aliev_panfilov = fw.AlievPanfilov2D()
+        aliev_panfilov.dt = 0.01
+        aliev_panfilov.dr = 0.25
+        aliev_panfilov.t_max = t_max
+        aliev_panfilov.prog_bar = False
+
+        stim_sequence = fw.StimSequence()
+        for t in [0, 35, 70]:
+            stim_sequence.add_stim(fw.StimVoltageCoord2D(t, 1, 0, n, 0, 3))
+
+        tracker_sequence = fw.TrackerSequence()
+        tracker = fw.PeriodStats2DTracker()
+        tracker.threshold = 0.5
+        tracker.path = self.path
+        tracker.frame_step = 10
+        tracker_sequence.add_tracker(tracker)
+
+        aliev_panfilov.cardiac_tissue = tissue
+        aliev_panfilov.stim_sequence = stim_sequence
+        aliev_panfilov.tracker_sequence = tracker_sequence
+        return aliev_panfilov, tracker
+
+    def test_paced_tissue(self):
+        n = 30
+        aliev_panfilov, tracker = self.prepare_model(n, 100)
+        tissue = aliev_panfilov.cardiac_tissue
+        aliev_panfilov.run()
+        tracker.write()
+
+        tissue_nodes = tissue.mesh == 1
+        self.assertTrue(np.all(tracker.count[tissue_nodes] == 2))
+        self.assertTrue(np.allclose(tracker.mean_period[tissue_nodes], 35, atol=0.5))
+        self.assertTrue(np.all(tracker.std_period[tissue_nodes] < 1))
+        self.assertTrue(np.allclose(tracker.dominant_frequency[tissue_nodes],
+                                    1 / tracker.mean_period[tissue_nodes]))
+        self.assertTrue(np.all(np.isnan(tracker.mean_period[~tissue_nodes])))
+        self.assertTrue(np.allclose(tracker.last_period[tissue_nodes], 35, atol=1))
+
+        stats = np.load(self.path / "period_stats.npz")
+        self.assertTrue(np.array_equal(stats["count"], tracker.count))
+        with fw.open_frames(self.path / "period.h5") as frames:
+            self.assertEqual(len(frames), 10)
+
+    def test_continued_run(self):
+        aliev_panfilov, tracker = self.prepare_model(20, 50)
+        aliev_panfilov.run()
+        with fw.open_frames(self.path / "period.h5") as frames:
+            first = frames[:]
+
+        # the frames of the second segment are appended to the first ones
+        aliev_panfilov.t_max = 100
+        aliev_panfilov.run(initialize=False)
+        with fw.open_frames(self.path / "period.h5") as frames:
+            self.assertEqual(len(frames), 10)
+            self.assertTrue(np.array_equal(frames[:len(first)], first))
+            self.assertTrue(np.all(np.diff(frames.times) > 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
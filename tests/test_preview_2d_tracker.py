@@ -0,0 +1,107 @@
+import unittest
+import tempfile
+from pathlib import Path
+import numpy as np
+import matplotlib.pyplot as plt
+
+import finitewave as fw
+
+
+class TestPreview2DTracker(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def prepare_model(self, n, t_max):
+        tissue = fw.CardiacTissue2D([n, n])
+        tissue.mesh = np.ones([n, n], dtype="uint8")
+        tissue.add_boundaries()
+
+        aliev_panfilov = fw.AlievPanfilov2D()
+        aliev_panfilov.dt = 0.01
+        aliev_panfilov.dr = 0.25
+        aliev_panfilov.t_max = t_max
+        aliev_panfilov.prog_bar = False
+        aliev_panfilov.cardiac_tissue = tissue
+
+        aliev_panfilov.stim_sequence = fw.StimSequence()
+        aliev_panfilov.stim_sequence.add_stim(fw.StimVoltageCoord2D(0, 1, 0, n, 0, 5))
+        aliev_panfilov.tracker_sequence = fw.TrackerSequence()
+        return aliev_panfilov
+
+    def add_preview(self, model, mode="mean"):
+        tracker = fw.Preview2DTracker()
+        tracker.path = self.path
+        tracker.file_name = mode
+        tracker.mode = mode
+        tracker.factor = 4
+        tracker.storage = "h5"
+        model.tracker_sequence.add_tracker(tracker)
+        return tracker
+
+    def test_preview_frames(self):
+        n = 42
+        aliev_panfilov = self.prepare_model(n, 5)
+        tissue = aliev_panfilov.cardiac_tissue
+
+        frames_tracker = fw.Animation2DTracker()
+        frames_tracker.target_array = "u"
+        frames_tracker.path = self.path
+        frames_tracker.storage = "h5"
+        aliev_panfilov.tracker_sequence.add_tracker(frames_tracker)
+        for mode in ["stride", "mean"]:
+            self.add_preview(aliev_panfilov, mode)
+        aliev_panfilov.run()
+
+        lut = np.round(plt.get_cmap("viridis")(np.linspace(0, 1, 256))[:, :3] * 255)
+        tissue_nodes = tissue.mesh == 1
+        with fw.open_frames(self.path / "animation.h5") as frames, \
+                fw.open_frames(self.path / "stride.h5") as stride, \
+                fw.open_frames(self.path / "mean.h5") as mean:
+            self.assertEqual(len(stride), len(frames))
+            self.assertEqual(stride.shape, (11, 11, 3))
+            self.assertEqual(stride.dtype, np.uint8)
+            for i in range(len(frames)):
+                u = frames[i]
+                expected = lut[np.clip(np.floor(u[::4, ::4] * 255 + 0.5), 0, 255).astype(int)]
+                expected[~tissue_nodes[::4, ::4]] = 0
+                self.assertTrue(np.array_equal(stride[i], expected))
+
+                padded = np.zeros([44, 44])
+                counts = np.zeros([44, 44])
+                padded[:n, :n] = np.where(tissue_nodes, u, 0)
+                counts[:n, :n] = tissue_nodes
+                block = (padded.reshape(11, 4, 11, 4).sum(axis=(1, 3))
+                         / counts.reshape(11, 4, 11, 4).sum(axis=(1, 3)))
+                expected = lut[np.clip(np.floor(block * 255 + 0.5), 0, 255).astype(int)]
+                self.assertTrue(np.abs(mean[i].astype(int) - expected).max() <= 1)
+
+
+    def test_continued_run(self):
+        aliev_panfilov = self.prepare_model(20, 3)
+        self.add_preview(aliev_panfilov)
+        aliev_panfilov.run()
+        with fw.open_frames(self.path / "mean.h5") as frames:
+            first = frames[:]
+
+        # the frames of the second segment are appended to the first ones
+        aliev_panfilov.t_max = 6
+        aliev_panfilov.run(initialize=False)
+        with fw.open_frames(self.path / "mean.h5") as frames:
+            self.assertEqual(len(frames), 2 * len(first))
+            self.assertTrue(np.array_equal(frames[:len(first)], first))
+            self.assertTrue(np.all(np.diff(frames.times) > 0))
+
+    def test_color_range(self):
+        aliev_panfilov = self.prepare_model(20, 1)
+        tracker = self.add_preview(aliev_panfilov)
+        tracker.vmin = tracker.vmax = 0.5
+        with self.assertRaises(ValueError):
+            aliev_panfilov.run()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import math
+import unittest
+
+import numpy as np
+
+import finitewave as fw
+
+
+def rotational_fibers(size, alpha, axis, init_v):
+    """
+    Reference fibers (the original loop implementation).
+    """
+    fibers = np.zeros(list(size) + [3])
+    fibers[:, :, :] = init_v
+    alpha_step = (alpha[1] - alpha[0]) / size[axis]
+    c_fibers = np.copy(fibers)
+    v = [[1, 2], [0, 2], [0, 1]][axis]
+
+    for i in range(size[0]):
+        for j in range(size[1]):
+            for k in range(size[2]):
+                ang = math.radians(alpha[0] + alpha_step * (i, j, k)[axis])
+                fibers[i, j, k, v[0]] = (c_fibers[i, j, k, v[0]] * math.cos(ang)
+                                         + c_fibers[i, j, k, v[1]] * math.sin(ang))
+                fibers[i, j, k, v[1]] = (-c_fibers[i, j, k, v[0]] * math.sin(ang)
+                                         + c_fibers[i, j, k, v[1]] * math.cos(ang))
+                fibers[i, j, k] /= math.sqrt(np.sum(fibers[i, j, k]**2))
+    return fibers
+
+
+class TestRotationalAnisotropy(unittest.TestCase):
+    def anisotropy(self, axis, init_v=(1, 0, 0)):
+        anisotropy = fw.RotationalAnisotropy()
+        anisotropy.size = [6, 5, 4]
+        anisotropy.alpha = [-60, 60]
+        anisotropy.axis = axis
+        anisotropy.init_v = list(init_v)
+        return anisotropy
+
+    def test_matches_loop(self):
+        for axis in range(3):
+            for init_v in [(1, 0, 0), (0, 1, 0), (0, 0, 1), (0.3, 0.5, 0.8)]:
+                anisotropy = self.anisotropy(axis, init_v)
+                fibers = anisotropy.generate_fibers()
+                expected = rotational_fibers(anisotropy.size, anisotropy.alpha, axis, init_v)
+                self.assertEqual(fibers.shape, (6, 5, 4, 3))
+                self.assertEqual(fibers.dtype, np.float64)
+                self.assertTrue(np.allclose(fibers, expected, rtol=0, atol=1e-15))
+
+    def test_dtype(self):
+        anisotropy = self.anisotropy(2, (0.3, 0.5, 0.8))
+        fibers = anisotropy.generate_fibers(dtype=np.float32)
+        self.assertEqual(fibers.dtype, np.float32)
+        self.assertTrue(np.allclose(fibers, anisotropy.generate_fibers(), atol=1e-7))
+
+    def test_mesh(self):
+        anisotropy = self.anisotropy(1)
+        mesh = np.ones(anisotropy.size, dtype=np.uint8)
+        mesh[0] = 0
+        mesh[2, 1:3] = 2
+        fibers = anisotropy.generate_fibers(mesh)
+
+        self.assertFalse(np.any(fibers[mesh == 0]))
+        self.assertTrue(np.array_equal(fibers[mesh > 0],
+                                       anisotropy.generate_fibers()[mesh > 0]))
+
+        with self.assertRaises(ValueError):
+            anisotropy.generate_fibers(mesh[1:])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+import numpy as np
+
+import finitewave as fw
+
+
+class TestRuleBasedAnisotropy(unittest.TestCase):
+    def setUp(self):
+        n = 40
+        x, y, z = np.meshgrid(*[np.linspace(-1, 1, n)] * 3, indexing="ij")
+        r = np.sqrt((x**2 + y**2) / 0.8**2 + z**2)
+        self.mesh = ((r > 0.6) & (r < 0.95)).astype(float)
+        self.tissue = self.mesh > 0
+        self.base = self.tissue & (z > 0.6)
+        self.apex = self.tissue & (z < z[self.tissue].min() + 0.1)
+        self.z = z
+
+    def test_fibers(self):
+        generator = fw.RuleBasedAnisotropy()
+        fibers = generator.generate_fibers(self.mesh, self.base, self.apex,
+                                           dtype=np.float32)
+
+        self.assertEqual(fibers.shape, (*self.mesh.shape, 3))
+        self.assertEqual(fibers.dtype, np.float32)
+        self.assertTrue(np.allclose(np.linalg.norm(fibers[self.tissue], axis=-1), 1,
+                                    atol=1e-5))
+        self.assertTrue(np.all(fibers[~self.tissue] == 0))
+
+        endo, epi = generator.surfaces(self.mesh)
+        self.assertTrue(np.allclose(generator.transmural[endo & ~self.base], 0))
+        self.assertTrue(np.allclose(generator.transmural[epi & ~self.base], 1))
+        self.assertTrue(np.allclose(generator.apicobasal[self.base], 1))
+
+        # at the equator the longitudinal direction is the z axis, so the
+        # helix angle is the elevation of the fibers
+        equator = self.tissue & (np.abs(self.z) < 0.05)
+        elevation = np.degrees(np.arcsin(fibers[..., 2]))
+        self.assertGreater(elevation[equator & endo].mean(), 50)
+        self.assertLess(elevation[equator & epi].mean(), -50)
+
+    def test_open_cavity(self):
+        mesh = self.mesh.copy()
+        mesh[self.z > 0.6] = 0
+        with self.assertRaises(ValueError):
+            fw.RuleBasedAnisotropy.surfaces(mesh)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,240 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import finitewave as fw
+
+
+def prepare_model(t_max):
+    n = 50
+    tissue = fw.CardiacTissue2D([n, n])
+
+    model = fw.AlievPanfilov2D()
+    model.dt = 0.01
+    model.dr = 0.25
+    model.t_max = t_max
+    model.prog_bar = False
+    model.cardiac_tissue = tissue
+
+    model.stim_sequence = fw.StimSequence()
+    model.stim_sequence.add_stim(fw.StimVoltageCoord2D(0, 1, 0, 5, 0, n))
+    # a current stimulus that is active when the state is saved
+    model.stim_sequence.add_stim(fw.StimCurrentCoord2D(4.9, 3, 0.3, 0, n, 0, 5))
+    return model
+
+
+class TestStateKeeper(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_snapshot(self):
+        arrays = {"a": np.arange(10.).reshape(2, 5), "b": np.ones(3, dtype="uint8"),
+                  "c": np.zeros(0)}
+        path = os.path.join(self.path, "test.fws")
+        fw.write_snapshot(path, arrays, {"t": 1.5})
+        info, loaded = fw.read_snapshot(path)
+
+        self.assertEqual(info, {"t": 1.5})
+        for name, arr in arrays.items():
+            self.assertEqual(loaded[name].dtype, arr.dtype)
+            self.assertTrue(np.array_equal(loaded[name], arr))
+
+    def test_resume(self):
+        model = prepare_model(t_max=10)
+        model.run()
+
+        state_keeper = fw.StateKeeper()
+        state_keeper.record_save = self.path
+
+        first = prepare_model(t_max=5)
+        first.state_keeper = state_keeper
+        first.run()
+
+        state_keeper = fw.StateKeeper()
+        state_keeper.record_load = self.path
+        state_keeper.resume = True
+
+        second = prepare_model(t_max=10)
+        second.state_keeper = state_keeper
+        second.run()
+
+        self.assertEqual(second.step, model.step)
+        self.assertTrue(np.allclose(second.u, model.u))
+        self.assertTrue(np.allclose(second.v, model.v))
+
+    def test_checkpoints(self):
+        model = prepare_model(t_max=10)
+        model.tracker_sequence = fw.TrackerSequence()
+        model.tracker_sequence.add_tracker(fw.ActivationTime2DTracker())
+        model.run()
+
+        state_keeper = fw.StateKeeper()
+        state_keeper.record_checkpoint = self.path
+        state_keeper.checkpoint_interval = 150
+        state_keeper.max_checkpoints = 2
+
+        # the first run stops (e.g. crashes) after t = 6
+        first = prepare_model(t_max=6)
+        first.tracker_sequence = fw.TrackerSequence()
+        first.tracker_sequence.add_tracker(fw.ActivationTime2DTracker())
+        first.state_keeper = state_keeper
+        first.run()
+
+        checkpoints = fw.StateKeeper.list_checkpoints(self.path)
+        self.assertEqual([os.path.basename(path) for path in checkpoints],
+                         ["checkpoint_000000000450.fws", "checkpoint_000000000600.fws"])
+
+        # a broken newest checkpoint is skipped
+        with open(os.path.join(self.path, "checkpoint_000000000700.fws"), "wb") as file:
+            file.write(b"broken")
+
+        state_keeper = fw.StateKeeper()
+        state_keeper.record_load = self.path
+        state_keeper.resume = True
+
+        second = prepare_model(t_max=10)
+        second.tracker_sequence = fw.TrackerSequence()
+        second.tracker_sequence.add_tracker(fw.ActivationTime2DTracker())
+        second.state_keeper = state_keeper
+        second.run()
+
+        self.assertEqual(second.step, model.step)
+        self.assertTrue(np.allclose(second.u, model.u))
+        self.assertTrue(np.allclose(second.tracker_sequence.sequence[0].act_t,
+                                    model.tracker_sequence.sequence[0].act_t))
+
+    def test_resume_frames(self):
+        def add_tracker(model, path):
+            tracker = fw.Animation2DTracker()
+            tracker.target_array = "u"
+            tracker.path = path
+            tracker.storage = "h5"
+            model.tracker_sequence = fw.TrackerSequence()
+            model.tracker_sequence.add_tracker(tracker)
+            return tracker
+
+        model = prepare_model(t_max=10)
+        add_tracker(model, os.path.join(self.path, "reference"))
+        model.run()
+
+        frames_path = os.path.join(self.path, "frames")
+        state_keeper = fw.StateKeeper()
+        state_keeper.record_checkpoint = os.path.join(self.path, "checkpoints")
+        state_keeper.checkpoint_interval = 250
+
+        # the first run writes a frame after the last checkpoint (t = 5)
+        first = prepare_model(t_max=6)
+        add_tracker(first, frames_path)
+        first.state_keeper = state_keeper
+        first.run()
+
+        state_keeper = fw.StateKeeper()
+        state_keeper.record_load = os.path.join(self.path, "checkpoints")
+        state_keeper.resume = True
+
+        second = prepare_model(t_max=10)
+        tracker = add_tracker(second, frames_path)
+        tracker.complevel = 5
+        second.state_keeper = state_keeper
+        second.run()
+
+        # the configuration of the tracker is not overwritten by the checkpoint
+        self.assertEqual(tracker.complevel, 5)
+        self.assertEqual(tracker.path, frames_path)
+        with fw.open_frames(os.path.join(self.path, "reference", "animation.h5")) as expected, \
+                fw.open_frames(os.path.join(frames_path, "animation.h5")) as frames:
+            self.assertEqual(len(frames), len(expected))
+            self.assertTrue(np.allclose(frames.times, expected.times))
+            self.assertTrue(np.allclose(frames[:], expected[:]))
+
+    def test_checkpoint_trackers(self):
+        def add_trackers(model):
+            model.tracker_sequence = fw.TrackerSequence()
+            multi_activation = fw.MultiActivationTime2DTracker()
+            multi_activation.threshold = 0.5
+            model.tracker_sequence.add_tracker(multi_activation)
+            variables = fw.MultiVariable2DTracker()
+            variables.var_list = ["u", "v"]
+            variables.cell_ind = [10, 10]
+            model.tracker_sequence.add_tracker(variables)
+            spiral = fw.Spiral2DTracker()
+            spiral.step = 0.5
+            model.tracker_sequence.add_tracker(spiral)
+            return model.tracker_sequence.sequence
+
+        state_keeper = fw.StateKeeper()
+        state_keeper.record_checkpoint = self.path
+        state_keeper.checkpoint_interval = 600
+
+        first = prepare_model(t_max=10)
+        expected = add_trackers(first)
+        first.state_keeper = state_keeper
+        first.run()
+
+        # the tracker buffers are stored as named arrays, not pickled
+        info, arrays = fw.read_snapshot(fw.StateKeeper.find_checkpoint(self.path))
+        self.assertNotIn("trackers", arrays)
+        self.assertIn("trackers/1/vars/u", arrays)
+        self.assertEqual(len(info["trackers"]), 3)
+
+        state_keeper = fw.StateKeeper()
+        state_keeper.record_load = self.path
+        state_keeper.resume = True
+
+        second = prepare_model(t_max=10)
+        trackers = add_trackers(second)
+        second.state_keeper = state_keeper
+        second.run()
+
+        self.assertEqual(len(trackers[0].act_t), len(expected[0].act_t))
+        for act_t, expected_act_t in zip(trackers[0].act_t, expected[0].act_t):
+            self.assertTrue(np.allclose(act_t, expected_act_t))
+        self.assertTrue(np.allclose(trackers[0].amount, expected[0].amount))
+        for var in ["u", "v"]:
+            self.assertTrue(np.allclose(trackers[1].vars[var], expected[1].vars[var]))
+        self.assertEqual(trackers[2].swcore, expected[2].swcore)
+        self.assertIsInstance(trackers[2].tip_trajectories, fw.TipTrajectories)
+
+    def test_unsupported_tracker_state(self):
+        model = prepare_model(t_max=1)
+        model.tracker_sequence = fw.TrackerSequence()
+        tracker = fw.ActivationTime2DTracker()
+        model.tracker_sequence.add_tracker(tracker)
+        model.run()
+
+        tracker.state_vars = ["model"]
+        state_keeper = fw.StateKeeper()
+        state_keeper.record_checkpoint = self.path
+        with self.assertRaises(TypeError):
+            state_keeper.save_checkpoint(model)
+        state_keeper.finalize()
+
+    def test_load_npy(self):
+        state_keeper = fw.StateKeeper()
+        state_keeper.record_save = self.path
+        state_keeper.file_format = "npy"
+
+        first = prepare_model(t_max=2)
+        first.state_keeper = state_keeper
+        first.run()
+
+        state_keeper = fw.StateKeeper()
+        state_keeper.record_load = self.path
+
+        second = prepare_model(t_max=0)
+        second.stim_sequence = None
+        second.state_keeper = state_keeper
+        second.run()
+
+        self.assertTrue(np.array_equal(second.u, first.u))
+        self.assertTrue(np.array_equal(second.v, first.v))
+
+
+if __name__ == "__main__":
+    unittest.main()
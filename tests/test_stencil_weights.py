@@ -0,0 +1,176 @@
+import unittest
+
+import numpy as np
+
+import finitewave as fw
+
+
+def isotropic_weights_2d(mesh, conductivity, D_al, dt, dr):
+    """
+    Reference isotropic 2D weights (the original array implementation).
+    """
+    mesh = mesh.copy()
+    mesh[mesh != 1] = 0
+    weights = np.zeros((*mesh.shape, 5))
+    diffuse = D_al * conductivity * np.ones(mesh.shape)
+
+    weights[:, :, 0] = diffuse * dt / (dr**2) * np.roll(mesh, 1, axis=0)
+    weights[:, :, 1] = diffuse * dt / (dr**2) * np.roll(mesh, 1, axis=1)
+    weights[:, :, 3] = diffuse * dt / (dr**2) * np.roll(mesh, -1, axis=1)
+    weights[:, :, 4] = diffuse * dt / (dr**2) * np.roll(mesh, -1, axis=0)
+
+    diff_i = np.roll(diffuse, 1, axis=0) - np.roll(diffuse, -1, axis=0)
+    diff_j = np.roll(diffuse, 1, axis=1) - np.roll(diffuse, -1, axis=1)
+    weights[:, :, 0] -= dt / (2*dr) * diff_i
+    weights[:, :, 1] -= dt / (2*dr) * diff_j
+    weights[:, :, 3] += dt / (2*dr) * diff_j
+    weights[:, :, 4] += dt / (2*dr) * diff_i
+
+    for i in [0, 1, 3, 4]:
+        weights[:, :, i] *= mesh
+        weights[:, :, 2] -= weights[:, :, i]
+    weights[:, :, 2] += 1
+    weights[:, :, 2] *= mesh
+    return weights
+
+
+def isotropic_weights_3d(mesh, conductivity, D_al, dt, dr):
+    """
+    Reference isotropic 3D weights (the original array implementation).
+    """
+    mesh = mesh.copy()
+    mesh[mesh != 1] = 0
+    weights = np.zeros((*mesh.shape, 7))
+    diffuse = D_al * conductivity * np.ones(mesh.shape)
+
+    for axis, (before, after) in enumerate([(0, 6), (1, 5), (2, 4)]):
+        weights[..., before] = diffuse * dt / (dr**2) * np.roll(mesh, 1, axis=axis)
+        weights[..., after] = diffuse * dt / (dr**2) * np.roll(mesh, -1, axis=axis)
+        diff = np.roll(diffuse, 1, axis=axis) - np.roll(diffuse, -1, axis=axis)
+        weights[..., before] -= dt / (2*dr) * diff
+        weights[..., after] += dt / (2*dr) * diff
+
+    for i in [0, 1, 2, 4, 5, 6]:
+        weights[..., i] *= mesh
+        weights[..., 3] -= weights[..., i]
+    weights[..., 3] += 1
+    weights[..., 3] *= mesh
+    return weights
+
+
+def minor_component(d, m0, m1, m2, m3, m4, m5):
+    """
+    Reference minor (cross-derivative) flux component of the asymmetric stencil.
+    """
+    m_higher = m2 + m3 + m4 + m5
+    m_lower = m0 + m1 + m2 + m3
+    if m2 == 0 or m3 == 0 or m_higher < 3 or m_lower < 3:
+        return (0,) * 6
+    return (-d * m0 / m_lower, -d * m1 / m_lower, d * (m2 / m_higher - m2 / m_lower),
+            d * (m3 / m_higher - m3 / m_lower), d * m4 / m_higher, d * m5 / m_higher)
+
+
+def asymmetric_weights(mesh, conductivity, fibers, D_al, D_ac, dt, dr, slots):
+    """
+    Reference asymmetric weights (the flux scheme of the original loop implementation).
+
+    The weights of each node are accumulated from the fluxes through its faces; `slots` maps the offset
+    of a neighbour to its weight index.
+    """
+    mesh = (mesh == 1).astype(int)
+    ndim = mesh.ndim
+    # half-step diffusion tensor: d[a][b] at the face between the node and its next node along a
+    d = np.zeros((ndim, ndim, *mesh.shape))
+    for a in range(ndim):
+        for b in range(ndim):
+            component = (D_ac * (a == b) + (D_al - D_ac) * fibers[..., a] * fibers[..., b]) * conductivity
+            d[a, b] = 0.5 * (component + np.roll(component, -1, axis=a))
+
+    unit = np.eye(ndim, dtype=int)
+    weights = np.zeros((*mesh.shape, len(slots)))
+    for p in map(np.array, np.ndindex(mesh.shape)):
+        if mesh[tuple(p)] != 1:
+            continue
+        w = weights[tuple(p)]
+        for a in range(ndim):
+            for side in (-1, 1):
+                q = p + side * unit[a]
+                face = tuple(p if side == 1 else q)
+                major = d[a, a][face] * mesh[tuple(q)]
+                w[slots[tuple(q - p)]] += major
+                w[slots[(0,) * ndim]] -= major
+                for b in range(ndim):
+                    if b == a:
+                        continue
+                    nodes = [q - unit[b], p - unit[b], q, p, q + unit[b], p + unit[b]]
+                    minor = minor_component(d[a, b][face], *(mesh[tuple(n)] for n in nodes))
+                    for n, value in zip(nodes, minor):
+                        w[slots[tuple(n - p)]] += side * value
+
+    weights *= dt / dr**2
+    weights[..., slots[(0,) * ndim]] += 1
+    return weights
+
+
+# weight index of each neighbour offset
+SLOTS_2D = {(i, j): 3 * (i + 1) + j + 1 for i in (-1, 0, 1) for j in (-1, 0, 1)}
+SLOTS_3D = {**{(i, j, 0): 3 * (i + 1) + j + 1 for i in (-1, 0, 1) for j in (-1, 0, 1)},
+            (0, -1, -1): 9, (0, -1, 1): 10, (0, 0, -1): 11, (0, 0, 1): 12, (0, 1, -1): 13,
+            (0, 1, 1): 14, (-1, 0, -1): 15, (1, 0, -1): 16, (-1, 0, 1): 17, (1, 0, 1): 18}
+
+
+class TestStencilWeights(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.dt = 0.01
+        self.dr = 0.25
+
+    def random_mesh(self, shape):
+        """
+        Mesh with boundaries, fibrosis (2) and empty (0) nodes inside the tissue.
+        """
+        mesh = self.rng.choice([0, 1, 1, 1, 2], size=shape).astype(np.int8)
+        for axis in range(len(shape)):
+            index = [slice(None)] * len(shape)
+            index[axis] = [0, -1]
+            mesh[tuple(index)] = 0
+        return mesh
+
+    def random_fibers(self, shape):
+        fibers = self.rng.normal(size=(*shape, len(shape)))
+        return fibers / np.linalg.norm(fibers, axis=-1, keepdims=True)
+
+    def assert_weights(self, stencil, reference, shape, atol=1e-15):
+        mesh = self.random_mesh(shape)
+        fibers = self.random_fibers(shape)
+        for conductivity in [1., 0.5, self.rng.uniform(0.2, 1., size=shape)]:
+            weights = stencil.get_weights(mesh, conductivity, fibers, 1.2, 0.3, self.dt, self.dr)
+            expected = reference(mesh, conductivity, fibers, 1.2, 0.3, self.dt, self.dr)
+            self.assertEqual(weights.shape, expected.shape)
+            self.assertTrue(np.allclose(weights, expected, rtol=1e-12, atol=atol))
+
+    def test_isotropic_2d(self):
+        self.assert_weights(fw.IsotropicStencil2D(),
+                            lambda mesh, conductivity, fibers, D_al, D_ac, dt, dr:
+                            isotropic_weights_2d(mesh, conductivity, D_al, dt, dr),
+                            (30, 25))
+
+    def test_isotropic_3d(self):
+        self.assert_weights(fw.IsotropicStencil3D(),
+                            lambda mesh, conductivity, fibers, D_al, D_ac, dt, dr:
+                            isotropic_weights_3d(mesh, conductivity, D_al, dt, dr),
+                            (12, 10, 9))
+
+    def test_asymmetric_2d(self):
+        self.assert_weights(fw.AsymmetricStencil2D(),
+                            lambda *args: asymmetric_weights(*args, SLOTS_2D),
+                            (30, 25))
+
+    def test_asymmetric_3d(self):
+        # the 3D weights are stored in single precision
+        self.assert_weights(fw.AsymmetricStencil3D(),
+                            lambda *args: asymmetric_weights(*args, SLOTS_3D),
+                            (12, 10, 9), atol=1e-6)
+
+if __name__ == "__main__":
+    unittest.main()
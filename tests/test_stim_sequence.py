@@ -0,0 +1,132 @@
+import unittest
+
+import numpy as np
+
+import finitewave as fw
+
+
+class LogStim(fw.StimCurrent):
+    def __init__(self, time, curr_time, log, name):
+        fw.StimCurrent.__init__(self, time, 1., curr_time)
+        self.log = log
+        self.name = name
+
+    def stimulate(self, model):
+        self.log.append((model.step, self.name))
+
+
+class StepModel:
+    def __init__(self, dt):
+        self.dt = dt
+        self.step = 0
+
+    time_to_step = fw.CardiacModel.time_to_step
+
+
+class TestStimSequence(unittest.TestCase):
+    def test_schedule(self):
+        log = []
+        stim_sequence = fw.StimSequence()
+        stim_sequence.add_stim(LogStim(0.3, 0.1, log, "b"))
+        stim_sequence.add_stim(LogStim(0.1, 0.05, log, "a"))
+        stim_sequence.add_stim(LogStim(0.3, 0., log, "c"))
+
+        model = StepModel(dt=0.05)
+        stim_sequence.initialize(model)
+        for step in range(10):
+            model.step = step
+            if step == 5:
+                stim_sequence.add_stim(LogStim(0.35, 0., log, "d"))
+            stim_sequence.stimulate_next()
+
+        # current stimuli are applied until their duration has elapsed,
+        # stimuli due at the same step are applied in insertion order
+        self.assertEqual(log, [(2, "a"), (3, "a"), (4, "a"),
+                               (6, "b"), (6, "c"),
+                               (7, "b"), (7, "c"), (7, "d"),
+                               (8, "b"), (8, "d"),
+                               (9, "b")])
+
+    def test_off_grid_times(self):
+        model = StepModel(dt=0.01)
+        self.assertEqual(model.time_to_step(0.7), 70)
+        self.assertEqual(model.time_to_step(0.3), 30)
+        self.assertEqual(model.time_to_step(0.004), 1)
+        self.assertEqual(model.time_to_step(0.015), 2)
+
+        # stimuli between two steps are applied at the next step, never before their time
+        log = []
+        stim_sequence = fw.StimSequence()
+        stim_sequence.add_stim(LogStim(0.12, 0., log, "a"))
+        stim_sequence.add_stim(LogStim(0.149, 0., log, "b"))
+        model = StepModel(dt=0.05)
+        stim_sequence.initialize(model)
+        for step in range(5):
+            model.step = step
+            stim_sequence.stimulate_next()
+        self.assertEqual(log, [(3, "a"), (3, "b"), (4, "a"), (4, "b")])
+
+    def test_fused_current(self):
+        def run(fuse_stim):
+            model = fw.AlievPanfilov2D()
+            model.dt = 0.01
+            model.dr = 0.25
+            model.t_max = 1
+            model.prog_bar = False
+            model.fuse_stim = fuse_stim
+            model.cardiac_tissue = fw.CardiacTissue2D([20, 20])
+            model.stim_sequence = fw.StimSequence()
+            model.stim_sequence.add_stim(fw.StimCurrentCoord2D(0, 3, 0.5, 0, 5, 0, 20))
+            model.run()
+            return model
+
+        model = run(False)
+        fused_model = run(True)
+
+        # the fused current reaches the neighbouring nodes one step later
+        self.assertTrue(np.allclose(model.u, fused_model.u, atol=2e-2))
+        # the current is removed from the external current array after the stimulation
+        self.assertFalse(np.any(fused_model.i_ext))
+
+    def test_ablated_nodes(self):
+        class AblateCommand(fw.Command):
+            def execute(self, model):
+                model.cardiac_tissue.mesh[1:3] = 0
+                model.cardiac_tissue.mark_dirty(np.s_[1:3])
+                self.u = model.u[1:3].copy()
+                self.u_new = model.u_new[1:3].copy()
+
+        for fuse_stim in [False, True]:
+            model = fw.AlievPanfilov2D()
+            model.dt = 0.01
+            model.dr = 0.25
+            model.t_max = 1
+            model.prog_bar = False
+            model.fuse_stim = fuse_stim
+            model.cardiac_tissue = fw.CardiacTissue2D([20, 20])
+            model.stim_sequence = fw.StimSequence()
+            model.stim_sequence.add_stim(fw.StimCurrentCoord2D(0, 5, 3, 0, 6, 0, 20))
+            model.command_sequence = fw.CommandSequence()
+            command = AblateCommand(0.5)
+            model.command_sequence.add_command(command)
+            model.run()
+
+            # the stimulation no longer reaches the ablated nodes
+            self.assertTrue(np.array_equal(model.u[1:3], command.u)
+                            or np.array_equal(model.u[1:3], command.u_new))
+            self.assertTrue(np.all(model.u[3:6, 1:-1] > 1))
+            if fuse_stim:
+                self.assertFalse(np.any(model.i_ext[:3]))
+                self.assertTrue(np.all(model.i_ext[3:6, 1:-1] == 5))
+
+    def test_non_contiguous_potential(self):
+        model = fw.AlievPanfilov2D()
+        model.cardiac_tissue = fw.CardiacTissue2D([10, 10])
+        model.u = np.zeros([10, 10]).T
+        stim = fw.StimVoltageCoord2D(0, 1, 0, 5, 0, 10)
+        with self.assertRaises(ValueError):
+            stim.stimulate(model)
+
+
+if __name__ == "__main__":
+    unittest.main()
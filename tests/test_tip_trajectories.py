@@ -0,0 +1,62 @@
+import unittest
+import numpy as np
+
+import finitewave as fw
+
+
+class TestTipTrajectories(unittest.TestCase):
+    def test_linking_and_drift(self):
+        trajectories = fw.TipTrajectories(link_radius=1.)
+
+        t = np.arange(0, 10, 0.5)
+        ids = []
+        for t_i in t:
+            # two tips drifting in opposite directions, swapped order
+            positions = np.array([[50 - 0.2*t_i, 20.],
+                                  [10 + 0.2*t_i, 10.]])
+            ids.append(trajectories.update(t_i, positions))
+
+        ids = np.array(ids)
+        self.assertEqual(len(trajectories), 2)
+        self.assertTrue(np.all(ids[:, 0] == ids[0, 0]))
+        self.assertTrue(np.all(ids[:, 1] == ids[0, 1]))
+
+        summary = trajectories.summary()
+        self.assertTrue(np.allclose(summary["lifetime"], t[-1]))
+        self.assertTrue(np.allclose(summary["drift_speed"], 0.2))
+        self.assertTrue(np.allclose(trajectories[ids[0, 1]].drift, [0.2, 0.]))
+
+    def test_trajectory_closed_after_gap(self):
+        trajectories = fw.TipTrajectories(link_radius=1., max_gap=1.)
+        first = trajectories.update(0., np.array([[0., 0.]]))
+        trajectories.update(0.5, np.zeros([0, 2]))
+        second = trajectories.update(1., np.array([[0.5, 0.]]))
+        self.assertEqual(first[0], second[0])
+
+        trajectories.update(3., np.zeros([0, 2]))
+        third = trajectories.update(3.5, np.array([[0.5, 0.]]))
+        self.assertNotEqual(first[0], third[0])
+        self.assertEqual(len(trajectories.closed), 1)
+
+    def test_state(self):
+        trajectories = fw.TipTrajectories(link_radius=1., max_gap=1.)
+        for t, positions in [(0., [[0., 0.], [5., 5.]]), (0.5, [[0.3, 0.1]]),
+                             (2., [[0.5, 0.2]]), (2.5, [[0.6, 0.4], [9., 9.]])]:
+            trajectories.update(t, np.array(positions))
+
+        restored = fw.TipTrajectories(link_radius=1., max_gap=1.)
+        restored.set_state(trajectories.get_state())
+
+        self.assertEqual(sorted(restored.active), sorted(trajectories.active))
+        self.assertEqual(sorted(restored.closed), sorted(trajectories.closed))
+        summary, restored_summary = trajectories.summary(), restored.summary()
+        for key in summary:
+            self.assertTrue(np.array_equal(summary[key], restored_summary[key]))
+
+        # the restored trajectories continue with the same ids
+        self.assertTrue(np.array_equal(trajectories.update(3., np.array([[0.7, 0.5], [1., 8.]])),
+                                       restored.update(3., np.array([[0.7, 0.5], [1., 8.]]))))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+
+import numpy as np
+
+import finitewave as fw
+
+
+class TestTissueWeights(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def random_fibers(self, shape):
+        fibers = self.rng.normal(size=(*shape, len(shape)))
+        return fibers / np.linalg.norm(fibers, axis=-1, keepdims=True)
+
+    def assert_update_matches(self, tissue, change):
+        dr, dt = 0.25, 0.01
+        tissue.compute_weights(dr, dt)
+        weights = tissue.weights.copy()
+
+        region = change(tissue)
+        tissue.mark_dirty(region)
+        tissue.update_weights(dr, dt)
+        updated = tissue.weights.copy()
+
+        tissue.compute_weights(dr, dt)
+        self.assertFalse(np.allclose(updated, weights))
+        self.assertTrue(np.allclose(updated, tissue.weights))
+
+    def test_isotropic_2d(self):
+        tissue = fw.CardiacTissue2D([40, 40])
+        tissue.conductivity = np.ones([40, 40])
+
+        def change(tissue):
+            tissue.conductivity[10:15, 20:30] = 0.3
+            return np.s_[10:15, 20:30]
+
+        self.assert_update_matches(tissue, change)
+
+    def test_asymmetric_2d(self):
+        tissue = fw.CardiacTissue2D([40, 40])
+        tissue.stencil = fw.AsymmetricStencil2D()
+        tissue.D_ac = 0.3
+        tissue.fibers = self.random_fibers([40, 40])
+
+        def change(tissue):
+            tissue.mesh[1:8, 5:9] = 0
+            return np.s_[1:8, 5:9]
+
+        self.assert_update_matches(tissue, change)
+
+    def test_asymmetric_3d(self):
+        tissue = fw.CardiacTissue3D([20, 20, 20])
+        tissue.stencil = fw.AsymmetricStencil3D()
+        tissue.D_ac = 0.3
+        tissue.fibers = self.random_fibers([20, 20, 20])
+
+        def change(tissue):
+            tissue.fibers[5:7, 8:12, 10] = [1, 0, 0]
+            return np.s_[5:7, 8:12, 10]
+
+        self.assert_update_matches(tissue, change)
+
+    def test_fibrosis_pattern(self):
+        tissue = fw.CardiacTissue2D([40, 40])
+
+        def change(tissue):
+            tissue.add_pattern(fw.ScarRect2DPattern(10, 20, 5, 15))
+
+        self.assert_update_matches(tissue, change)
+
+    def test_ablation_command(self):
+        class AblateCommand(fw.Command):
+            def execute(self, model):
+                model.cardiac_tissue.mesh[20:22] = 0
+                model.cardiac_tissue.mark_dirty(np.s_[20:22])
+
+        n = 50
+        model = fw.AlievPanfilov2D()
+        model.dt = 0.01
+        model.dr = 0.25
+        model.t_max = 10
+        model.prog_bar = False
+        model.cardiac_tissue = fw.CardiacTissue2D([n, n])
+        model.stim_sequence = fw.StimSequence()
+        model.stim_sequence.add_stim(fw.StimVoltageCoord2D(0, 1, 0, 5, 0, n))
+        model.command_sequence = fw.CommandSequence()
+        model.command_sequence.add_command(AblateCommand(1))
+        model.run()
+
+        self.assertTrue(np.all(model.u[25:] < 0.1))
+
+        weights = model.cardiac_tissue.weights.copy()
+        model.cardiac_tissue.compute_weights(model.dr, model.dt)
+        self.assertTrue(np.allclose(weights, model.cardiac_tissue.weights))
+
+
+if __name__ == "__main__":
+    unittest.main()
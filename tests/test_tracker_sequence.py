@@ -0,0 +1,51 @@
+import unittest
+
+import finitewave as fw
+
+
+class StepTracker(fw.Tracker):
+    def __init__(self):
+        fw.Tracker.__init__(self)
+        self.steps = []
+
+    def initialize(self, model):
+        self.model = model
+        self.steps = []
+
+    def track(self):
+        self.steps.append(self.model.step)
+
+    def write(self):
+        pass
+
+
+class StepModel:
+    def __init__(self):
+        self.step = 0
+
+
+class TestTrackerSequence(unittest.TestCase):
+    def test_schedule(self):
+        every_step = StepTracker()
+
+        interval = StepTracker()
+        interval.start_step = 3
+        interval.stop_step = 20
+        interval.interval = 5
+
+        tracker_sequence = fw.TrackerSequence()
+        tracker_sequence.add_tracker(every_step)
+        tracker_sequence.add_tracker(interval)
+
+        model = StepModel()
+        tracker_sequence.initialize(model)
+        for step in range(30):
+            model.step = step
+            tracker_sequence.tracker_next()
+
+        self.assertEqual(every_step.steps, list(range(30)))
+        self.assertEqual(interval.steps, [3, 8, 13, 18])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+import tempfile
+from pathlib import Path
+import numpy as np
+import vtk
+from vtk.util.numpy_support import vtk_to_numpy
+
+import finitewave as fw
+
+
+class TestVTKMeshBuilder(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name)
+
+        rng = np.random.default_rng(0)
+        self.mesh = (rng.random([12, 10, 8]) < 0.6).astype(np.uint8)
+        self.mesh[0] = 2
+        self.fibers = rng.random([12, 10, 8, 3])
+        self.nodes = np.argwhere(self.mesh == 1)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_vertex_grid(self):
+        grid = fw.VTKMeshBuilder.create_vtk_mesh_3D(self.mesh, self.fibers)
+        self.assertEqual(grid.GetNumberOfCells(), len(self.nodes))
+        self.assertTrue(np.array_equal(vtk_to_numpy(grid.GetPoints().GetData()), self.nodes))
+        self.assertTrue(np.array_equal(vtk_to_numpy(grid.GetPointData().GetVectors()),
+                                       self.fibers[self.mesh == 1]))
+
+    def test_hexahedron_grid(self):
+        grid = fw.VTKMeshBuilder.create_vtk_mesh_3D(self.mesh, self.fibers, "hexahedron")
+        self.assertEqual(grid.GetNumberOfCells(), len(self.nodes))
+        self.assertTrue(np.array_equal(vtk_to_numpy(grid.GetCellData().GetVectors()),
+                                       self.fibers[self.mesh == 1]))
+
+        centers = vtk.vtkCellCenters()
+        centers.SetInputData(grid)
+        centers.Update()
+        self.assertTrue(np.allclose(vtk_to_numpy(centers.GetOutput().GetPoints().GetData()),
+                                    self.nodes))
+
+        quality = vtk.vtkMeshQuality()
+        quality.SetInputData(grid)
+        quality.SetHexQualityMeasureToVolume()
+        quality.Update()
+        volume = vtk_to_numpy(quality.GetOutput().GetCellData().GetArray("Quality"))
+        self.assertTrue(np.allclose(volume, 1))
+
+    def test_write_and_read(self):
+        grid = fw.VTKMeshBuilder.create_vtk_mesh_3D(self.mesh, self.fibers, "hexahedron")
+        for name, binary in [("mesh.vtk", False), ("mesh.vtk", True),
+                             ("mesh.vtu", False), ("mesh.vtu", True)]:
+            file_name = self.path / name
+            fw.VTKMeshBuilder.write_vtk_unstructured_grid(file_name, grid, binary)
+            if name.endswith(".vtu"):
+                reader = vtk.vtkXMLUnstructuredGridReader()
+            else:
+                reader = vtk.vtkUnstructuredGridReader()
+            reader.SetFileName(str(file_name))
+            reader.Update()
+            output = reader.GetOutput()
+            self.assertEqual(output.GetNumberOfCells(), grid.GetNumberOfCells())
+            self.assertEqual(output.GetNumberOfPoints(), grid.GetNumberOfPoints())
+
+    def test_vtkhdf_frames(self):
+        n = 10
+        tissue = fw.CardiacTissue3D([n, n, n])
+        tissue.mesh = np.ones([n, n, n], dtype="uint8")
+        tissue.mesh[4:6, 4:6, :] = 0
+        tissue.add_boundaries()
+
+        aliev_panfilov = fw.AlievPanfilov3D()
+        aliev_panfilov.dt = 0.01
+        aliev_panfilov.dr = 0.25
+        aliev_panfilov.t_max = 2
+        aliev_panfilov.prog_bar = False
+
+        stim_sequence = fw.StimSequence()
+        stim_sequence.add_stim(fw.StimVoltageCoord3D(0, 1, 0, 2, 0, n, 0, n))
+
+        tracker_sequence = fw.TrackerSequence()
+        for file_type in [".vtu", ".vtkhdf"]:
+            tracker = fw.VTKFrame3DTracker()
+            tracker.path = self.path
+            tracker.file_name = "frames"
+            tracker.target_array = "u"
+            tracker.file_type = file_type
+            tracker.step = 0.5
+            tracker_sequence.add_tracker(tracker)
+
+        aliev_panfilov.cardiac_tissue = tissue
+        aliev_panfilov.stim_sequence = stim_sequence
+        aliev_panfilov.tracker_sequence = tracker_sequence
+        aliev_panfilov.run()
+        # the frames of a continued run are appended
+        aliev_panfilov.t_max = 3
+        aliev_panfilov.run(initialize=False)
+
+        reader = vtk.vtkHDFReader()
+        reader.SetFileName(str(self.path / "frames.vtkhdf"))
+        reader.UpdateInformation()
+        self.assertEqual(reader.GetNumberOfSteps(), 6)
+        for i in range(6):
+            frame_reader = vtk.vtkXMLUnstructuredGridReader()
+            frame_reader.SetFileName(str(self.path / "frames" / f"frame{i}.vtu"))
+            frame_reader.Update()
+            frame = frame_reader.GetOutput()
+
+            reader.SetStep(i)
+            reader.Update()
+            output = reader.GetOutput()
+            self.assertEqual(output.GetNumberOfCells(), frame.GetNumberOfCells())
+            self.assertTrue(np.array_equal(vtk_to_numpy(output.GetPoints().GetData()),
+                                           vtk_to_numpy(frame.GetPoints().GetData())))
+            self.assertTrue(np.array_equal(vtk_to_numpy(output.GetCellData().GetArray("u")),
+                                           vtk_to_numpy(frame.GetCellData().GetArray("u"))))
+
+
+if __name__ == "__main__":
+    unittest.main()